@@ -8,11 +8,41 @@ __version__ = "1.0.0"
 __author__ = "Software Development Lessons"
 __email__ = "dev@example.com"
 
-from software_development_lessons.core.learning_tracker import LearningTracker
-from software_development_lessons.core.resource_manager import ResourceManager
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from software_development_lessons.core.learning_tracker import LearningTracker
+    from software_development_lessons.core.metrics import metrics_snapshot
+    from software_development_lessons.core.resource_manager import ResourceManager
 
 __all__ = [
     "LearningTracker",
     "ResourceManager",
     "__version__",
+    "metrics_snapshot",
 ]
+
+# Public classes are imported on first access (PEP 562), so importing the
+# package, e.g. for ``__version__``, does not load the core modules.
+_LAZY_EXPORTS = {
+    "LearningTracker": "software_development_lessons.core.learning_tracker",
+    "metrics_snapshot": "software_development_lessons.core.metrics",
+    "ResourceManager": "software_development_lessons.core.resource_manager",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a public name the first time it is accessed."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including the not yet imported classes."""
+    return sorted({*globals(), *_LAZY_EXPORTS})
@@ -1,29 +1,155 @@
-"""Command-line interface for Software Development Lessons."""
+"""Command-line interface for Software Development Lessons.
+
+``sdl`` is run from shell loops and cron jobs, so startup time matters. Only
+``typer`` is imported at module load; rich and the core modules (sqlite3,
+requests, ...) are imported inside the commands that use them.
+"""
+
+from contextlib import closing, nullcontext
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from software_development_lessons import __version__
-from software_development_lessons.core import LearningTracker, ResourceManager
-from software_development_lessons.core.resource_manager import (
-    DifficultyLevel,
-    Resource,
-    ResourceCategory,
-)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from rich.console import Console
+
+    from software_development_lessons.core import ResourceManager
+    from software_development_lessons.core.resource_manager import Resource
+    from software_development_lessons.core.storage import SQLiteStorage
 
 app = typer.Typer(
     name="sdl",
     help="Software Development Lessons - Your ultimate learning companion!",
     add_completion=False,
 )
-console = Console()
+
+DEFAULT_DB_PATH = Path.home() / ".sdl" / "sdl.db"
+
+# Output formats of list-resources; all but "table" stream rows as they are read.
+LIST_FORMATS = ("table", "plain", "tsv", "ndjson")
+# Above this many rows list-resources streams plain text instead of a table.
+TABLE_MAX_ROWS = 1000
+
+# Completion percentage and ``(days ago, minutes)`` sessions of the demo data.
+_SAMPLE_PROGRESS = {
+    "https://pytorch.org/tutorials/": (75, [(6, 90), (4, 60), (1, 45)]),
+    "https://nextjs.org/learn": (100, [(5, 120), (3, 60)]),
+    "https://kubernetes.io/docs/tutorials/": (30, [(2, 30)]),
+}
+
+_DATE_FORMATS = ["%Y-%m-%d", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M"]
+# strftime patterns naming a bucket of each granularity in ``stats --by``.
+_BUCKET_LABELS = {"hour": "%Y-%m-%d %H:00", "day": "%Y-%m-%d %a", "week": "%G-W%V"}
+
+
+@dataclass
+class _Settings:
+    """Options shared by every command, set by the app callback."""
+
+    db_path: Path = DEFAULT_DB_PATH
+
+
+settings = _Settings()
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    db: Path = typer.Option(
+        DEFAULT_DB_PATH, "--db", envvar="SDL_DB", help="SQLite database holding your catalog"
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        envvar="SDL_PROFILE",
+        help="Print per-call latency percentiles to stderr when the command finishes",
+    ),
+) -> None:
+    """Software Development Lessons - Your ultimate learning companion!"""
+    settings.db_path = db
+    if profile:
+        _start_profiling(ctx)
+
+
+@cache
+def _console() -> "Console":
+    """Rich console for output, created on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _start_profiling(ctx: typer.Context) -> None:
+    """Time core calls, rendering and the whole command, and report on exit."""
+    from software_development_lessons.core import metrics
+
+    metrics.enable()
+    console = _console()
+    console.print = metrics.timed("cli.render", console.print)  # type: ignore[method-assign]
+    # Resources and callbacks unwind in reverse, so the command timer stops
+    # before the report is printed.
+    ctx.call_on_close(_print_profile)
+    ctx.with_resource(metrics.timer(f"cli.{ctx.invoked_subcommand}"))
+
+
+def _print_profile() -> None:
+    """Print the latency histogram of every timed call to stderr."""
+    from rich.box import SIMPLE
+    from rich.console import Console
+    from rich.table import Table
+
+    from software_development_lessons.core.metrics import metrics_snapshot
+
+    snapshot = metrics_snapshot()
+    table = Table(
+        title="Profile", show_header=True, header_style="bold cyan", box=SIMPLE, pad_edge=False
+    )
+    table.add_column(
+        "Call", style="cyan", no_wrap=True, min_width=max(map(len, snapshot), default=4)
+    )
+    for column in ("Calls", "p50", "p95", "p99", "Max", "Total"):
+        table.add_column(column, justify="right", no_wrap=True)
+    for name, stats in sorted(snapshot.items(), key=lambda item: -item[1]["total_s"]):
+        table.add_row(
+            name,
+            f"{stats['count']:,}",
+            *(
+                _format_seconds(stats[key])
+                for key in ("p50_s", "p95_s", "p99_s", "max_s", "total_s")
+            ),
+        )
+    Console(stderr=True).print(table)
+
+
+def _format_seconds(seconds: float) -> str:
+    """Format a duration with a unit suited to its size."""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.2f}s"
+
+
+def _open_storage() -> "SQLiteStorage":
+    """Open the catalog database, creating an empty one if needed."""
+    from software_development_lessons.core.storage import SQLiteStorage
+
+    return SQLiteStorage(settings.db_path)
 
 
 @app.command()
 def version() -> None:
     """Show version information."""
-    console.print(f"[bold cyan]Software Development Lessons[/bold cyan] v{__version__}")
+    name = typer.style("Software Development Lessons", fg=typer.colors.CYAN, bold=True)
+    typer.echo(f"{name} v{__version__}")
 
 
 @app.command()
@@ -35,6 +161,13 @@ def add_resource(
     description: str = typer.Option("", "--description", "-desc", help="Resource description"),
 ) -> None:
     """Add a new learning resource."""
+    from software_development_lessons.core import ResourceManager
+    from software_development_lessons.core.resource_manager import (
+        DifficultyLevel,
+        Resource,
+        ResourceCategory,
+    )
+
     try:
         resource_category = ResourceCategory[category.upper()]
         difficulty_level = DifficultyLevel[difficulty.upper()]
@@ -47,34 +180,89 @@ def add_resource(
             description=description,
         )
 
-        manager = ResourceManager()
-        manager.add_resource(resource)
+        with closing(_open_storage()) as storage:
+            ResourceManager(storage).add_resource(resource)
 
-        console.print(f"[green]✓[/green] Successfully added resource: [bold]{title}[/bold]")
+        _console().print(f"[green]✓[/green] Successfully added resource: [bold]{title}[/bold]")
     except (KeyError, ValueError) as e:
-        console.print(f"[red]✗[/red] Error: {e}")
+        _console().print(f"[red]✗[/red] Error: {e}")
         raise typer.Exit(code=1) from e
 
 
 @app.command()
 def list_resources(
     category: str | None = typer.Option(None, "--category", "-c", help="Filter by category"),
+    limit: int | None = typer.Option(None, "--limit", "-n", help="Maximum number of resources"),
+    offset: int = typer.Option(0, "--offset", help="Number of resources to skip"),
+    cursor: str | None = typer.Option(
+        None, "--cursor", help="Continue after the page that printed this cursor"
+    ),
+    output_format: str | None = typer.Option(
+        None,
+        "--format",
+        "-f",
+        help=f"{', '.join(LIST_FORMATS)}; a table unless more than {TABLE_MAX_ROWS} rows match",
+    ),
 ) -> None:
     """List all learning resources."""
-    manager = ResourceManager()
+    from itertools import chain, islice
 
-    # Add sample resources for demonstration
-    _add_sample_resources(manager)
+    from software_development_lessons.core.resource_manager import ResourceCategory
 
-    resources = (
-        manager.get_by_category(ResourceCategory[category.upper()])
-        if category
-        else manager.get_all()
-    )
+    if output_format is not None and output_format not in LIST_FORMATS:
+        _console().print(
+            f"[red]✗[/red] Error: Unknown format {output_format!r}; "
+            f"expected one of {', '.join(LIST_FORMATS)}"
+        )
+        raise typer.Exit(code=1)
+
+    try:
+        after = _decode_cursor(cursor) if cursor else 0
+        with closing(_open_storage()) as storage:
+            rows = storage.page_resources(
+                ResourceCategory[category.upper()] if category else None,
+                after=after,
+                offset=offset,
+                limit=limit,
+            )
+            if output_format is None:
+                # Only small results are worth holding back for a table.
+                head = list(islice(rows, TABLE_MAX_ROWS + 1))
+                output_format = "table" if len(head) <= TABLE_MAX_ROWS else "plain"
+                rows = chain(head, rows)
+            if output_format == "table":
+                shown, last_id = _print_table(rows)
+            else:
+                shown, last_id = _stream_rows(rows, output_format)
+    except ValueError as e:
+        _console().print(f"[red]✗[/red] Error: {e}")
+        raise typer.Exit(code=1) from e
+
+    if limit is not None and shown == limit and shown:
+        typer.echo(f"Next page: --cursor {_encode_cursor(last_id)}", err=True)
+
+
+def _encode_cursor(row_id: int) -> str:
+    """Encode the id of the last listed row as a --cursor value."""
+    return f"r{row_id}"
 
-    if not resources:
-        console.print("[yellow]No resources found.[/yellow]")
-        return
+
+def _decode_cursor(cursor: str) -> int:
+    """Decode a --cursor value into the row id to continue after."""
+    row_id = cursor.removeprefix("r")
+    if not row_id.isdigit() or row_id == cursor:
+        msg = f"Invalid cursor {cursor!r}"
+        raise ValueError(msg)
+    return int(row_id)
+
+
+def _print_table(rows: "Iterable[tuple[int, Resource]]") -> tuple[int, int]:
+    """Render resources as a rich table.
+
+    Returns:
+        The number of resources shown and the row id of the last one.
+    """
+    from rich.table import Table
 
     table = Table(title="Learning Resources", show_header=True, header_style="bold magenta")
     table.add_column("Title", style="cyan")
@@ -82,7 +270,9 @@ def list_resources(
     table.add_column("Difficulty", style="yellow")
     table.add_column("URL", style="blue")
 
-    for resource in resources:
+    last_id = 0
+    for row_id, resource in rows:
+        last_id = row_id
         table.add_row(
             resource.title,
             resource.category.value,
@@ -90,18 +280,73 @@ def list_resources(
             resource.url,
         )
 
-    console.print(table)
+    if not table.row_count:
+        _console().print("[yellow]No resources found.[/yellow]")
+    else:
+        _console().print(table)
+    return table.row_count, last_id
+
+
+def _stream_rows(rows: "Iterable[tuple[int, Resource]]", output_format: str) -> tuple[int, int]:
+    """Write resources to stdout one line at a time as they are read.
+
+    Returns:
+        The number of resources written and the row id of the last one.
+    """
+    import json
+    import os
+    import sys
+
+    shown = last_id = 0
+    write = sys.stdout.write
+    try:
+        if output_format == "tsv":
+            write("title\tcategory\tdifficulty\turl\n")
+        for row_id, resource in rows:
+            last_id = row_id
+            if output_format == "ndjson":
+                write(json.dumps(resource.to_dict(), ensure_ascii=False, separators=(",", ":")))
+            elif output_format == "tsv":
+                title = " ".join(resource.title.split())
+                write(f"{title}\t{resource.category.value}\t{resource.difficulty.value}")
+                write(f"\t{resource.url}")
+            else:
+                write(f"{resource.title} [{resource.category.value}, {resource.difficulty.value}]")
+                write(f" {resource.url}")
+            write("\n")
+            shown += 1
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader (e.g. ``head``) has gone; stop quietly and keep the
+        # interpreter from failing again when it flushes stdout at exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    return shown, last_id
 
 
 @app.command()
-def stats() -> None:
+def stats(
+    by: str | None = typer.Option(
+        None, "--by", help="Show hours per hour, day or week instead of totals"
+    ),
+    since: datetime | None = typer.Option(
+        None, "--since", formats=_DATE_FORMATS, help="With --by, start of the range"
+    ),
+    until: datetime | None = typer.Option(
+        None, "--until", formats=_DATE_FORMATS, help="With --by, end of the range (exclusive)"
+    ),
+    category: str | None = typer.Option(
+        None, "--category", "-c", help="With --by, only count resources of this category"
+    ),
+) -> None:
     """Show learning statistics."""
-    tracker = LearningTracker()
+    from rich.table import Table
 
-    # Add sample progress
-    _add_sample_progress(tracker)
+    if by is not None:
+        _time_series(by, since, until, category)
+        return
 
-    statistics = tracker.get_statistics()
+    with closing(_open_storage()) as storage:
+        statistics = storage.progress_statistics()
 
     table = Table(title="Learning Statistics", show_header=True, header_style="bold cyan")
     table.add_column("Metric", style="cyan")
@@ -113,11 +358,288 @@ def stats() -> None:
     table.add_row("Average Completion", f"{statistics['average_completion']:.1f}%")
     table.add_row("Total Hours", f"{statistics['total_hours_spent']:.2f}h")
 
-    console.print(table)
+    _console().print(table)
+
+
+def _time_series(
+    by: str, since: datetime | None, until: datetime | None, category: str | None
+) -> None:
+    """Print the hours spent learning per bucket of width ``by``."""
+    from rich.table import Table
+
+    from software_development_lessons.core.resource_manager import ResourceCategory
+    from software_development_lessons.core.rollups import Granularity
+
+    try:
+        granularity = Granularity(by)
+        resource_category = ResourceCategory[category.upper()] if category else None
+        with closing(_open_storage()) as storage:
+            # Bucket totals per category are kept up to date in the database.
+            series = storage.time_series(granularity, since, until, resource_category)
+    except (KeyError, ValueError) as e:
+        _console().print(f"[red]✗[/red] Error: {e}")
+        raise typer.Exit(code=1) from e
+
+    if not series:
+        _console().print("[yellow]No learning time recorded.[/yellow]")
+        return
+
+    label = _BUCKET_LABELS[granularity.value]
+    table = Table(title=f"Hours per {by}", show_header=True, header_style="bold cyan")
+    table.add_column(by.capitalize(), style="cyan")
+    table.add_column("Hours", style="green", justify="right")
+    for bucket, spent in series:
+        table.add_row(bucket.strftime(label), f"{spent.total_seconds() / 3600:.2f}")
+    _console().print(table)
+
+
+@app.command("export")
+def export_resources(
+    path: Path = typer.Argument(..., help="Output file (.jsonl, or .jsonl.gz to compress)"),
+) -> None:
+    """Export learning resources as JSON Lines."""
+    from software_development_lessons.core.jsonl import write_jsonl
+
+    with closing(_open_storage()) as storage:
+        count = write_jsonl(path, (r.to_dict() for r in storage.iter_resources()))
+    _console().print(f"[green]✓[/green] Exported {count} resources to [bold]{path}[/bold]")
+
+
+@app.command("import")
+def import_resources(
+    path: Path = typer.Argument(..., help="Input file (.jsonl, or .jsonl.gz if compressed)"),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        help="Parse in this many processes (0 for none), skipping and reporting bad lines",
+    ),
+) -> None:
+    """Import learning resources from JSON Lines."""
+    from software_development_lessons.core import ResourceManager
+
+    if workers is not None:
+        _ingest(path, workers)
+        return
+    try:
+        with closing(_open_storage()) as storage, storage.transaction():
+            count = ResourceManager(storage).import_jsonl(path)
+    except (OSError, ValueError) as e:
+        _console().print(f"[red]✗[/red] Error: {e}")
+        raise typer.Exit(code=1) from e
+
+    _console().print(f"[green]✓[/green] Imported {count} resources from [bold]{path}[/bold]")
+
+
+def _ingest(path: Path, workers: int) -> None:
+    """Import a dump in parallel, printing each rejected line to stderr."""
+    from software_development_lessons.core import ResourceManager
+
+    try:
+        with closing(_open_storage()) as storage:
+            result = ResourceManager(storage).ingest_jsonl(path, workers=workers)
+    except (OSError, ValueError) as e:
+        _console().print(f"[red]✗[/red] Error: {e}")
+        raise typer.Exit(code=1) from e
+
+    for error in result.errors:
+        typer.echo(f"{path}:{error.line_number}: error: {error.message}", err=True)
+    _console().print(f"[green]✓[/green] Imported {result.added} resources from [bold]{path}[/bold]")
+    if result.errors:
+        _console().print(f"[red]✗[/red] Skipped {len(result.errors)} invalid or duplicate lines")
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def search(
+    text: str = typer.Argument(..., help="Words to search for; each may be a prefix"),
+    limit: int = typer.Option(10, "--limit", "-n", help="Maximum number of results"),
+) -> None:
+    """Search resources by title, description and tags."""
+    from rich.table import Table
+
+    try:
+        with closing(_open_storage()) as storage:
+            results = storage.search_resources(text, limit)
+    except ValueError as e:
+        _console().print(f"[red]✗[/red] Error: {e}")
+        raise typer.Exit(code=1) from e
+
+    if not results:
+        _console().print("[yellow]No resources found.[/yellow]")
+        return
+
+    table = Table(title=f"Results for {text!r}", show_header=True, header_style="bold magenta")
+    table.add_column("Title", style="cyan")
+    table.add_column("Category", style="green")
+    table.add_column("URL", style="blue")
+    for resource in results:
+        table.add_row(resource.title, resource.category.value, resource.url)
+    _console().print(table)
+
+
+@app.command()
+def recommend(
+    limit: int = typer.Option(5, "--limit", "-n", help="Maximum number of suggestions"),
+) -> None:
+    """Suggest what to learn next from completed resources."""
+    from rich.table import Table
+
+    try:
+        with closing(_open_storage()) as storage:
+            suggestions = storage.recommend_next(limit)
+    except ValueError as e:
+        _console().print(f"[red]✗[/red] Error: {e}")
+        raise typer.Exit(code=1) from e
+
+    if not suggestions:
+        _console().print(
+            "[yellow]No suggestions yet; complete a resource with tags first.[/yellow]"
+        )
+        return
+
+    table = Table(title="Learn next", show_header=True, header_style="bold magenta")
+    table.add_column("Title", style="cyan")
+    table.add_column("Category", style="green")
+    table.add_column("Difficulty", style="yellow")
+    table.add_column("Because of", style="magenta")
+    table.add_column("URL", style="blue")
+    for suggestion in suggestions:
+        resource = suggestion.resource
+        table.add_row(
+            resource.title,
+            resource.category.value,
+            resource.difficulty.value,
+            ", ".join(suggestion.tags),
+            resource.url,
+        )
+    _console().print(table)
+
+
+@app.command()
+def tags(
+    prefix: str = typer.Argument("", help="Start of the tag; case and separators are ignored"),
+    limit: int = typer.Option(10, "--limit", "-n", help="Maximum number of suggestions"),
+) -> None:
+    """Suggest tags completing a prefix, most used first."""
+    try:
+        with closing(_open_storage()) as storage:
+            suggestions = storage.suggest_tags(prefix, limit)
+    except ValueError as e:
+        _console().print(f"[red]✗[/red] Error: {e}")
+        raise typer.Exit(code=1) from e
+
+    if not suggestions:
+        _console().print("[yellow]No tags found.[/yellow]")
+        return
+    for tag in suggestions:
+        _console().print(tag)
+
+
+@app.command()
+def batch(
+    path: Path = typer.Argument(Path("-"), help="NDJSON file of operations, or - for stdin"),
+    errors_only: bool = typer.Option(
+        False, "--errors-only", "-e", help="Only print records that failed"
+    ),
+    commit_every: int = typer.Option(1000, "--commit-every", help="Records per transaction"),
+) -> None:
+    """Apply many add/remove/learning records from NDJSON in one process."""
+    import sys
+
+    from software_development_lessons.core import LearningTracker, ResourceManager
+    from software_development_lessons.core.batch import BatchRunner
+
+    try:
+        source = nullcontext(sys.stdin) if str(path) == "-" else path.open(encoding="utf-8")
+        with source as lines, closing(_open_storage()) as storage:
+            runner = BatchRunner(
+                ResourceManager(storage),
+                LearningTracker(storage),
+                storage=storage,
+                commit_every=commit_every,
+            )
+            for result in runner.run(lines):
+                if not result.ok:
+                    typer.echo(f"line {result.line_number}: error: {result.message}", err=True)
+                elif not errors_only:
+                    typer.echo(f"line {result.line_number}: {result.message}")
+    except (OSError, ValueError) as e:
+        _console().print(f"[red]✗[/red] Error: {e}")
+        raise typer.Exit(code=1) from e
+
+    summary = runner.summary
+    _console().print(
+        f"Processed {summary.processed} records in {summary.elapsed:.2f}s "
+        f"({summary.rate:,.0f} records/s): {summary.succeeded} ok, {summary.failed} failed"
+    )
+    if summary.failed:
+        raise typer.Exit(code=1)
+
 
+@app.command("check-links")
+def check_links(
+    workers: int = typer.Option(16, "--workers", "-w", help="URLs checked concurrently"),
+    rate: float = typer.Option(5.0, "--rate", help="Maximum requests per second per host"),
+    timeout: float = typer.Option(10.0, "--timeout", help="Request timeout in seconds"),
+) -> None:
+    """Check every catalog URL and report broken links."""
+    from rich.table import Table
+
+    from software_development_lessons.core.link_checker import LinkChecker
+
+    with closing(_open_storage()) as storage:
+        urls = [resource.url for resource in storage.iter_resources()]
+
+    cache_path = settings.db_path.with_name("link-cache.json")
+    checker = LinkChecker(
+        max_workers=workers, per_host_rate=rate, timeout=timeout, cache_path=cache_path
+    )
+    with closing(checker):
+        broken = sorted(
+            (result for result in checker.check(urls) if not result.ok), key=lambda r: r.url
+        )
+
+    if broken:
+        table = Table(title="Broken Links", show_header=True, header_style="bold red")
+        table.add_column("URL", style="blue")
+        table.add_column("Status", style="red", no_wrap=True, overflow="ellipsis")
+        for result in broken:
+            table.add_row(result.url, str(result.status_code or result.error))
+        _console().print(table)
+    _console().print(
+        f"Checked {len(urls)} links: {len(urls) - len(broken)} ok, {len(broken)} broken"
+    )
+    if broken:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def demo() -> None:
+    """Add sample resources and a week of completed learning sessions."""
+    from software_development_lessons.core import ResourceManager
+
+    with closing(_open_storage()) as storage, storage.transaction():
+        added = _add_sample_resources(ResourceManager(storage))
+        _add_sample_progress(storage, added)
+    if added:
+        _console().print(f"[green]✓[/green] Added {len(added)} sample resources with progress")
+    else:
+        _console().print("[yellow]The sample resources are already in the catalog.[/yellow]")
+
+
+def _add_sample_resources(manager: "ResourceManager") -> list[str]:
+    """Add sample resources for demonstration.
+
+    Returns:
+        The URLs of the sample resources that were not in the catalog yet.
+    """
+    from software_development_lessons.core.resource_manager import (
+        DifficultyLevel,
+        Resource,
+        ResourceCategory,
+    )
 
-def _add_sample_resources(manager: ResourceManager) -> None:
-    """Add sample resources for demonstration."""
     sample_resources = [
         Resource(
             title="PyTorch Tutorials",
@@ -145,23 +667,43 @@ def _add_sample_resources(manager: ResourceManager) -> None:
         ),
     ]
 
+    added = []
     for resource in sample_resources:
         try:
             manager.add_resource(resource)
         except ValueError:
-            pass  # Resource already exists
+            continue  # Resource already exists
+        added.append(resource.url)
+    return added
 
 
-def _add_sample_progress(tracker: LearningTracker) -> None:
-    """Add sample progress for demonstration."""
-    tracker.start_learning("https://pytorch.org/tutorials/")
-    tracker.update_progress("https://pytorch.org/tutorials/", 75)
+def _add_sample_progress(storage: "SQLiteStorage", urls: "Iterable[str]") -> None:
+    """Add sample progress, made of completed sessions in the past week, for ``urls``."""
+    from datetime import timedelta
 
-    tracker.start_learning("https://nextjs.org/learn")
-    tracker.update_progress("https://nextjs.org/learn", 100)
+    from software_development_lessons.core.learning_tracker import (
+        LearningProgress,
+        LearningSession,
+        ProgressStatus,
+    )
 
-    tracker.start_learning("https://kubernetes.io/docs/tutorials/")
-    tracker.update_progress("https://kubernetes.io/docs/tutorials/", 30)
+    evening = datetime.now().replace(hour=19, minute=0, second=0, microsecond=0)
+    for url in urls:
+        percentage, sessions = _SAMPLE_PROGRESS[url]
+        spans = [
+            (evening - timedelta(days=days_ago), timedelta(minutes=minutes))
+            for days_ago, minutes in sessions
+        ]
+        progress = LearningProgress(
+            resource_url=url,
+            status=ProgressStatus.COMPLETED if percentage == 100 else ProgressStatus.IN_PROGRESS,
+            completion_percentage=percentage,
+            started_at=spans[0][0],
+            completed_at=spans[-1][0] + spans[-1][1] if percentage == 100 else None,
+        )
+        storage.save_progress(progress)
+        for seq, (start, length) in enumerate(spans):
+            storage.save_session(seq, LearningSession(url, start, start + length))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,233 @@
+"""Apply a stream of catalog and progress operations in a single process."""
+
+import json
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from software_development_lessons.core.resource_manager import Resource
+
+if TYPE_CHECKING:
+    from software_development_lessons.core.learning_tracker import LearningTracker
+    from software_development_lessons.core.resource_manager import ResourceManager
+    from software_development_lessons.core.storage import StorageBackend
+
+# Records without an "op" field are resources, so the output of
+# ``sdl export`` can be fed back in unchanged.
+DEFAULT_OP = "add-resource"
+
+_T = TypeVar("_T")
+
+
+@dataclass(slots=True)
+class BatchResult:
+    """Outcome of applying one record.
+
+    Attributes:
+        line_number: 1-based line the record was read from.
+        op: The operation the record asked for, or "" if it could not be read.
+        ok: Whether the operation was applied.
+        message: What was done, or why it failed.
+    """
+
+    line_number: int
+    op: str
+    ok: bool
+    message: str
+
+
+@dataclass(slots=True)
+class BatchSummary:
+    """Totals over every record a batch has processed.
+
+    Attributes:
+        succeeded: Number of records applied.
+        failed: Number of records rejected.
+        elapsed: Seconds spent processing, including storage commits.
+    """
+
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def processed(self) -> int:
+        """Number of records processed."""
+        return self.succeeded + self.failed
+
+    @property
+    def rate(self) -> float:
+        """Records processed per second."""
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+
+class BatchRunner:
+    """Applies NDJSON operation records to one long-lived manager and tracker.
+
+    Every non-blank line holds a JSON object whose ``"op"`` field names the
+    operation; the other fields are its arguments:
+
+    - ``add-resource`` (the default when ``"op"`` is missing): the fields of
+      ``Resource.to_dict``.
+    - ``remove-resource``: ``url``.
+    - ``start-learning``: ``url``.
+    - ``update-progress``: ``url`` and ``percentage``.
+
+    A record that cannot be parsed or applied is reported as failed and the
+    batch carries on. With a storage backend, records are committed in
+    transactions of ``commit_every`` records, and each group's results are
+    yielded only once it has been committed.
+
+    Examples:
+        >>> from software_development_lessons.core import LearningTracker, ResourceManager
+        >>> runner = BatchRunner(ResourceManager(), LearningTracker())
+        >>> lines = [
+        ...     '{"title": "Go Tour", "url": "https://go.dev/tour/", '
+        ...     '"category": "web_dev", "difficulty": "beginner"}',
+        ...     '{"op": "start-learning", "url": "https://go.dev/tour/"}',
+        ...     '{"op": "explode"}',
+        ... ]
+        >>> for result in runner.run(lines):
+        ...     print(result.line_number, result.ok, result.message)
+        1 True added https://go.dev/tour/
+        2 True started learning https://go.dev/tour/
+        3 False unknown op 'explode'
+    """
+
+    def __init__(
+        self,
+        manager: "ResourceManager",
+        tracker: "LearningTracker",
+        *,
+        storage: "StorageBackend | None" = None,
+        commit_every: int = 1000,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            manager: The resource manager records are applied to.
+            tracker: The learning tracker records are applied to.
+            storage: Optional backend both write through to; used to group
+                writes into transactions.
+            commit_every: Number of records per storage transaction.
+
+        Raises:
+            ValueError: If commit_every is not positive.
+        """
+        if commit_every <= 0:
+            msg = "commit_every must be positive"
+            raise ValueError(msg)
+        self._manager = manager
+        self._tracker = tracker
+        self._transaction: Callable[[], AbstractContextManager[None]] = (
+            storage.transaction if storage is not None else nullcontext
+        )
+        self._commit_every = commit_every
+        self._ops: dict[str, Callable[[dict[str, Any]], str]] = {
+            "add-resource": self._add_resource,
+            "remove-resource": self._remove_resource,
+            "start-learning": self._start_learning,
+            "update-progress": self._update_progress,
+        }
+        self.summary = BatchSummary()
+
+    def run(self, lines: Iterable[str]) -> Iterator[BatchResult]:
+        """Apply every record read from ``lines``.
+
+        Args:
+            lines: NDJSON text, one record per line; blank lines are skipped.
+
+        Yields:
+            One result per record, in input order.
+        """
+        numbered = enumerate(lines, start=1)
+        while group := list(islice(numbered, self._commit_every)):
+            start = time.perf_counter()
+            with self._transaction():
+                results = [
+                    self.apply_line(line_number, line)
+                    for line_number, line in group
+                    if line.strip()
+                ]
+            self.summary.elapsed += time.perf_counter() - start
+            yield from results
+
+    def apply_line(self, line_number: int, line: str) -> BatchResult:
+        """Parse and apply a single record, capturing any failure.
+
+        Args:
+            line_number: 1-based line number, used in the result.
+            line: The JSON text of the record.
+
+        Returns:
+            The outcome of the record.
+        """
+        op = ""
+        try:
+            op, record = _parse(line)
+            message = self._dispatch(op, record)
+        except (KeyError, TypeError, ValueError) as e:
+            self.summary.failed += 1
+            reason = e.args[0] if isinstance(e, KeyError) and e.args else e
+            return BatchResult(line_number, op, ok=False, message=str(reason))
+        self.summary.succeeded += 1
+        return BatchResult(line_number, op, ok=True, message=message)
+
+    def _dispatch(self, op: str, record: dict[str, Any]) -> str:
+        """Apply a parsed record, returning what was done."""
+        handler = self._ops.get(op)
+        if handler is None:
+            msg = f"unknown op {op!r}"
+            raise ValueError(msg)
+        return handler(record)
+
+    def _add_resource(self, record: dict[str, Any]) -> str:
+        try:
+            resource = Resource.from_dict(record)
+        except KeyError as e:
+            msg = f"missing field {e}"
+            raise ValueError(msg) from e
+        self._manager.add_resource(resource)
+        return f"added {resource.url}"
+
+    def _remove_resource(self, record: dict[str, Any]) -> str:
+        url = _field(record, "url", str)
+        if not self._manager.remove_resource(url):
+            msg = f"Resource {url} not found"
+            raise ValueError(msg)
+        return f"removed {url}"
+
+    def _start_learning(self, record: dict[str, Any]) -> str:
+        url = _field(record, "url", str)
+        self._tracker.start_learning(url)
+        return f"started learning {url}"
+
+    def _update_progress(self, record: dict[str, Any]) -> str:
+        url = _field(record, "url", str)
+        percentage = _field(record, "percentage", int)
+        self._tracker.update_progress(url, percentage)
+        return f"progress of {url} set to {percentage}%"
+
+
+def _parse(line: str) -> tuple[str, dict[str, Any]]:
+    """Decode a record into its op and its remaining fields."""
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        msg = "expected a JSON object"
+        raise TypeError(msg)
+    return str(record.pop("op", DEFAULT_OP)), record
+
+
+def _field(record: dict[str, Any], name: str, kind: type[_T]) -> _T:
+    """Get a required field of a record, checking its type."""
+    value = record.get(name)
+    if value is None:
+        msg = f"missing field {name!r}"
+        raise ValueError(msg)
+    if not isinstance(value, kind):
+        msg = f"field {name!r} must be of type {kind.__name__}"
+        raise TypeError(msg)
+    return value
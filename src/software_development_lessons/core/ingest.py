@@ -0,0 +1,152 @@
+"""Parallel parsing and validation of large JSON Lines resource dumps.
+
+Parsing JSON and validating resources dominates the cost of loading a dump,
+and every line can be checked on its own, so the lines are cut into chunks
+that worker processes parse and validate independently. Workers send back
+compact tuples of plain field values rather than ``Resource`` objects, which
+keeps pickling cheap, and results are merged in input order so line numbers
+and duplicate detection behave exactly as in a sequential load.
+
+Only the merge runs in the parent: it drops URLs already seen, rebuilds the
+resources without validating them again and hands each chunk to
+``ResourceManager`` as one batch.
+"""
+
+import json
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any
+
+from software_development_lessons.core.jsonl import parse_object
+from software_development_lessons.core.resource_manager import Resource
+from software_development_lessons.utils.helpers import canonicalize_url
+
+CHUNK_SIZE = 5000
+
+# Chunks queued per worker, enough to keep workers busy while the parent merges.
+_PREFETCH = 2
+
+# Line number, canonical URL and the resource's field values, with the
+# category and difficulty as their string values.
+ParsedRow = tuple[int, str, tuple[Any, ...]]
+
+
+@dataclass(slots=True)
+class IngestError:
+    """A line that could not be loaded.
+
+    Attributes:
+        line_number: 1-based line number in the input.
+        message: Why the line was rejected.
+    """
+
+    line_number: int
+    message: str
+
+
+@dataclass(slots=True)
+class ParsedChunk:
+    """What a worker made of one chunk of lines.
+
+    Attributes:
+        rows: Valid resources, in input order.
+        errors: Lines that failed to parse or validate, in input order.
+    """
+
+    rows: list[ParsedRow] = field(default_factory=list)
+    errors: list[IngestError] = field(default_factory=list)
+
+
+@dataclass
+class IngestResult:
+    """Outcome of an ingest.
+
+    Attributes:
+        added: Resources added.
+        errors: Rejected lines, by line number.
+    """
+
+    added: int = 0
+    errors: list[IngestError] = field(default_factory=list)
+
+
+def parse_chunk(lines: list[tuple[int, str]]) -> ParsedChunk:
+    """Parse and validate numbered JSON Lines; runs in the worker processes.
+
+    Args:
+        lines: ``(line number, line)`` pairs.
+
+    Returns:
+        The valid resources and the rejected lines.
+    """
+    chunk = ParsedChunk()
+    for line_number, line in lines:
+        try:
+            resource = Resource.from_dict(parse_object(line))
+            key = canonicalize_url(resource.url)
+        except json.JSONDecodeError as e:
+            chunk.errors.append(IngestError(line_number, f"invalid JSON: {e}"))
+            continue
+        except (KeyError, TypeError, ValueError) as e:
+            chunk.errors.append(IngestError(line_number, f"invalid resource: {e}"))
+            continue
+        values = (
+            resource.title,
+            resource.url,
+            resource.category.value,
+            resource.difficulty.value,
+            resource.description,
+            resource.tags,
+            resource.is_free,
+        )
+        chunk.rows.append((line_number, key, values))
+    return chunk
+
+
+def parse_parallel(
+    lines: Iterable[tuple[int, str]],
+    *,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[ParsedChunk]:
+    """Parse numbered lines in worker processes, yielding chunks in input order.
+
+    Only a few chunks per worker are in flight at a time, so input of any
+    size is streamed rather than read into memory up front.
+
+    Args:
+        lines: ``(line number, line)`` pairs, such as from ``read_lines``.
+        workers: Worker processes; None uses one per CPU and 0 parses in
+            this process.
+        chunk_size: Lines per chunk.
+
+    Yields:
+        The parsed chunks.
+
+    Raises:
+        ValueError: If ``workers`` is negative or ``chunk_size`` is not positive.
+    """
+    if workers is not None and workers < 0:
+        msg = "Workers cannot be negative"
+        raise ValueError(msg)
+    if chunk_size < 1:
+        msg = "Chunk size must be positive"
+        raise ValueError(msg)
+    numbered = iter(lines)
+    chunks = iter(lambda: list(islice(numbered, chunk_size)), [])
+    if workers == 0:
+        yield from map(parse_chunk, chunks)
+        return
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque[Future[ParsedChunk]] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(parse_chunk, chunk))
+            if len(pending) >= workers * _PREFETCH:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,423 @@
+"""Append-only event journal with snapshots for durable learning progress."""
+
+import os
+import struct
+import threading
+import zlib
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import BinaryIO
+
+from software_development_lessons.core.learning_tracker import (
+    LearningProgress,
+    LearningSession,
+    ProgressStatus,
+)
+
+# Every record is framed as <payload length, CRC32 of payload> + payload.
+_FRAME = struct.Struct("<II")
+# Payloads start with a type byte followed by a fixed header and UTF-8 strings.
+_PROGRESS_EVENT = 1
+_SESSION_EVENT = 2
+_PROGRESS = struct.Struct("<BBBqqI")  # type, status, percentage, started, completed, url len
+_SESSION = struct.Struct("<BIqqII")  # type, seq, start, end, url len, notes len
+
+_SNAPSHOT_MAGIC = b"SDLSNAP1"
+_SNAPSHOT_HEADER = struct.Struct("<8sQQ")  # magic, next segment, progress count
+_SNAPSHOT_PROGRESS = struct.Struct("<BBqqII")  # status, percentage, started, completed,
+#                                               url len, session count
+_SNAPSHOT_SESSION = struct.Struct("<qqI")  # start, end, notes len
+
+_STATUSES = list(ProgressStatus)
+_STATUS_INDEX = {status: i for i, status in enumerate(_STATUSES)}
+_NONE = -(2**63)
+_EPOCH = datetime.fromordinal(1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _encode_time(value: datetime | None) -> int:
+    """Encode an optional naive datetime as microseconds since 0001-01-01."""
+    return _NONE if value is None else (value - _EPOCH) // _MICROSECOND
+
+
+def _decode_time(value: int) -> datetime | None:
+    """Decode a timestamp written by ``_encode_time``."""
+    return None if value == _NONE else _EPOCH + timedelta(microseconds=value)
+
+
+class EventJournal:
+    """Durable, append-only log of learning progress changes.
+
+    Each change is appended to the current log segment as a length-prefixed,
+    CRC-checked binary record holding the new state of a progress record or
+    session. Every record is flushed to the operating system as it is
+    appended, so it survives the process crashing. Records are fsynced as a
+    group, once ``sync_every`` are pending or, from a background timer,
+    ``sync_interval`` seconds after the first pending one, so a power loss
+    loses at most that window. Every ``snapshot_every`` records a compact
+    snapshot of the full state can be written; the journal then starts a new
+    segment and deletes the old ones, so recovery loads the snapshot and
+    replays only the records appended since.
+
+    Appends from several threads are serialized by an internal lock. Records
+    carry the full new state of what changed, so replaying one that is
+    already reflected in the snapshot is harmless.
+
+    Examples:
+        >>> import tempfile
+        >>> from software_development_lessons.core import LearningTracker
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     journal = EventJournal(directory)
+        ...     tracker = LearningTracker(journal=journal)
+        ...     _ = tracker.start_learning("https://example.com")
+        ...     journal.close()
+        ...     recovered = LearningTracker(journal=EventJournal(directory))
+        ...     recovered.get_statistics()["in_progress"]
+        1
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        *,
+        sync_every: int = 100,
+        sync_interval: float = 0.05,
+        snapshot_every: int = 100_000,
+    ) -> None:
+        """Open the journal stored in ``directory``, creating it if needed.
+
+        Args:
+            directory: Directory holding the snapshot and log segments.
+            sync_every: Records appended between forced fsyncs.
+            sync_interval: Seconds after which a background timer fsyncs
+                pending records.
+            snapshot_every: Records appended before ``snapshot_due`` is set.
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._sync_every = sync_every
+        self._sync_interval = sync_interval
+        self._snapshot_every = snapshot_every
+        self._pending = 0
+        self._since_snapshot = 0
+        self._segment = 0
+        self._file: BinaryIO | None = None
+        # Armed by the first record appended after a sync.
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+
+    @property
+    def snapshot_due(self) -> bool:
+        """Whether enough records were appended to warrant a new snapshot."""
+        return self._since_snapshot >= self._snapshot_every
+
+    def recover(self) -> list[LearningProgress]:
+        """Rebuild progress from the latest snapshot and the log tail.
+
+        A torn record at the end of the last segment, left by a crash during
+        a write, is truncated away. Appends go to the last segment afterwards.
+
+        Returns:
+            The recovered progress records, in the order they were created.
+
+        Raises:
+            ValueError: If the snapshot file is corrupt.
+        """
+        progress: dict[str, LearningProgress] = {}
+        snapshot_path = self._directory / "snapshot.bin"
+        first_segment = 0
+        if snapshot_path.exists():
+            first_segment, records = _read_snapshot(snapshot_path)
+            progress = {p.resource_url: p for p in records}
+
+        segments = self._segments()
+        for number in [n for n in segments if n < first_segment]:
+            self._segment_path(number).unlink()
+        replay = [n for n in segments if n >= first_segment] or [first_segment]
+        for number in replay:
+            path = self._segment_path(number)
+            if not path.exists():
+                continue
+            valid_length = 0
+            for end_offset, payload in _read_records(path):
+                _apply(progress, payload)
+                valid_length = end_offset
+                self._since_snapshot += 1
+            if path.stat().st_size != valid_length:
+                with path.open("r+b") as f:
+                    f.truncate(valid_length)
+
+        self._segment = replay[-1]
+        return list(progress.values())
+
+    def record_progress(self, progress: LearningProgress) -> None:
+        """Append the current state of a progress record, excluding sessions.
+
+        Args:
+            progress: The progress record that changed.
+        """
+        url = progress.resource_url.encode()
+        header = _PROGRESS.pack(
+            _PROGRESS_EVENT,
+            _STATUS_INDEX[progress.status],
+            progress.completion_percentage,
+            _encode_time(progress.started_at),
+            _encode_time(progress.completed_at),
+            len(url),
+        )
+        self._append(header + url)
+
+    def record_session(self, seq: int, session: LearningSession) -> None:
+        """Append the current state of the session at position ``seq``.
+
+        Args:
+            seq: Position of the session within its resource's sessions.
+            session: The session that started or completed.
+        """
+        url = session.resource_url.encode()
+        notes = session.notes.encode()
+        header = _SESSION.pack(
+            _SESSION_EVENT,
+            seq,
+            _encode_time(session.start_time),
+            _encode_time(session.end_time),
+            len(url),
+            len(notes),
+        )
+        self._append(header + url + notes)
+
+    def sync(self) -> None:
+        """Fsync the records appended to the current segment so far."""
+        with self._lock:
+            self._sync()
+
+    def _sync(self) -> None:
+        """Fsync the current segment and disarm the timer; the caller holds ``_lock``."""
+        if self._file is not None and self._pending:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _sync_on_timer(self) -> None:
+        """Fsync pending records once ``sync_interval`` has passed; runs on the timer."""
+        with self._lock:
+            if self._timer is threading.current_thread():
+                self._sync()
+
+    def write_snapshot(self, records: Iterable[LearningProgress], *, blocking: bool = True) -> bool:
+        """Persist a snapshot of the full state and start a new log segment.
+
+        New records go to the new segment first; only then is ``records``
+        consumed, each record read under its own lock. A change made while
+        the snapshot is being written is therefore either captured by it or
+        replayed from the new segment. The snapshot is written to a temporary
+        file, fsynced and atomically renamed into place, after which older
+        segments are deleted.
+
+        Args:
+            records: Every progress record currently tracked. Pass a lazy
+                iterable so records created during the switch are included.
+            blocking: Whether to wait for a snapshot that is being written by
+                another thread, rather than return without writing one.
+
+        Returns:
+            Whether a snapshot was written.
+        """
+        if not self._snapshot_lock.acquire(blocking=blocking):
+            return False
+        try:
+            with self._lock:
+                self._sync()
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                self._segment += 1
+                self._since_snapshot = 0
+                next_segment = self._segment
+
+            snapshot_path = self._directory / "snapshot.bin"
+            tmp_path = snapshot_path.with_suffix(".tmp")
+            with tmp_path.open("wb") as f:
+                checksum = 0
+                for chunk in _encode_snapshot(next_segment, list(records)):
+                    f.write(chunk)
+                    checksum = zlib.crc32(chunk, checksum)
+                f.write(struct.pack("<I", checksum))
+                f.flush()
+                os.fsync(f.fileno())
+            tmp_path.replace(snapshot_path)
+            _fsync_directory(self._directory)
+
+            for number in self._segments():
+                if number < next_segment:
+                    self._segment_path(number).unlink()
+        finally:
+            self._snapshot_lock.release()
+        return True
+
+    def close(self) -> None:
+        """Sync and close the current segment."""
+        with self._lock:
+            self._sync()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _append(self, payload: bytes) -> None:
+        """Append and flush one framed record, syncing when the group commit is due."""
+        frame = _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._lock:
+            if self._file is None:
+                self._file = self._segment_path(self._segment).open("ab")
+            self._file.write(frame)
+            self._file.flush()
+            self._pending += 1
+            self._since_snapshot += 1
+            if self._pending >= self._sync_every:
+                self._sync()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._sync_interval, self._sync_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _segment_path(self, number: int) -> Path:
+        """Path of the log segment with the given number."""
+        return self._directory / f"events-{number:08d}.log"
+
+    def _segments(self) -> list[int]:
+        """Numbers of the existing log segments, in ascending order."""
+        return sorted(int(path.stem.split("-")[1]) for path in self._directory.glob("events-*.log"))
+
+
+def _read_records(path: Path) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(end offset, payload)`` for each intact record in a segment."""
+    with path.open("rb") as f:
+        offset = 0
+        while True:
+            frame = f.read(_FRAME.size)
+            if len(frame) < _FRAME.size:
+                return
+            length, checksum = _FRAME.unpack(frame)
+            payload = f.read(length)
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                return
+            offset += _FRAME.size + length
+            yield offset, payload
+
+
+def _apply(progress: dict[str, LearningProgress], payload: bytes) -> None:
+    """Apply one decoded log record to the recovered state."""
+    if payload[0] == _PROGRESS_EVENT:
+        _, status, percentage, started, completed, url_length = _PROGRESS.unpack_from(payload)
+        url = payload[_PROGRESS.size : _PROGRESS.size + url_length].decode()
+        record = progress.get(url)
+        if record is None:
+            record = progress[url] = LearningProgress(resource_url=url)
+        record.status = _STATUSES[status]
+        record.completion_percentage = percentage
+        record.started_at = _decode_time(started)
+        record.completed_at = _decode_time(completed)
+    elif payload[0] == _SESSION_EVENT:
+        _, seq, start, end, url_length, notes_length = _SESSION.unpack_from(payload)
+        url_end = _SESSION.size + url_length
+        url = payload[_SESSION.size : url_end].decode()
+        session = LearningSession(
+            resource_url=url,
+            start_time=_decode_time(start) or _EPOCH,
+            end_time=_decode_time(end),
+            notes=payload[url_end : url_end + notes_length].decode(),
+        )
+        record = progress.get(url)
+        if record is None:
+            record = progress[url] = LearningProgress(resource_url=url)
+        if seq < len(record.sessions):
+            record.sessions[seq] = session
+        else:
+            record.sessions.append(session)
+
+
+def _encode_snapshot(next_segment: int, records: list[LearningProgress]) -> Iterator[bytes]:
+    """Yield the binary snapshot representation in chunks."""
+    yield _SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, next_segment, len(records))
+    for record in records:
+        url = record.resource_url.encode()
+        with record.lock:
+            sessions = list(record.sessions)
+            header = _SNAPSHOT_PROGRESS.pack(
+                _STATUS_INDEX[record.status],
+                record.completion_percentage,
+                _encode_time(record.started_at),
+                _encode_time(record.completed_at),
+                len(url),
+                len(sessions),
+            )
+        chunk = [header, url]
+        for session in sessions:
+            notes = session.notes.encode()
+            chunk.append(
+                _SNAPSHOT_SESSION.pack(
+                    _encode_time(session.start_time), _encode_time(session.end_time), len(notes)
+                )
+            )
+            chunk.append(notes)
+        yield b"".join(chunk)
+
+
+def _read_snapshot(path: Path) -> tuple[int, list[LearningProgress]]:
+    """Decode a snapshot file into its next segment number and records."""
+    data = path.read_bytes()
+    body, (checksum,) = data[:-4], struct.unpack("<I", data[-4:])
+    if zlib.crc32(body) != checksum:
+        msg = f"Snapshot {path} is corrupt"
+        raise ValueError(msg)
+    magic, next_segment, count = _SNAPSHOT_HEADER.unpack_from(body)
+    if magic != _SNAPSHOT_MAGIC:
+        msg = f"{path} is not a learning progress snapshot"
+        raise ValueError(msg)
+
+    offset = _SNAPSHOT_HEADER.size
+    records = []
+    for _ in range(count):
+        status, percentage, started, completed, url_length, session_count = (
+            _SNAPSHOT_PROGRESS.unpack_from(body, offset)
+        )
+        offset += _SNAPSHOT_PROGRESS.size
+        url = body[offset : offset + url_length].decode()
+        offset += url_length
+        sessions = []
+        for _ in range(session_count):
+            start, end, notes_length = _SNAPSHOT_SESSION.unpack_from(body, offset)
+            offset += _SNAPSHOT_SESSION.size
+            sessions.append(
+                LearningSession(
+                    resource_url=url,
+                    start_time=_decode_time(start) or _EPOCH,
+                    end_time=_decode_time(end),
+                    notes=body[offset : offset + notes_length].decode(),
+                )
+            )
+            offset += notes_length
+        records.append(
+            LearningProgress(
+                resource_url=url,
+                status=_STATUSES[status],
+                completion_percentage=percentage,
+                sessions=sessions,
+                started_at=_decode_time(started),
+                completed_at=_decode_time(completed),
+            )
+        )
+    return next_segment, records
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Fsync a directory so a rename inside it is durable."""
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
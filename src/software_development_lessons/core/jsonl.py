@@ -0,0 +1,101 @@
+"""Streaming JSON Lines reading and writing."""
+
+import gzip
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any
+
+
+def _open_for_writing(file_path: Path) -> IO[str]:
+    """Open a text file for writing, gzip-compressing ``.gz`` paths."""
+    if file_path.suffix == ".gz":
+        return gzip.open(file_path, "wt", encoding="utf-8")
+    return file_path.open("w", encoding="utf-8")
+
+
+def _open_for_reading(file_path: Path) -> IO[str]:
+    """Open a text file for reading, decompressing ``.gz`` paths."""
+    if file_path.suffix == ".gz":
+        return gzip.open(file_path, "rt", encoding="utf-8")
+    return file_path.open("r", encoding="utf-8")
+
+
+def write_jsonl(file_path: Path, records: Iterable[dict[str, Any]]) -> int:
+    """Write records to a JSON Lines file, one compact JSON object per line.
+
+    Records are consumed lazily, so a generator can be streamed to disk
+    without materializing it. Paths ending in ``.gz`` are gzip-compressed.
+
+    Args:
+        file_path: The path to write.
+        records: The records to serialize.
+
+    Returns:
+        The number of records written.
+    """
+    count = 0
+    with _open_for_writing(file_path) as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def read_jsonl(file_path: Path) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Lazily read records from a JSON Lines file.
+
+    Blank lines are skipped. Paths ending in ``.gz`` are read as
+    gzip-compressed.
+
+    Args:
+        file_path: The path to read.
+
+    Yields:
+        Tuples of the 1-based line number and the decoded record.
+
+    Raises:
+        ValueError: If a line is not a JSON object.
+    """
+    for line_number, line in read_lines(file_path):
+        try:
+            record = parse_object(line)
+        except json.JSONDecodeError as e:
+            msg = f"{file_path}:{line_number}: invalid JSON: {e}"
+            raise ValueError(msg) from e
+        yield line_number, record
+
+
+def read_lines(file_path: Path) -> Iterator[tuple[int, str]]:
+    """Lazily read the non-blank lines of a JSON Lines file without decoding them.
+
+    Args:
+        file_path: The path to read; ``.gz`` paths are decompressed.
+
+    Yields:
+        Tuples of the 1-based line number and the raw line.
+    """
+    with _open_for_reading(file_path) as f:
+        for line_number, line in enumerate(f, start=1):
+            if line.strip():
+                yield line_number, line
+
+
+def parse_object(line: str) -> dict[str, Any]:
+    """Decode a single line that must hold a JSON object.
+
+    Args:
+        line: The line to decode.
+
+    Returns:
+        The decoded object.
+
+    Raises:
+        json.JSONDecodeError: If the line is not valid JSON or not an object.
+    """
+    record = json.loads(line)
+    if isinstance(record, dict):
+        return record
+    msg = "expected a JSON object"
+    raise json.JSONDecodeError(msg, line, 0)
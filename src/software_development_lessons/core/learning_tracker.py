@@ -1,9 +1,24 @@
 """Learning Progress Tracker for monitoring educational journey."""
 
+from array import array
+from collections.abc import Iterable, Iterator, MutableSequence, Sequence
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any
+from functools import partial
+from threading import Lock, RLock
+from types import MemberDescriptorType
+from typing import TYPE_CHECKING, Any, Protocol, overload
+
+from software_development_lessons.core.metrics import instrument
+from software_development_lessons.core.rollups import Granularity, TimeRollups
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection
+
+    from software_development_lessons.core.journal import EventJournal
+    from software_development_lessons.core.storage import StorageBackend
 
 
 class ProgressStatus(Enum):
@@ -15,21 +30,33 @@ class ProgressStatus(Enum):
     PAUSED = "paused"
 
 
-@dataclass
+@dataclass(slots=True)
 class LearningSession:
     """Represents a single learning session.
 
+    Assigning ``end_time`` on a session that belongs to a progress record
+    completes it through ``complete``, so the record and its observer see the
+    change.
+
     Attributes:
         resource_url: URL of the resource being studied.
         start_time: When the session started.
         end_time: When the session ended (None if ongoing).
         notes: Optional notes about the session.
+        on_complete: Optional callback invoked after the session is completed,
+            with the session and its end time before completion.
+        lock: Optional lock of the owning progress record, held while the
+            session is completed and ``on_complete`` runs.
     """
 
     resource_url: str
     start_time: datetime = field(default_factory=datetime.now)
     end_time: datetime | None = None
     notes: str = ""
+    on_complete: "Callable[[LearningSession, datetime | None], None] | None" = field(
+        default=None, repr=False, compare=False
+    )
+    lock: "RLock | None" = field(default=None, repr=False, compare=False)
 
     @property
     def duration(self) -> timedelta:
@@ -41,36 +68,382 @@ class LearningSession:
         end = self.end_time or datetime.now()
         return end - self.start_time
 
-    def complete(self, notes: str = "") -> None:
+    def complete(self, notes: str = "", end_time: datetime | None = None) -> None:
         """Mark the session as complete.
 
         Args:
             notes: Optional notes to add when completing the session.
+            end_time: When the session ended; defaults to now.
+        """
+        # Completing under the record lock keeps a concurrent start from
+        # packing the session between its new end time and the callback.
+        with self.lock if self.lock is not None else nullcontext():
+            previous_end = self.end_time
+            _END_TIME.__set__(self, end_time or datetime.now())
+            if notes:
+                self.notes = notes
+            if self.on_complete is not None:
+                self.on_complete(self, previous_end)
+
+
+def _assign_end_time(session: LearningSession, end_time: datetime | None) -> None:
+    """Store ``end_time``, completing the session if it belongs to a record."""
+    try:
+        on_complete = session.on_complete
+    except AttributeError:
+        # Still being constructed.
+        on_complete = None
+    if on_complete is None:
+        _END_TIME.__set__(session, end_time)
+    elif end_time is None:
+        if session.end_time is not None:
+            msg = "A completed session cannot be reopened"
+            raise ValueError(msg)
+    else:
+        session.complete(end_time=end_time)
+
+
+# Reads go straight to the slot; assignments are routed through
+# ``_assign_end_time`` so they cannot bypass the record's observer.
+_END_TIME: MemberDescriptorType = vars(LearningSession)["end_time"]
+LearningSession.end_time = property(_END_TIME.__get__, _assign_end_time)  # type: ignore[assignment,misc]
+
+
+class ProgressObserver(Protocol):
+    """Receives change notifications from a ``LearningProgress``."""
+
+    def progress_updated(
+        self,
+        progress: "LearningProgress",
+        previous_status: ProgressStatus,
+        previous_percentage: int,
+    ) -> None:
+        """Handle a possible change of status or completion percentage."""
+
+    def session_started(self, progress: "LearningProgress", seq: int) -> None:
+        """Handle a new session appended at position ``seq``."""
+
+    def session_completed(
+        self,
+        progress: "LearningProgress",
+        seq: int,
+        session: LearningSession,
+        previous_end: datetime | None,
+    ) -> None:
+        """Handle completion of ``session``, stored at position ``seq``."""
+
+
+# Fields of ``LearningProgress`` whose assignment is reported to its observer.
+_PROGRESS_FIELDS = frozenset({"status", "completion_percentage", "started_at", "completed_at"})
+
+_EPOCH = datetime.fromordinal(1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(value: datetime) -> int:
+    """Convert a naive datetime to integer microseconds since 0001-01-01."""
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: int) -> datetime:
+    """Convert integer microseconds since 0001-01-01 back to a datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+class SessionStore(MutableSequence[LearningSession]):
+    """Columnar storage for the learning sessions of one resource.
+
+    Completed sessions are packed into ``array`` columns holding start and end
+    times as integer microseconds plus an index into a per-store table of
+    interned notes, about 20 bytes per session instead of a ``LearningSession``
+    object with two ``datetime`` instances. They are materialized as regular
+    ``LearningSession`` objects on access.
+
+    Open sessions are kept as live objects, so code holding one sees and makes
+    changes in place. A live session is packed once it has been completed and
+    another session is appended, or when ``compact`` is called. Completing a
+    materialized copy of a packed session, or assigning its ``end_time``,
+    writes it back through ``listener``; other direct attribute changes on a
+    copy are not stored.
+
+    Attributes:
+        resource_url: URL shared by every session in the store.
+        listener: Optional completion callback given to materialized sessions,
+            called with the session index, the session and its previous end.
+        lock: Optional lock given to materialized sessions, see
+            ``LearningSession.lock``.
+    """
+
+    def __init__(self, sessions: Iterable[LearningSession] = (), resource_url: str = "") -> None:
+        """Initialize the store.
+
+        Args:
+            sessions: Initial sessions, in order.
+            resource_url: URL of the resource the sessions belong to.
+        """
+        self.resource_url = resource_url
+        self.listener: Callable[[int, LearningSession, datetime | None], None] | None = None
+        self.lock: RLock | None = None
+        # Live rows hold zeros in the time columns so column sums only count
+        # packed sessions.
+        self._starts = array("q")
+        self._ends = array("q")
+        self._note_ids = array("I")
+        self._notes: list[str] = [""]
+        self._note_index: dict[str, int] = {"": 0}
+        self._live: dict[int, LearningSession] = {}
+        self.extend(sessions)
+
+    def __len__(self) -> int:
+        """Return the number of sessions."""
+        return len(self._starts)
+
+    @overload
+    def __getitem__(self, index: int) -> LearningSession: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[LearningSession]: ...
+
+    def __getitem__(self, index: int | slice) -> LearningSession | list[LearningSession]:
+        """Return the session at ``index``, or a list of sessions for a slice."""
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+        return self._get(self._normalize(index))
+
+    @overload
+    def __setitem__(self, index: int, value: LearningSession) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[LearningSession]) -> None: ...
+
+    def __setitem__(
+        self, index: int | slice, value: LearningSession | Iterable[LearningSession]
+    ) -> None:
+        """Replace the session at ``index``."""
+        if isinstance(index, slice) or not isinstance(value, LearningSession):
+            msg = "SessionStore does not support slice assignment"
+            raise TypeError(msg)
+        self._put(self._normalize(index), value)
+
+    def __delitem__(self, index: int | slice) -> None:
+        """Delete the session at ``index``."""
+        if isinstance(index, slice):
+            for i in sorted(range(*index.indices(len(self))), reverse=True):
+                del self[i]
+            return
+        index = self._normalize(index)
+        del self._starts[index], self._ends[index], self._note_ids[index]
+        self._live = {i - (i > index): session for i, session in self._live.items() if i != index}
+
+    def insert(self, index: int, value: LearningSession) -> None:
+        """Insert a session before ``index``."""
+        length = len(self)
+        index = max(0, min(length + index if index < 0 else index, length))
+        if index == length:
+            self.append(value)
+            return
+        self._starts.insert(index, 0)
+        self._ends.insert(index, 0)
+        self._note_ids.insert(index, 0)
+        self._live = {i + (i >= index): session for i, session in self._live.items()}
+        self._put(index, value)
+
+    def append(self, value: LearningSession) -> None:
+        """Append a session, packing live sessions that have since completed."""
+        self.compact()
+        self._starts.append(0)
+        self._ends.append(0)
+        self._note_ids.append(0)
+        self._put(len(self._starts) - 1, value)
+
+    def __iter__(self) -> Iterator[LearningSession]:
+        """Iterate over the sessions in order."""
+        for i in range(len(self)):
+            yield self._get(i)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare element-wise with another sequence of sessions."""
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a representation listing the sessions."""
+        return f"SessionStore({list(self)!r})"
+
+    def compact(self) -> None:
+        """Pack every completed live session into the columns."""
+        for index, session in list(self._live.items()):
+            if session.end_time is not None:
+                del self._live[index]
+                self._pack(index, session)
+
+    def open_sessions(self) -> list[tuple[int, LearningSession]]:
+        """Get the sessions that are still open.
+
+        Returns:
+            List of ``(index, session)`` pairs for every open session.
         """
-        self.end_time = datetime.now()
-        if notes:
-            self.notes = notes
+        self.compact()
+        return list(self._live.items())
+
+    def closed_time(self) -> timedelta:
+        """Sum the durations of all completed sessions.
+
+        Returns:
+            Total duration of completed sessions, computed from the columns.
+        """
+        self.compact()
+        return timedelta(microseconds=sum(self._ends) - sum(self._starts))
+
+    def closed_intervals(self) -> Iterator[tuple[datetime, datetime]]:
+        """Iterate over the start and end times of completed sessions.
+
+        Yields:
+            ``(start_time, end_time)`` pairs read from the columns, without
+            materializing sessions.
+        """
+        self.compact()
+        for index, (start, end) in enumerate(zip(self._starts, self._ends, strict=True)):
+            if index not in self._live:
+                yield _from_micros(start), _from_micros(end)
+
+    def _normalize(self, index: int) -> int:
+        """Resolve a possibly negative index, raising IndexError if out of range."""
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            msg = "session index out of range"
+            raise IndexError(msg)
+        return index
+
+    def _get(self, index: int) -> LearningSession:
+        """Return the live session at ``index`` or materialize a packed one."""
+        live = self._live.get(index)
+        if live is not None:
+            return live
+        return LearningSession(
+            resource_url=self.resource_url,
+            start_time=_from_micros(self._starts[index]),
+            end_time=_from_micros(self._ends[index]),
+            notes=self._notes[self._note_ids[index]],
+            on_complete=partial(self.listener, index) if self.listener is not None else None,
+            lock=self.lock,
+        )
+
+    def _put(self, index: int, session: LearningSession) -> None:
+        """Store ``session`` at an existing row."""
+        if session.end_time is None:
+            self._starts[index] = self._ends[index] = self._note_ids[index] = 0
+            self._live[index] = session
+        else:
+            self._live.pop(index, None)
+            self._pack(index, session)
+
+    def _pack(self, index: int, session: LearningSession) -> None:
+        """Write a completed session into the columns."""
+        end_time = session.end_time or session.start_time
+        self._starts[index] = _to_micros(session.start_time)
+        self._ends[index] = _to_micros(end_time)
+        note_id = self._note_index.get(session.notes)
+        if note_id is None:
+            note_id = self._note_index[session.notes] = len(self._notes)
+            self._notes.append(session.notes)
+        self._note_ids[index] = note_id
 
 
 @dataclass
 class LearningProgress:
     """Tracks progress for a specific resource.
 
+    Assigning ``status``, ``completion_percentage``, ``started_at`` or
+    ``completed_at`` directly notifies the observer like ``update_progress``
+    does, and the sessions of a record with an observer cannot be replaced.
+
     Attributes:
         resource_url: URL of the resource.
         status: Current progress status.
         completion_percentage: Percentage of completion (0-100).
-        sessions: List of learning sessions.
+        sessions: Learning sessions, held in a compact ``SessionStore``.
         started_at: When learning started.
         completed_at: When learning was completed.
+        observer: Optional observer notified of every change.
+        lock: Re-entrant lock serializing changes to this record. Hold it to
+            read a consistent view while other threads may modify it.
     """
 
     resource_url: str
     status: ProgressStatus = ProgressStatus.NOT_STARTED
     completion_percentage: int = 0
-    sessions: list[LearningSession] = field(default_factory=list)
+    sessions: MutableSequence[LearningSession] = field(default_factory=list)
     started_at: datetime | None = None
     completed_at: datetime | None = None
+    observer: ProgressObserver | None = field(default=None, repr=False, compare=False)
+    lock: RLock = field(default_factory=RLock, init=False, repr=False, compare=False)
+    # Cache behind ``total_time_spent``: the summed duration of closed sessions
+    # plus the still-open ones, valid while ``len(sessions) == _cached_count``.
+    _closed_time: timedelta = field(default=timedelta(), init=False, repr=False, compare=False)
+    _open_sessions: dict[int, LearningSession] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _cached_count: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Move the sessions into a compact ``SessionStore``."""
+        self._adopt_sessions(self.sessions)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Assign a field, notifying the observer of changes to the progress fields.
+
+        Raises:
+            AttributeError: If the sessions of a record with an observer are replaced.
+            TypeError: If the sessions are replaced with something not iterable.
+        """
+        fields = self.__dict__
+        if name == "sessions" and "lock" in fields:
+            if fields.get("observer") is not None:
+                msg = "Cannot replace the sessions of an observed record"
+                raise AttributeError(msg)
+            if not isinstance(value, Iterable):
+                msg = "Sessions must be an iterable of LearningSession"
+                raise TypeError(msg)
+            with self.lock:
+                self._adopt_sessions(value)
+        elif name in _PROGRESS_FIELDS and fields.get("observer") is not None:
+            with self.lock:
+                self._set_progress(**{name: value})
+        else:
+            object.__setattr__(self, name, value)
+
+    def _adopt_sessions(self, sessions: Iterable[LearningSession]) -> None:
+        """Store ``sessions`` in a ``SessionStore`` reporting to this record."""
+        if not isinstance(sessions, SessionStore):
+            sessions = SessionStore(sessions, resource_url=self.resource_url)
+        sessions.listener = self._session_completed
+        sessions.lock = self.lock
+        self.__dict__["sessions"] = sessions
+        self._cached_count = -1
+
+    def _set_progress(self, **changes: object) -> None:
+        """Assign progress fields and notify the observer once; the caller holds the lock."""
+        previous_status = self.status
+        previous_percentage = self.completion_percentage
+        self.__dict__.update(changes)
+        if self.observer is not None:
+            self.observer.progress_updated(self, previous_status, previous_percentage)
+
+    def attach(self, observer: ProgressObserver) -> None:
+        """Attach an observer, including to sessions that are still open.
+
+        Args:
+            observer: The observer to notify of future changes.
+        """
+        with self.lock:
+            self.observer = observer
+            self._rebuild_time_cache()
 
     def start_session(self) -> LearningSession:
         """Start a new learning session.
@@ -78,13 +451,83 @@ class LearningProgress:
         Returns:
             The newly created learning session.
         """
-        if self.status == ProgressStatus.NOT_STARTED:
-            self.status = ProgressStatus.IN_PROGRESS
-            self.started_at = datetime.now()
+        with self.lock:
+            changes: dict[str, object] = {}
+            if self.status == ProgressStatus.NOT_STARTED:
+                changes = {"status": ProgressStatus.IN_PROGRESS, "started_at": datetime.now()}
+
+            session = LearningSession(resource_url=self.resource_url, lock=self.lock)
+            seq = len(self.sessions)
+            session.on_complete = partial(self._session_completed, seq)
+            self.sessions.append(session)
+            if self._cached_count == seq:
+                self._open_sessions[id(session)] = session
+                self._cached_count += 1
+            self._set_progress(**changes)
+            if self.observer is not None:
+                self.observer.session_started(self, seq)
+            return session
+
+    def _session_completed(
+        self, seq: int, session: LearningSession, previous_end: datetime | None
+    ) -> None:
+        """Update the time cache and notify the observer of a completed session."""
+        with self.lock:
+            if self.sessions[seq] is not session:
+                # A packed copy was completed; store its new end time.
+                self.sessions[seq] = session
+            if self._cached_count == len(self.sessions):
+                end_time = session.end_time or datetime.now()
+                if previous_end is None:
+                    self._open_sessions.pop(id(session), None)
+                    self._closed_time += end_time - session.start_time
+                else:
+                    self._closed_time += end_time - previous_end
+            if self.observer is not None:
+                self.observer.session_completed(self, seq, session, previous_end)
+
+    def _rebuild_time_cache(self) -> None:
+        """Recompute the time cache from scratch and hook any open sessions."""
+        sessions = self.sessions
+        if isinstance(sessions, SessionStore):
+            self._closed_time = sessions.closed_time()
+            open_sessions = sessions.open_sessions()
+        else:
+            self._closed_time = sum(
+                (s.end_time - s.start_time for s in sessions if s.end_time is not None),
+                timedelta(),
+            )
+            open_sessions = [(i, s) for i, s in enumerate(sessions) if s.end_time is None]
+        self._open_sessions = {}
+        for seq, session in open_sessions:
+            self._open_sessions[id(session)] = session
+            if session.on_complete is None:
+                session.on_complete = partial(self._session_completed, seq)
+            if session.lock is None:
+                session.lock = self.lock
+        self._cached_count = len(sessions)
 
-        session = LearningSession(resource_url=self.resource_url)
-        self.sessions.append(session)
-        return session
+    @property
+    def completed_time(self) -> timedelta:
+        """Total duration of the completed sessions.
+
+        Returns:
+            Summed duration of every session that has ended.
+        """
+        if self._cached_count != len(self.sessions):
+            self._rebuild_time_cache()
+        return self._closed_time
+
+    @property
+    def open_sessions(self) -> list[LearningSession]:
+        """Sessions that are still in progress.
+
+        Returns:
+            List of sessions without an end time.
+        """
+        if self._cached_count != len(self.sessions):
+            self._rebuild_time_cache()
+        return list(self._open_sessions.values())
 
     def update_progress(self, percentage: int) -> None:
         """Update the completion percentage.
@@ -99,22 +542,34 @@ class LearningProgress:
             msg = "Percentage must be between 0 and 100"
             raise ValueError(msg)
 
-        self.completion_percentage = percentage
-
+        changes: dict[str, object] = {"completion_percentage": percentage}
         if percentage == 100:
-            self.status = ProgressStatus.COMPLETED
-            self.completed_at = datetime.now()
+            changes.update(status=ProgressStatus.COMPLETED, completed_at=datetime.now())
         elif percentage > 0:
-            self.status = ProgressStatus.IN_PROGRESS
+            changes["status"] = ProgressStatus.IN_PROGRESS
+
+        with self.lock:
+            self._set_progress(**changes)
 
     @property
     def total_time_spent(self) -> timedelta:
         """Calculate total time spent on this resource.
 
+        Only sessions that are still open are re-measured; completed sessions
+        come from a cache that is updated when sessions start or complete.
+
         Returns:
             Total time spent across all sessions.
         """
-        return sum((session.duration for session in self.sessions), timedelta())
+        with self.lock:
+            if self._cached_count != len(self.sessions):
+                self._rebuild_time_cache()
+            if not self._open_sessions:
+                return self._closed_time
+            now = datetime.now()
+            return self._closed_time + sum(
+                (now - session.start_time for session in self._open_sessions.values()), timedelta()
+            )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert progress to dictionary representation.
@@ -133,16 +588,187 @@ class LearningProgress:
         }
 
 
+class _TrackerAggregates:
+    """Running totals behind ``LearningTracker.get_statistics``.
+
+    Counters are updated from ``ProgressObserver`` notifications, which records
+    also send when their fields are assigned directly, so reading them costs
+    O(open sessions) instead of a scan over every record and session. Session
+    time is also folded into ``rollups`` as sessions complete. Changes are
+    written through to the tracker's storage and event journal.
+
+    Notifications arrive while the changed record's lock is held. ``lock``
+    only guards the counters and is never held during write-through, so
+    updates to different records contend only for that short critical section.
+    """
+
+    def __init__(
+        self,
+        storage: "StorageBackend | None",
+        journal: "EventJournal | None" = None,
+        checkpoint: "Callable[[], None] | None" = None,
+    ) -> None:
+        """Initialize empty totals, writing changes through to ``storage`` and ``journal``.
+
+        ``checkpoint`` is called when a session completion makes a journal
+        snapshot due.
+        """
+        self.storage = storage
+        self.journal = journal
+        self.checkpoint = checkpoint
+        self.lock = Lock()
+        self.status_counts = dict.fromkeys(ProgressStatus, 0)
+        self.completion_sum = 0
+        self.closed_time = timedelta()
+        # Open sessions keyed by identity; sessions themselves are unhashable.
+        self.open_sessions: dict[int, LearningSession] = {}
+        self.rollups = TimeRollups()
+
+    def track(self, progress: LearningProgress) -> None:
+        """Account for a progress record that is new to the tracker."""
+        with progress.lock:
+            progress.attach(self)
+            completed_time = progress.completed_time
+            open_sessions = progress.open_sessions
+            with self.lock:
+                self.status_counts[progress.status] += 1
+                self.completion_sum += progress.completion_percentage
+                self.closed_time += completed_time
+                for session in open_sessions:
+                    self.open_sessions[id(session)] = session
+            sessions = progress.sessions
+            if isinstance(sessions, SessionStore):
+                intervals: Iterable[tuple[datetime, datetime]] = sessions.closed_intervals()
+            else:
+                intervals = ((s.start_time, s.end_time) for s in sessions if s.end_time is not None)
+            self.rollups.add_many(progress.resource_url, intervals)
+
+    def progress_updated(
+        self,
+        progress: LearningProgress,
+        previous_status: ProgressStatus,
+        previous_percentage: int,
+    ) -> None:
+        """Move the record between status counters and adjust the completion sum."""
+        with self.lock:
+            self.status_counts[previous_status] -= 1
+            self.status_counts[progress.status] += 1
+            self.completion_sum += progress.completion_percentage - previous_percentage
+        if self.storage is not None:
+            self.storage.save_progress(progress)
+        if self.journal is not None:
+            self.journal.record_progress(progress)
+
+    def session_started(self, progress: LearningProgress, seq: int) -> None:
+        """Register a newly opened session."""
+        session = progress.sessions[seq]
+        with self.lock:
+            self.open_sessions[id(session)] = session
+        if self.storage is not None:
+            self.storage.save_session(seq, session)
+        if self.journal is not None:
+            self.journal.record_session(seq, session)
+
+    def session_completed(
+        self,
+        progress: LearningProgress,
+        seq: int,
+        session: LearningSession,
+        previous_end: datetime | None,
+    ) -> None:
+        """Fold a completed session's duration into the closed-session total."""
+        end_time = session.end_time or datetime.now()
+        with self.lock:
+            if previous_end is None:
+                self.open_sessions.pop(id(session), None)
+                self.closed_time += end_time - session.start_time
+            else:
+                # Re-completing a session moves its end; count only the delta.
+                self.closed_time += end_time - previous_end
+        self.rollups.add(progress.resource_url, previous_end or session.start_time, end_time)
+        if self.storage is not None:
+            self.storage.save_session(seq, session)
+        if self.journal is not None:
+            self.journal.record_session(seq, session)
+            if self.journal.snapshot_due and self.checkpoint is not None:
+                self.checkpoint()
+
+    def total_time(self) -> timedelta:
+        """Total time across closed sessions plus the elapsed time of open ones."""
+        with self.lock:
+            closed_time = self.closed_time
+            start_times = [session.start_time for session in self.open_sessions.values()]
+        now = datetime.now()
+        return closed_time + sum((now - start for start in start_times), timedelta())
+
+    def time_series(
+        self,
+        granularity: Granularity | str,
+        start: datetime | None,
+        end: datetime | None,
+        resource_urls: "Collection[str] | None",
+    ) -> list[tuple[datetime, timedelta]]:
+        """Rolled-up time per bucket, plus the elapsed time of open sessions."""
+        with self.lock:
+            open_sessions = [(s.resource_url, s.start_time) for s in self.open_sessions.values()]
+        now = datetime.now()
+        return self.rollups.time_series(
+            granularity,
+            start,
+            end,
+            resource_urls=resource_urls,
+            ongoing=[(url, started, now) for url, started in open_sessions],
+        )
+
+
+@instrument
 class LearningTracker:
     """Tracks learning progress across multiple resources.
 
     This class provides methods to track learning sessions, monitor progress,
     and generate statistics about the learning journey.
+
+    The tracker is safe to use from several threads. Each progress record has
+    its own lock, so changes to different resources do not wait for each
+    other, and statistics are read from running totals behind a short lock
+    instead of a scan over every record.
     """
 
-    def __init__(self) -> None:
-        """Initialize the LearningTracker with empty progress tracking."""
+    def __init__(
+        self,
+        storage: "StorageBackend | None" = None,
+        journal: "EventJournal | None" = None,
+    ) -> None:
+        """Initialize the LearningTracker.
+
+        Args:
+            storage: Optional backend to load progress from and persist every
+                change to. Without one, progress lives only in memory.
+            journal: Optional event journal to recover progress from and
+                append every change to. Cannot be combined with ``storage``.
+
+        Raises:
+            ValueError: If both ``storage`` and ``journal`` are given.
+        """
+        if storage is not None and journal is not None:
+            msg = "Use either a storage backend or an event journal, not both"
+            raise ValueError(msg)
         self._progress: dict[str, LearningProgress] = {}
+        # Guards inserting into ``_progress``; per-record changes use the
+        # record's own lock.
+        self._registry_lock = Lock()
+        self._storage = storage
+        self._journal = journal
+        self._aggregates = _TrackerAggregates(storage, journal, self._checkpoint_if_idle)
+        if storage is not None:
+            recovered: Iterable[LearningProgress] = storage.iter_progress()
+        elif journal is not None:
+            recovered = journal.recover()
+        else:
+            recovered = ()
+        for progress in recovered:
+            self._progress[progress.resource_url] = progress
+            self._aggregates.track(progress)
 
     def start_learning(self, resource_url: str) -> LearningSession:
         """Start learning a new resource.
@@ -153,10 +779,24 @@ class LearningTracker:
         Returns:
             The newly created learning session.
         """
-        if resource_url not in self._progress:
-            self._progress[resource_url] = LearningProgress(resource_url=resource_url)
-
-        return self._progress[resource_url].start_session()
+        progress = self._progress.get(resource_url)
+        if progress is None:
+            with self._registry_lock:
+                progress = self._progress.get(resource_url)
+                if progress is None:
+                    progress = LearningProgress(resource_url=resource_url)
+                    self._aggregates.track(progress)
+                    self._progress[resource_url] = progress
+
+        if self._storage is None:
+            session = progress.start_session()
+        else:
+            # Take the record lock before the storage transaction so every
+            # thread acquires them in the same order.
+            with progress.lock, self._storage.transaction():
+                session = progress.start_session()
+        self._maybe_checkpoint()
+        return session
 
     def update_progress(self, resource_url: str, percentage: int) -> None:
         """Update progress for a specific resource.
@@ -168,11 +808,36 @@ class LearningTracker:
         Raises:
             KeyError: If the resource is not being tracked.
         """
-        if resource_url not in self._progress:
+        progress = self._progress.get(resource_url)
+        if progress is None:
             msg = f"Resource {resource_url} is not being tracked"
             raise KeyError(msg)
 
-        self._progress[resource_url].update_progress(percentage)
+        progress.update_progress(percentage)
+        self._maybe_checkpoint()
+
+    def checkpoint(self) -> None:
+        """Write a journal snapshot so recovery can skip the log so far.
+
+        Does nothing when the tracker has no event journal.
+        """
+        if self._journal is not None:
+            self._journal.write_snapshot(self._iter_records())
+
+    def _maybe_checkpoint(self) -> None:
+        """Write a journal snapshot once enough events have been appended."""
+        if self._journal is not None and self._journal.snapshot_due:
+            self.checkpoint()
+
+    def _checkpoint_if_idle(self) -> None:
+        """Write a due snapshot after a session completion.
+
+        Completions run under their record's lock while a snapshot takes
+        every record's lock in turn, so waiting for a snapshot another thread
+        is writing could deadlock; that one is left to finish instead.
+        """
+        if self._journal is not None:
+            self._journal.write_snapshot(self._iter_records(), blocking=False)
 
     def get_progress(self, resource_url: str) -> LearningProgress | None:
         """Get progress for a specific resource.
@@ -191,7 +856,7 @@ class LearningTracker:
         Returns:
             List of all learning progress records.
         """
-        return list(self._progress.values())
+        return self._records()
 
     def get_completed_resources(self) -> list[LearningProgress]:
         """Get all completed resources.
@@ -199,7 +864,7 @@ class LearningTracker:
         Returns:
             List of completed learning progress records.
         """
-        return [p for p in self._progress.values() if p.status == ProgressStatus.COMPLETED]
+        return [p for p in self._records() if p.status == ProgressStatus.COMPLETED]
 
     def get_in_progress_resources(self) -> list[LearningProgress]:
         """Get all in-progress resources.
@@ -207,7 +872,7 @@ class LearningTracker:
         Returns:
             List of in-progress learning progress records.
         """
-        return [p for p in self._progress.values() if p.status == ProgressStatus.IN_PROGRESS]
+        return [p for p in self._records() if p.status == ProgressStatus.IN_PROGRESS]
 
     def get_total_time_spent(self) -> timedelta:
         """Calculate total time spent learning across all resources.
@@ -215,7 +880,37 @@ class LearningTracker:
         Returns:
             Total time spent learning.
         """
-        return sum((p.total_time_spent for p in self._progress.values()), timedelta())
+        return self._aggregates.total_time()
+
+    def time_series(
+        self,
+        granularity: Granularity | str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        *,
+        resource_urls: "Collection[str] | None" = None,
+    ) -> list[tuple[datetime, timedelta]]:
+        """Get time spent learning per hour, day or week.
+
+        Buckets are maintained as sessions complete, so the cost depends on
+        the number of buckets in range rather than the number of sessions.
+        Open sessions count up to now.
+
+        Args:
+            granularity: "hour", "day" or "week", or a ``Granularity``.
+            start: Only include buckets ending after this time.
+            end: Only include buckets starting before this time.
+            resource_urls: Only count these resources, e.g. the URLs of one
+                category; None counts every resource.
+
+        Returns:
+            ``(bucket start, time spent)`` pairs, oldest first, skipping
+            buckets with no time.
+
+        Raises:
+            ValueError: If the granularity is unknown.
+        """
+        return self._aggregates.time_series(granularity, start, end, resource_urls)
 
     def get_statistics(self) -> dict[str, Any]:
         """Get learning statistics.
@@ -223,18 +918,25 @@ class LearningTracker:
         Returns:
             Dictionary containing various learning statistics.
         """
-        all_progress = self._progress.values()
-        completed = self.get_completed_resources()
-        in_progress = self.get_in_progress_resources()
+        aggregates = self._aggregates
+        with aggregates.lock:
+            counts = dict(aggregates.status_counts)
+            completion_sum = aggregates.completion_sum
+        total = sum(counts.values())
 
         return {
-            "total_resources": len(self._progress),
-            "completed": len(completed),
-            "in_progress": len(in_progress),
-            "average_completion": (
-                sum(p.completion_percentage for p in all_progress) / len(all_progress)
-                if all_progress
-                else 0
-            ),
-            "total_hours_spent": self.get_total_time_spent().total_seconds() / 3600,
+            "total_resources": total,
+            "completed": counts[ProgressStatus.COMPLETED],
+            "in_progress": counts[ProgressStatus.IN_PROGRESS],
+            "average_completion": completion_sum / total if total else 0,
+            "total_hours_spent": aggregates.total_time().total_seconds() / 3600,
         }
+
+    def _iter_records(self) -> Iterator[LearningProgress]:
+        """Lazily iterate over the tracked records, copying them on first use."""
+        yield from self._records()
+
+    def _records(self) -> list[LearningProgress]:
+        """Copy of the tracked progress records, safe against concurrent inserts."""
+        with self._registry_lock:
+            return list(self._progress.values())
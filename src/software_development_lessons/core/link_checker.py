@@ -0,0 +1,233 @@
+"""Concurrent link-health checking for catalog URLs."""
+
+import json
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Servers that do not implement HEAD commonly answer with one of these.
+_HEAD_UNSUPPORTED = frozenset({403, 405, 501})
+_NOT_MODIFIED = 304
+_USER_AGENT = "software-development-lessons-link-checker"
+
+
+@dataclass(slots=True)
+class LinkCheckResult:
+    """Outcome of checking a single URL.
+
+    Attributes:
+        url: The URL that was checked.
+        ok: Whether the link is considered healthy.
+        status_code: Final HTTP status code, or None if no response arrived.
+        error: Description of the failure for unreachable links.
+        not_modified: Whether the server confirmed the cached response.
+        elapsed: Seconds spent checking the URL, including rate-limit waits.
+    """
+
+    url: str
+    ok: bool
+    status_code: int | None = None
+    error: str | None = None
+    not_modified: bool = False
+    elapsed: float = 0.0
+
+
+class _HostRateLimiter:
+    """Spaces out requests to one host to at most ``rate`` per second."""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the next request slot for this host."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class LinkChecker:
+    """Checks whether URLs are reachable, many at a time.
+
+    URLs are checked on a bounded thread pool. Each host gets its own
+    ``requests.Session`` so connections are pooled and reused per host, and
+    its own rate limiter so no host receives more than ``per_host_rate``
+    requests per second. A ``HEAD`` request is tried first and falls back to
+    a streamed ``GET`` when the server rejects ``HEAD``. Validators
+    (``ETag``/``Last-Modified``) from earlier runs are sent as conditional
+    headers and kept in a JSON cache file, so unchanged pages answer with a
+    bodiless ``304 Not Modified``.
+
+    Examples:
+        >>> from contextlib import closing
+        >>> with closing(LinkChecker(max_workers=4)) as checker:
+        ...     results = list(checker.check([]))
+        >>> results
+        []
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 16,
+        per_host_rate: float = 5.0,
+        timeout: float = 10.0,
+        cache_path: Path | None = None,
+    ) -> None:
+        """Initialize the checker.
+
+        Args:
+            max_workers: Maximum number of URLs checked at the same time.
+            per_host_rate: Maximum requests per second sent to one host;
+                zero or less disables rate limiting.
+            timeout: Seconds to wait for a connection or response.
+            cache_path: Optional JSON file to load validators from and save
+                them to on ``close``.
+
+        Raises:
+            ValueError: If max_workers is not positive.
+        """
+        if max_workers <= 0:
+            msg = "max_workers must be positive"
+            raise ValueError(msg)
+        self._max_workers = max_workers
+        self._per_host_rate = per_host_rate
+        self._timeout = timeout
+        self._cache_path = cache_path
+        self._cache: dict[str, dict[str, Any]] = {}
+        if cache_path is not None and cache_path.exists():
+            with cache_path.open(encoding="utf-8") as f:
+                self._cache = json.load(f)
+        self._sessions: dict[str, requests.Session] = {}
+        self._limiters: dict[str, _HostRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def check(self, urls: Iterable[str]) -> Iterator[LinkCheckResult]:
+        """Check URLs concurrently.
+
+        Args:
+            urls: URLs to check; duplicates are checked once.
+
+        Yields:
+            One result per distinct URL, in completion order.
+        """
+        unique = list(dict.fromkeys(urls))
+        if not unique:
+            return
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(unique))) as pool:
+            futures = [pool.submit(self.check_url, url) for url in unique]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def check_url(self, url: str) -> LinkCheckResult:
+        """Check a single URL.
+
+        Args:
+            url: The URL to check.
+
+        Returns:
+            The outcome of the check.
+        """
+        start = time.monotonic()
+        host = urlsplit(url).netloc.lower()
+        session, limiter = self._host(host)
+        cached = self._cached(url)
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            limiter.wait()
+            response = session.head(
+                url, headers=headers, timeout=self._timeout, allow_redirects=True
+            )
+            if response.status_code in _HEAD_UNSUPPORTED:
+                limiter.wait()
+                # Stream so only the headers are read, not the body.
+                response = session.get(url, headers=headers, timeout=self._timeout, stream=True)
+                response.close()
+        except requests.RequestException as e:
+            return LinkCheckResult(
+                url=url, ok=False, error=str(e), elapsed=time.monotonic() - start
+            )
+
+        status_code = response.status_code
+        not_modified = status_code == _NOT_MODIFIED and "status_code" in cached
+        if not_modified:
+            status_code = cached["status_code"]
+        else:
+            self._remember(url, response)
+        return LinkCheckResult(
+            url=url,
+            ok=status_code < 400,
+            status_code=status_code,
+            not_modified=not_modified,
+            elapsed=time.monotonic() - start,
+        )
+
+    def save_cache(self) -> None:
+        """Write the validator cache to ``cache_path``, if one was given."""
+        if self._cache_path is None:
+            return
+        self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = json.dumps(self._cache, ensure_ascii=False)
+        self._cache_path.write_text(data, encoding="utf-8")
+
+    def close(self) -> None:
+        """Save the validator cache and close every pooled session."""
+        self.save_cache()
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def _host(self, host: str) -> tuple[requests.Session, _HostRateLimiter]:
+        """Get the pooled session and rate limiter for a host."""
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                session.headers["User-Agent"] = _USER_AGENT
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._max_workers)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+                self._limiters[host] = _HostRateLimiter(self._per_host_rate)
+            return session, self._limiters[host]
+
+    def _cached(self, url: str) -> dict[str, Any]:
+        """Get the cached validators for a URL."""
+        with self._lock:
+            return dict(self._cache.get(url, {}))
+
+    def _remember(self, url: str, response: requests.Response) -> None:
+        """Store the validators of a successful response for the next run."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._lock:
+            if response.ok and (etag or last_modified):
+                self._cache[url] = {
+                    "status_code": response.status_code,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                }
+            else:
+                self._cache.pop(url, None)
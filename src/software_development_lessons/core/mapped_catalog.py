@@ -0,0 +1,518 @@
+"""Memory-mapped, read-only columnar snapshots of a resource catalog."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from itertools import pairwise
+from typing import TYPE_CHECKING, Literal
+
+from software_development_lessons.core.resource_manager import (
+    DifficultyLevel,
+    Resource,
+    ResourceCategory,
+    canonical_key,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from pathlib import Path
+
+_MAGIC = b"SDLCAT01"
+_HEADER = struct.Struct("<8sII")  # magic, row count, section count
+_SECTION = struct.Struct("<QQ")  # offset, length
+# Sections in file order. Integer columns are little-endian arrays: "B" bytes
+# per row, "I" row numbers and counts, "Q" byte offsets into string heaps.
+_SECTIONS = (
+    "meta",  # JSON: enum values in code order
+    "category",  # B[rows]: category code
+    "difficulty",  # B[rows]: difficulty code
+    "flags",  # B[rows]: _FREE | _HAS_TAGS
+    "title_offsets",  # Q[rows + 1]
+    "titles",
+    "url_offsets",  # Q[rows + 1]
+    "urls",
+    "description_offsets",  # Q[rows + 1]
+    "descriptions",
+    "key_offsets",  # Q[rows + 1]: canonical URLs, by row
+    "keys",
+    "key_order",  # I[rows]: rows sorted by canonical URL
+    "tag_offsets",  # Q[tags + 1]: distinct tags, sorted
+    "tags",
+    "row_tag_offsets",  # I[rows + 1]
+    "row_tags",  # I[...]: tag ids of each row, in their original order
+    "category_offsets",  # I[categories + 1]
+    "category_rows",  # I[rows]: rows grouped by category code
+    "difficulty_offsets",  # I[difficulties + 1]
+    "difficulty_rows",  # I[rows]: rows grouped by difficulty code
+    "free_rows",  # I[...]
+    "tag_row_offsets",  # I[tags + 1]
+    "tag_rows",  # I[...]: rows grouped by tag id
+)
+_ALIGNMENT = 8
+_FREE = 1
+_HAS_TAGS = 2
+
+
+def write_mapped_catalog(path: Path, resources: Iterable[Resource]) -> int:
+    """Write resources to a columnar snapshot that ``MappedCatalog`` can map.
+
+    The snapshot is written to a temporary file and atomically renamed into
+    place, so readers never map a partially written file.
+
+    Args:
+        path: The snapshot file to write.
+        resources: The resources, in the order ``get_all`` should return them.
+
+    Returns:
+        The number of resources written.
+
+    Raises:
+        ValueError: If two resources share a canonical URL.
+    """
+    categories = list(ResourceCategory)
+    difficulties = list(DifficultyLevel)
+    category_codes = {category: code for code, category in enumerate(categories)}
+    difficulty_codes = {difficulty: code for code, difficulty in enumerate(difficulties)}
+
+    rows = list(resources)
+    columns = {name: array("B") for name in ("category", "difficulty", "flags")}
+    heaps = {name: _HeapWriter() for name in ("titles", "urls", "descriptions", "keys")}
+    keys: list[str] = []
+    for resource in rows:
+        columns["category"].append(category_codes[resource.category])
+        columns["difficulty"].append(difficulty_codes[resource.difficulty])
+        columns["flags"].append(
+            (_FREE if resource.is_free else 0) | (_HAS_TAGS if resource.tags is not None else 0)
+        )
+        key = canonical_key(resource.url)
+        keys.append(key)
+        heaps["titles"].add(resource.title)
+        heaps["urls"].add(resource.url)
+        heaps["descriptions"].add(resource.description)
+        heaps["keys"].add(key)
+
+    key_order = array("I", sorted(range(len(rows)), key=keys.__getitem__))
+    for previous, row in pairwise(key_order):
+        if keys[previous] == keys[row]:
+            msg = f"Resource with URL {rows[row].url} already exists"
+            raise ValueError(msg)
+
+    tag_names = sorted({tag for resource in rows for tag in resource.tags or ()})
+    tag_ids = {tag: tag_id for tag_id, tag in enumerate(tag_names)}
+    tag_heap = _HeapWriter()
+    for tag in tag_names:
+        tag_heap.add(tag)
+    row_tag_offsets = array("I", [0])
+    row_tags = array("I")
+    for resource in rows:
+        row_tags.extend(tag_ids[tag] for tag in resource.tags or ())
+        row_tag_offsets.append(len(row_tags))
+
+    category_offsets, category_rows = _group(columns["category"], len(categories))
+    difficulty_offsets, difficulty_rows = _group(columns["difficulty"], len(difficulties))
+    tag_row_offsets, tag_rows = _group_many(row_tag_offsets, row_tags, len(tag_names))
+    meta = {
+        "category": [category.value for category in categories],
+        "difficulty": [difficulty.value for difficulty in difficulties],
+    }
+    sections: dict[str, bytes | bytearray | array[int]] = {
+        "meta": json.dumps(meta).encode(),
+        **columns,
+        "title_offsets": heaps["titles"].offsets,
+        "titles": heaps["titles"].blob,
+        "url_offsets": heaps["urls"].offsets,
+        "urls": heaps["urls"].blob,
+        "description_offsets": heaps["descriptions"].offsets,
+        "descriptions": heaps["descriptions"].blob,
+        "key_offsets": heaps["keys"].offsets,
+        "keys": heaps["keys"].blob,
+        "key_order": key_order,
+        "tag_offsets": tag_heap.offsets,
+        "tags": tag_heap.blob,
+        "row_tag_offsets": row_tag_offsets,
+        "row_tags": row_tags,
+        "category_offsets": category_offsets,
+        "category_rows": category_rows,
+        "difficulty_offsets": difficulty_offsets,
+        "difficulty_rows": difficulty_rows,
+        "free_rows": array(
+            "I", (row for row, flags in enumerate(columns["flags"]) if flags & _FREE)
+        ),
+        "tag_row_offsets": tag_row_offsets,
+        "tag_rows": tag_rows,
+    }
+
+    encoded = [_little_endian(sections[name]) for name in _SECTIONS]
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(rows), len(_SECTIONS)))
+        position = _align(_HEADER.size + _SECTION.size * len(_SECTIONS))
+        for data in encoded:
+            f.write(_SECTION.pack(position, len(data)))
+            position = _align(position + len(data))
+        for data in encoded:
+            f.write(b"\0" * (_align(f.tell()) - f.tell()))
+            f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    tmp_path.replace(path)
+    return len(rows)
+
+
+class MappedCatalog:
+    """Read-only resource catalog backed by a memory-mapped snapshot.
+
+    Opening a snapshot only reads its fixed-size header; the columns, string
+    heaps and prebuilt secondary indexes are used in place through the
+    mapping, so the operating system loads pages on demand and opening a
+    catalog of any size takes constant time. ``Resource`` objects are built
+    only for the rows a lookup returns. Snapshots are written by
+    ``ResourceManager.export_snapshot`` or ``write_mapped_catalog``.
+
+    The read methods mirror those of ``ResourceManager``. Close the catalog,
+    for example with ``contextlib.closing``, to release the mapping; the
+    catalog cannot be used afterwards.
+
+    Examples:
+        >>> import tempfile
+        >>> from contextlib import closing
+        >>> from pathlib import Path
+        >>> from software_development_lessons.core import ResourceManager
+        >>> manager = ResourceManager()
+        >>> manager.add_resource(
+        ...     Resource(
+        ...         "Kubernetes Tutorial",
+        ...         "https://kubernetes.io/",
+        ...         ResourceCategory.CLOUD_DEVOPS,
+        ...         DifficultyLevel.BEGINNER,
+        ...         "Learn container orchestration",
+        ...     )
+        ... )
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     path = Path(directory) / "catalog.sdlcat"
+        ...     written = manager.export_snapshot(path)
+        ...     with closing(MappedCatalog(path)) as catalog:
+        ...         written, catalog.count(), catalog.get_by_url("https://Kubernetes.io").title
+        (1, 1, 'Kubernetes Tutorial')
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Map a snapshot file.
+
+        Args:
+            path: The snapshot file to open.
+
+        Raises:
+            ValueError: If the file is not a valid catalog snapshot.
+        """
+        if sys.byteorder != "little":
+            msg = "Catalog snapshots can only be mapped on little-endian hosts"
+            raise ValueError(msg)
+        with path.open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: list[memoryview] = []
+        try:
+            self._count = self._read_header(path)
+            self._open_columns()
+        except ValueError:
+            self.close()
+            raise
+
+    def count(self) -> int:
+        """Get the total number of resources.
+
+        Returns:
+            The total count of resources.
+        """
+        return self._count
+
+    def __len__(self) -> int:
+        """Number of resources in the snapshot."""
+        return self._count
+
+    def __getitem__(self, row: int) -> Resource:
+        """Build the resource stored in a row.
+
+        Args:
+            row: Row number, in ``get_all`` order.
+
+        Returns:
+            The resource.
+
+        Raises:
+            IndexError: If the row does not exist.
+        """
+        if not 0 <= row < self._count:
+            msg = f"Row {row} out of range"
+            raise IndexError(msg)
+        return self._resource(row)
+
+    def __iter__(self) -> Iterator[Resource]:
+        """Iterate over every resource, building each one as it is reached."""
+        return map(self._resource, range(self._count))
+
+    def get_all(self) -> list[Resource]:
+        """Get all resources.
+
+        Returns:
+            List of all resources.
+        """
+        return list(self)
+
+    def get_by_url(self, url: str) -> Resource | None:
+        """Get a resource by its URL.
+
+        Args:
+            url: The URL of the resource.
+
+        Returns:
+            The resource, or None if not found.
+        """
+        row = self._find(canonical_key(url))
+        return None if row is None else self._resource(row)
+
+    def contains(self, url: str) -> bool:
+        """Check whether a resource with the given URL exists.
+
+        Args:
+            url: The URL to look up.
+
+        Returns:
+            True if a resource with this URL is in the catalog.
+        """
+        return self._find(canonical_key(url)) is not None
+
+    def get_by_category(self, category: ResourceCategory) -> list[Resource]:
+        """Get all resources in a specific category.
+
+        Args:
+            category: The category to filter by.
+
+        Returns:
+            List of resources in the specified category.
+        """
+        code = self._category_codes.get(category.value)
+        if code is None:
+            return []
+        return self._rows(self._category_rows, self._category_offsets, code)
+
+    def get_by_difficulty(self, difficulty: DifficultyLevel) -> list[Resource]:
+        """Get all resources at a specific difficulty level.
+
+        Args:
+            difficulty: The difficulty level to filter by.
+
+        Returns:
+            List of resources at the specified difficulty level.
+        """
+        code = self._difficulty_codes.get(difficulty.value)
+        if code is None:
+            return []
+        return self._rows(self._difficulty_rows, self._difficulty_offsets, code)
+
+    def search_by_tag(self, tag: str) -> list[Resource]:
+        """Search resources by tag.
+
+        Args:
+            tag: The tag to search for.
+
+        Returns:
+            List of resources containing the specified tag.
+        """
+        tag_id = bisect_left(self._tags, tag)
+        if tag_id == len(self._tags) or self._tags[tag_id] != tag:
+            return []
+        return self._rows(self._tag_rows, self._tag_row_offsets, tag_id)
+
+    def get_free_resources(self) -> list[Resource]:
+        """Get all free resources.
+
+        Returns:
+            List of free resources.
+        """
+        return [self._resource(row) for row in self._free_rows]
+
+    def close(self) -> None:
+        """Release the mapping."""
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._mmap.close()
+
+    def _read_header(self, path: Path) -> int:
+        """Validate the header and locate every section."""
+        data = self._mmap
+        table_end = _HEADER.size + _SECTION.size * len(_SECTIONS)
+        if len(data) < table_end:
+            msg = f"{path} is not a catalog snapshot"
+            raise ValueError(msg)
+        magic, count, section_count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or section_count != len(_SECTIONS):
+            msg = f"{path} is not a catalog snapshot"
+            raise ValueError(msg)
+        self._sections: dict[str, tuple[int, int]] = {}
+        for index, name in enumerate(_SECTIONS):
+            offset, length = _SECTION.unpack_from(data, _HEADER.size + _SECTION.size * index)
+            if offset + length > len(data):
+                msg = f"{path} is truncated"
+                raise ValueError(msg)
+            self._sections[name] = (offset, length)
+        return int(count)
+
+    def _open_columns(self) -> None:
+        """Create views of every section, without reading their contents."""
+        offset, length = self._sections["meta"]
+        meta = json.loads(self._mmap[offset : offset + length])
+        self._category_codes = {value: code for code, value in enumerate(meta["category"])}
+        self._difficulty_codes = {value: code for code, value in enumerate(meta["difficulty"])}
+        # Checked once here, so rows are rebuilt without validating them again.
+        self._category_values = [ResourceCategory(value).value for value in meta["category"]]
+        self._difficulty_values = [DifficultyLevel(value).value for value in meta["difficulty"]]
+
+        self._category = self._view("category", "B")
+        self._difficulty = self._view("difficulty", "B")
+        self._flags = self._view("flags", "B")
+        self._titles = self._heap("title_offsets", "titles")
+        self._urls = self._heap("url_offsets", "urls")
+        self._descriptions = self._heap("description_offsets", "descriptions")
+        self._keys = self._heap("key_offsets", "keys")
+        self._key_order = self._view("key_order", "I")
+        self._tags = self._heap("tag_offsets", "tags")
+        self._row_tag_offsets = self._view("row_tag_offsets", "I")
+        self._row_tags = self._view("row_tags", "I")
+        self._category_offsets = self._view("category_offsets", "I")
+        self._category_rows = self._view("category_rows", "I")
+        self._difficulty_offsets = self._view("difficulty_offsets", "I")
+        self._difficulty_rows = self._view("difficulty_rows", "I")
+        self._free_rows = self._view("free_rows", "I")
+        self._tag_row_offsets = self._view("tag_row_offsets", "I")
+        self._tag_rows = self._view("tag_rows", "I")
+
+    def _view(self, name: str, fmt: Literal["B", "I", "Q"]) -> memoryview:
+        """A typed view of a section, kept so ``close`` can release it."""
+        offset, length = self._sections[name]
+        raw = memoryview(self._mmap)[offset : offset + length]
+        view = raw.cast(fmt)
+        self._views.extend((raw, view))
+        return view
+
+    def _heap(self, offsets: str, blob: str) -> _Heap:
+        """A string heap made of an offsets section and a UTF-8 blob section."""
+        return _Heap(self._view(offsets, "Q"), self._view(blob, "B"))
+
+    def _find(self, key: str) -> int | None:
+        """Row holding a canonical URL, found by bisecting the sorted keys."""
+        keys = self._keys
+        order = self._key_order
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            if keys[order[middle]] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(order) and keys[order[low]] == key:
+            return int(order[low])
+        return None
+
+    def _rows(self, rows: memoryview, offsets: memoryview, group: int) -> list[Resource]:
+        """Build the resources of one group of a grouped row index."""
+        return [self._resource(row) for row in rows[offsets[group] : offsets[group + 1]]]
+
+    def _resource(self, row: int) -> Resource:
+        """Build the resource stored in a row."""
+        flags = self._flags[row]
+        tags = None
+        if flags & _HAS_TAGS:
+            tag_ids = self._row_tags[self._row_tag_offsets[row] : self._row_tag_offsets[row + 1]]
+            tags = tuple(self._tags[tag_id] for tag_id in tag_ids)
+        return Resource.from_row(
+            (
+                self._titles[row],
+                self._urls[row],
+                self._category_values[self._category[row]],
+                self._difficulty_values[self._difficulty[row]],
+                self._descriptions[row],
+                tags,
+                bool(flags & _FREE),
+            )
+        )
+
+
+class _Heap:
+    """Strings stored back to back, located through an offsets array."""
+
+    def __init__(self, offsets: memoryview, blob: memoryview) -> None:
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return str(self._blob[self._offsets[index] : self._offsets[index + 1]], "utf-8")
+
+
+class _HeapWriter:
+    """Builds the offsets and blob sections of a string heap."""
+
+    def __init__(self) -> None:
+        self.offsets = array("Q", [0])
+        self.blob = bytearray()
+
+    def add(self, value: str) -> None:
+        self.blob += value.encode()
+        self.offsets.append(len(self.blob))
+
+
+def _group(codes: Sequence[int], groups: int) -> tuple[array[int], array[int]]:
+    """Group row numbers by a per-row code, keeping rows in order."""
+    counts = [0] * (groups + 1)
+    for code in codes:
+        counts[code + 1] += 1
+    offsets = array("I", counts)
+    for group in range(groups):
+        offsets[group + 1] += offsets[group]
+    rows = array("I", [0]) * len(codes)
+    cursor = list(offsets[:-1])
+    for row, code in enumerate(codes):
+        rows[cursor[code]] = row
+        cursor[code] += 1
+    return offsets, rows
+
+
+def _group_many(
+    row_offsets: Sequence[int], values: Sequence[int], groups: int
+) -> tuple[array[int], array[int]]:
+    """Group row numbers by each distinct value the row holds, keeping rows in order."""
+    members: list[list[int]] = [[] for _ in range(groups)]
+    for row in range(len(row_offsets) - 1):
+        for value in dict.fromkeys(values[row_offsets[row] : row_offsets[row + 1]]):
+            members[value].append(row)
+    offsets = array("I", [0])
+    rows = array("I")
+    for group in members:
+        rows.extend(group)
+        offsets.append(len(rows))
+    return offsets, rows
+
+
+def _little_endian(data: bytes | bytearray | array[int]) -> bytes:
+    """Serialize a section, converting integer arrays to little-endian."""
+    if isinstance(data, array):
+        if sys.byteorder != "little":
+            data = array(data.typecode, data)
+            data.byteswap()
+        return data.tobytes()
+    return bytes(data)
+
+
+def _align(position: int) -> int:
+    """Round a file position up to the section alignment."""
+    return -(-position // _ALIGNMENT) * _ALIGNMENT
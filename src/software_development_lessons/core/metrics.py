@@ -0,0 +1,261 @@
+"""Opt-in latency histograms and call counters for the core classes.
+
+Classes marked with ``@instrument`` have their constructor and public methods
+timed once profiling is enabled, either by calling ``enable()`` or by setting
+the ``SDL_PROFILE`` environment variable to anything but ``0`` before the core
+modules are imported. Enabling swaps timing wrappers into the class
+dictionaries and ``disable()`` swaps the original functions back, so while
+profiling is off there is no wrapper at all and calls cost exactly what
+they did before.
+
+Latencies go into log-linear histograms with four buckets per power of two,
+so percentiles are accurate to within about 12% and each timer needs a
+fixed, small amount of memory however many calls it records. Every timer has
+its own lock, so threads timing different calls never wait on each other.
+"""
+
+import inspect
+import os
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter_ns
+from typing import ParamSpec, TypeVar
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+_C = TypeVar("_C", bound=type)
+
+PERCENTILES = (0.5, 0.95, 0.99)
+
+
+@dataclass(slots=True)
+class _Histogram:
+    """Call count, errors and latency distribution of one timer."""
+
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    count: int = 0
+    errors: int = 0
+    total_ns: int = 0
+    min_ns: int = 0
+    max_ns: int = 0
+    buckets: dict[int, int] = field(default_factory=dict)
+
+    def add(self, elapsed_ns: int, *, failed: bool) -> None:
+        """Record one call."""
+        self.min_ns = min(self.min_ns, elapsed_ns) if self.count else elapsed_ns
+        self.count += 1
+        self.errors += failed
+        self.total_ns += elapsed_ns
+        self.max_ns = max(self.max_ns, elapsed_ns)
+        index = _bucket(elapsed_ns)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def percentile(self, fraction: float) -> int:
+        """Approximate latency in nanoseconds below which ``fraction`` of calls fall."""
+        rank = max(1, round(fraction * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                low, high = _bounds(index)
+                return min(max((low + high) // 2, self.min_ns), self.max_ns)
+        return self.max_ns
+
+
+def _bucket(elapsed_ns: int) -> int:
+    """Histogram bucket of a latency: its power of two plus the next two bits."""
+    if elapsed_ns < 8:
+        return max(elapsed_ns, 0)
+    bits = elapsed_ns.bit_length()
+    return (bits << 2) | ((elapsed_ns >> (bits - 3)) & 3)
+
+
+def _bounds(index: int) -> tuple[int, int]:
+    """Inclusive lower and exclusive upper latency of a histogram bucket."""
+    if index < 8:
+        return index, index + 1
+    shift = (index >> 2) - 3
+    low = (4 | (index & 3)) << shift
+    return low, low + (1 << shift)
+
+
+@dataclass
+class _Registry:
+    """Process-wide profiling state.
+
+    ``lock`` guards the registry itself; it is only taken to create a timer,
+    never to record a call.
+    """
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    enabled: bool = False
+    histograms: dict[str, _Histogram] = field(default_factory=dict)
+    classes: list[type] = field(default_factory=list)
+    # Original functions of every wrapped method, keyed by class and name.
+    originals: dict[tuple[type, str], Callable[..., object]] = field(default_factory=dict)
+
+
+_registry = _Registry()
+
+
+def _record(name: str, elapsed_ns: int, *, failed: bool) -> None:
+    """Add one call to the named timer."""
+    histogram = _registry.histograms.get(name)
+    if histogram is None:
+        with _registry.lock:
+            histogram = _registry.histograms.setdefault(name, _Histogram())
+    with histogram.lock:
+        histogram.add(elapsed_ns, failed=failed)
+
+
+def timed(name: str, func: Callable[_P, _R]) -> Callable[_P, _R]:
+    """Wrap ``func`` so every call is recorded under ``name``.
+
+    Unlike instrumented classes, the wrapper records whether or not
+    profiling is enabled; use it for code that only runs while profiling.
+
+    Args:
+        name: The timer to record into.
+        func: The callable to time.
+
+    Returns:
+        The timing wrapper.
+    """
+
+    @wraps(func)
+    def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        start = perf_counter_ns()
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+        finally:
+            _record(name, perf_counter_ns() - start, failed=failed)
+        return result
+
+    return wrapper
+
+
+def _wrap_class(cls: type) -> None:
+    """Swap timing wrappers in for ``__init__`` and the public methods of ``cls``."""
+    for name, attribute in list(vars(cls).items()):
+        # Generators, including those behind ``@contextmanager``, would only be
+        # timed until their first item is requested.
+        if (
+            (name.startswith("_") and name != "__init__")
+            or not inspect.isfunction(attribute)
+            or inspect.isgeneratorfunction(inspect.unwrap(attribute))
+        ):
+            continue
+        _registry.originals[cls, name] = attribute
+        setattr(cls, name, timed(f"{cls.__name__}.{name}", attribute))
+
+
+def instrument(cls: _C) -> _C:
+    """Class decorator registering the public methods of ``cls`` for profiling.
+
+    Args:
+        cls: The class to instrument.
+
+    Returns:
+        The class itself, with timed methods if profiling is enabled.
+    """
+    with _registry.lock:
+        _registry.classes.append(cls)
+        if _registry.enabled:
+            _wrap_class(cls)
+    return cls
+
+
+def enable() -> None:
+    """Start timing the public methods of every instrumented class."""
+    with _registry.lock:
+        if _registry.enabled:
+            return
+        _registry.enabled = True
+        for cls in _registry.classes:
+            _wrap_class(cls)
+
+
+def disable() -> None:
+    """Stop timing and restore the original methods; recorded data is kept."""
+    with _registry.lock:
+        _registry.enabled = False
+        for (cls, name), original in _registry.originals.items():
+            setattr(cls, name, original)
+        _registry.originals.clear()
+
+
+def is_enabled() -> bool:
+    """Whether profiling is enabled."""
+    return _registry.enabled
+
+
+def reset() -> None:
+    """Discard everything recorded so far."""
+    with _registry.lock:
+        _registry.histograms.clear()
+
+
+@contextmanager
+def timer(name: str) -> Iterator[None]:
+    """Time the enclosed block under ``name`` if profiling is enabled.
+
+    Args:
+        name: The timer to record into.
+
+    Yields:
+        None.
+    """
+    if not _registry.enabled:
+        yield
+        return
+    start = perf_counter_ns()
+    failed = True
+    try:
+        yield
+        failed = False
+    finally:
+        _record(name, perf_counter_ns() - start, failed=failed)
+
+
+def metrics_snapshot() -> dict[str, dict[str, int | float]]:
+    """Copy of every timer's counters and latency percentiles.
+
+    Returns:
+        Per timer, e.g. ``"ResourceManager.get_by_category"``: the integers
+        ``count`` and ``errors`` (calls that raised), and ``total_s``, ``mean_s``,
+        ``p50_s``, ``p95_s``, ``p99_s`` and ``max_s`` in seconds.
+
+    Examples:
+        >>> enable()
+        >>> with timer("example"):
+        ...     pass
+        >>> metrics_snapshot()["example"]["count"]
+        1
+        >>> disable()
+        >>> reset()
+    """
+    with _registry.lock:
+        histograms = sorted(_registry.histograms.items())
+    snapshot = {}
+    for name, histogram in histograms:
+        with histogram.lock:
+            stats: dict[str, int | float] = {
+                "count": histogram.count,
+                "errors": histogram.errors,
+                "total_s": histogram.total_ns / 1e9,
+                "mean_s": histogram.total_ns / histogram.count / 1e9,
+            }
+            for fraction in PERCENTILES:
+                stats[f"p{round(fraction * 100)}_s"] = histogram.percentile(fraction) / 1e9
+            stats["max_s"] = histogram.max_ns / 1e9
+        snapshot[name] = stats
+    return snapshot
+
+
+if os.environ.get("SDL_PROFILE", "0") not in ("", "0"):
+    enable()
@@ -0,0 +1,276 @@
+"""Composable, index-driven queries over a ResourceManager."""
+
+from __future__ import annotations
+
+from contextlib import AbstractContextManager, nullcontext
+from itertools import islice
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from software_development_lessons.core.resource_manager import (
+        DifficultyLevel,
+        Resource,
+        ResourceCategory,
+    )
+
+# Matches resolved per lock acquisition while a query is iterated.
+_CHUNK_SIZE = 1000
+
+# Stand-in for an index bucket that does not exist; never modified.
+_EMPTY: Mapping[str, None] = {}
+
+
+class ResourceQuery:
+    """A lazily evaluated query combining several resource filters.
+
+    Queries are built by chaining filter methods and are only evaluated when
+    iterated. Every filter is backed by one of the manager's secondary indexes;
+    evaluation walks the smallest matching index bucket and checks membership in
+    the others, so a compound filter never touches resources outside its
+    narrowest candidate set. Filters record only their keys; the index buckets
+    are looked up when the query is evaluated, so resources added after the
+    query was built are found. When given the manager's lock, ``all``, ``first``
+    and ``count`` resolve their matches under that lock. Iteration and
+    ``pages`` resolve one chunk or page at a time, taking the lock per chunk,
+    so they never build the whole result and never hold the lock while the
+    caller runs. Changes made between chunks show up in later chunks, so a
+    resource may then be skipped or repeated; use ``all`` for a snapshot.
+
+    Examples:
+        >>> from software_development_lessons.core import ResourceManager
+        >>> from software_development_lessons.core.resource_manager import ResourceCategory
+        >>> manager = ResourceManager()
+        >>> manager.query().category(ResourceCategory.AI_ML).tag("pytorch").free().all()
+        []
+    """
+
+    def __init__(
+        self,
+        resources: Mapping[str, Resource],
+        by_category: Mapping[ResourceCategory, Mapping[str, None]],
+        by_difficulty: Mapping[DifficultyLevel, Mapping[str, None]],
+        by_tag: Mapping[str, Mapping[str, None]],
+        free: Mapping[str, None],
+        *,
+        lock: AbstractContextManager[object] | None = None,
+    ) -> None:
+        """Initialize a query over the given resource collection and indexes.
+
+        Args:
+            resources: All resources keyed by canonical URL, in catalog order.
+            by_category: Category index mapping each category to its URLs.
+            by_difficulty: Difficulty index mapping each level to its URLs.
+            by_tag: Tag index mapping each tag to its URLs.
+            free: URLs of all free resources.
+            lock: Optional lock guarding the collection and indexes.
+        """
+        self._resources = resources
+        self._by_category = by_category
+        self._by_difficulty = by_difficulty
+        self._by_tag = by_tag
+        self._free = free
+        self._lock = lock if lock is not None else nullcontext()
+        self._categories: list[ResourceCategory] = []
+        self._difficulties: list[DifficultyLevel] = []
+        self._tags: list[str] = []
+        self._only_free = False
+        self._offset = 0
+        self._limit: int | None = None
+
+    def category(self, category: ResourceCategory) -> ResourceQuery:
+        """Restrict results to a category.
+
+        Args:
+            category: The category resources must belong to.
+
+        Returns:
+            This query, for chaining.
+        """
+        self._categories.append(category)
+        return self
+
+    def difficulty(self, difficulty: DifficultyLevel) -> ResourceQuery:
+        """Restrict results to a difficulty level.
+
+        Args:
+            difficulty: The difficulty level resources must have.
+
+        Returns:
+            This query, for chaining.
+        """
+        self._difficulties.append(difficulty)
+        return self
+
+    def tag(self, *tags: str) -> ResourceQuery:
+        """Restrict results to resources carrying every given tag.
+
+        Args:
+            tags: Tags resources must have.
+
+        Returns:
+            This query, for chaining.
+        """
+        self._tags.extend(tags)
+        return self
+
+    def free(self) -> ResourceQuery:
+        """Restrict results to free resources.
+
+        Returns:
+            This query, for chaining.
+        """
+        self._only_free = True
+        return self
+
+    def offset(self, offset: int) -> ResourceQuery:
+        """Skip the first matching resources.
+
+        Args:
+            offset: Number of matches to skip.
+
+        Returns:
+            This query, for chaining.
+
+        Raises:
+            ValueError: If offset is negative.
+        """
+        if offset < 0:
+            msg = "Offset cannot be negative"
+            raise ValueError(msg)
+        self._offset = offset
+        return self
+
+    def limit(self, limit: int) -> ResourceQuery:
+        """Cap the number of returned resources.
+
+        Args:
+            limit: Maximum number of resources to return.
+
+        Returns:
+            This query, for chaining.
+
+        Raises:
+            ValueError: If limit is negative.
+        """
+        if limit < 0:
+            msg = "Limit cannot be negative"
+            raise ValueError(msg)
+        self._limit = limit
+        return self
+
+    def _filtered(self) -> bool:
+        """Whether any filter has been added."""
+        return bool(self._categories or self._difficulties or self._tags or self._only_free)
+
+    def _buckets(self) -> list[Mapping[str, None]]:
+        """Look up the current index bucket of every filter; the caller holds the lock."""
+        buckets = [self._by_category.get(category, _EMPTY) for category in self._categories]
+        buckets += (self._by_difficulty.get(level, _EMPTY) for level in self._difficulties)
+        buckets += (self._by_tag.get(tag, _EMPTY) for tag in self._tags)
+        if self._only_free:
+            buckets.append(self._free)
+        return buckets
+
+    def _matching_urls(self) -> Iterator[str]:
+        """Yield URLs satisfying every filter, in catalog order.
+
+        The buckets are looked up when iteration starts, so the first
+        ``next`` must run under the lock.
+        """
+        if not self._filtered():
+            yield from self._resources
+            return
+
+        # Drive the scan from the smallest bucket and probe the rest.
+        smallest, *others = sorted(self._buckets(), key=len)
+        for url in smallest:
+            if all(url in bucket for bucket in others):
+                yield url
+
+    def __iter__(self) -> Iterator[Resource]:
+        """Iterate over matching resources.
+
+        Yields:
+            Resources matching every filter, in catalog order.
+        """
+        for chunk in self._chunks(_CHUNK_SIZE):
+            yield from chunk
+
+    def all(self) -> list[Resource]:
+        """Evaluate the query.
+
+        Returns:
+            List of matching resources.
+        """
+        stop = None if self._limit is None else self._offset + self._limit
+        resources = self._resources
+        with self._lock:
+            return [resources[url] for url in islice(self._matching_urls(), self._offset, stop)]
+
+    def first(self) -> Resource | None:
+        """Get the first matching resource.
+
+        Returns:
+            The first match, or None if nothing matches.
+        """
+        if self._limit == 0:
+            return None
+        with self._lock:
+            url = next(islice(self._matching_urls(), self._offset, None), None)
+            return None if url is None else self._resources[url]
+
+    def count(self) -> int:
+        """Count matching resources, ignoring offset and limit.
+
+        Returns:
+            The number of resources matching every filter.
+        """
+        with self._lock:
+            if not self._filtered():
+                return len(self._resources)
+            return sum(1 for _ in self._matching_urls())
+
+    def pages(self, page_size: int) -> Iterator[list[Resource]]:
+        """Evaluate the query one page at a time.
+
+        Args:
+            page_size: Number of resources per page.
+
+        Returns:
+            Iterator over consecutive pages of matching resources; the last
+            page may be shorter.
+
+        Raises:
+            ValueError: If page_size is not positive.
+        """
+        if page_size <= 0:
+            msg = "Page size must be positive"
+            raise ValueError(msg)
+        return self._chunks(page_size)
+
+    def _chunks(self, size: int) -> Iterator[list[Resource]]:
+        """Resolve matches ``size`` at a time, taking the lock once per chunk."""
+        stop = None if self._limit is None else self._offset + self._limit
+        resources = self._resources
+        # Matches consumed so far, counting the skipped offset.
+        position = self._offset
+        urls: Iterator[str] | None = None
+        while stop is None or position < stop:
+            wanted = size if stop is None else min(size, stop - position)
+            with self._lock:
+                if urls is None:
+                    urls = islice(self._matching_urls(), position, None)
+                try:
+                    chunk = [resources[url] for url in islice(urls, wanted)]
+                except RuntimeError:
+                    # An index changed size since the last chunk; start a
+                    # fresh scan and resume at the same position.
+                    urls = islice(self._matching_urls(), position, None)
+                    chunk = [resources[url] for url in islice(urls, wanted)]
+            if chunk:
+                yield chunk
+            if len(chunk) < wanted:
+                return
+            position += wanted
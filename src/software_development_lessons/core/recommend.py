@@ -0,0 +1,367 @@
+"""Next-resource suggestions from tag co-occurrence and difficulty progression."""
+
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass
+from itertools import islice
+from operator import itemgetter
+from typing import TYPE_CHECKING, Protocol
+
+from software_development_lessons.core.resource_manager import DifficultyLevel, ResourceCategory
+from software_development_lessons.core.tags import normalize_tag
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Iterable, Mapping
+
+    from software_development_lessons.core.learning_tracker import LearningTracker
+    from software_development_lessons.core.resource_manager import Resource, ResourceManager
+
+# Share of a completed tag's weight passed on to the tags it co-occurs with,
+# scaled by their cosine similarity.
+_RELATED_WEIGHT = 0.5
+# Profile tags, strongest first, that candidates are drawn from.
+_PROFILE_TAGS = 32
+# Most recently added resources considered per tag, category and level.
+_CANDIDATES_PER_BUCKET = 256
+# Score factor by difficulty steps above the level reached in a category:
+# the next level is preferred, the same level is fine, anything else is
+# either review or too big a jump and is not suggested.
+_STEP_FACTORS = {1: 1.5, 0: 1.0}
+# How many matched tags a suggestion reports as its reason.
+_REASONS = 3
+
+
+@dataclass(frozen=True, slots=True)
+class Recommendation:
+    """A suggested resource.
+
+    Attributes:
+        resource: The resource to study next.
+        score: Relevance; higher is better and only comparable within one
+            set of suggestions.
+        tags: The strongest of the learner's tags the resource matched.
+    """
+
+    resource: Resource
+    score: float
+    tags: tuple[str, ...]
+
+
+class TagIndex(Protocol):
+    """Tag statistics suggestions are scored from, by normalized tag.
+
+    ``Recommender`` keeps them in memory and ``SQLiteStorage`` in tables.
+    """
+
+    def __len__(self) -> int:
+        """Number of indexed resources."""
+
+    def tag_counts(self, forms: Iterable[str]) -> dict[str, int]:
+        """Resources tagged with each of ``forms``, omitting tags never used."""
+
+    def related_tags(self, form: str) -> Mapping[str, int]:
+        """Resources tagged with both ``form`` and each other tag."""
+
+    def newest_tagged(
+        self, form: str, category: ResourceCategory, rank: int, limit: int
+    ) -> Iterable[str]:
+        """Keys of the latest resources with a tag, category and difficulty rank, newest first."""
+
+
+class Recommender:
+    """Sparse tag/resource and tag/tag matrices, maintained as resources change.
+
+    Tags are normalized with ``normalize_tag``. For every tag the index keeps
+    the resources carrying it, bucketed by category and difficulty, and how
+    often it occurs together with every other tag. Both matrices are updated
+    per resource on add and remove, so suggestions never need a rebuild.
+
+    A learner's profile is the tags of their completed resources plus the
+    tags co-occurring with those, weighted by cosine similarity, and every
+    tag is weighted by its inverse document frequency so rare, specific tags
+    count more than ubiquitous ones. Candidates come from the postings of
+    the strongest profile tags, restricted to the category and difficulty
+    buckets that continue the learner's progression and capped per bucket,
+    so the cost depends on the size of the profile, not of the catalog.
+
+    Examples:
+        >>> from software_development_lessons.core.resource_manager import (
+        ...     DifficultyLevel,
+        ...     Resource,
+        ...     ResourceCategory,
+        ... )
+        >>> def course(name, level, *tags):
+        ...     url = f"https://example.com/{name}"
+        ...     return Resource(name, url, ResourceCategory.AI_ML, level, "", tags)
+        >>> basics = course("basics", DifficultyLevel.BEGINNER, "pytorch", "python")
+        >>> recommender = Recommender()
+        >>> recommender.add("basics", basics)
+        >>> recommender.add("cnn", course("cnn", DifficultyLevel.INTERMEDIATE, "pytorch", "vision"))
+        >>> recommender.add("rust", course("rust", DifficultyLevel.BEGINNER, "rust"))
+        >>> [key for key, _, _ in recommender.recommend([basics], exclude={"basics"})]
+        ['cnn']
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._size = 0
+        # Tag as spelled -> normalized form, so each spelling is normalized once.
+        self._forms: dict[str, str] = {}
+        # Tag as spelled -> indexed resources spelling it so; a spelling's
+        # form is forgotten with the last resource using it.
+        self._spellings: dict[str, int] = {}
+        # Form -> (category, difficulty rank) -> keys, oldest first.
+        self._postings: dict[str, dict[tuple[ResourceCategory, int], dict[str, None]]] = {}
+        # Form -> resources tagged with it.
+        self._counts: dict[str, int] = {}
+        # Form -> other form -> resources tagged with both.
+        self._cooccurrence: dict[str, dict[str, int]] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed resources."""
+        return self._size
+
+    def add(self, key: str, resource: Resource) -> None:
+        """Index a resource under ``key``.
+
+        Args:
+            key: Unique key the resource is suggested as.
+            resource: The resource to index.
+        """
+        forms = self._acquire_forms(resource)
+        bucket = (resource.category, resource.difficulty.rank)
+        for form in forms:
+            self._postings.setdefault(form, {}).setdefault(bucket, {})[key] = None
+            self._counts[form] = self._counts.get(form, 0) + 1
+            if len(forms) > 1:
+                related = self._cooccurrence.setdefault(form, {})
+                for other in forms:
+                    if other != form:
+                        related[other] = related.get(other, 0) + 1
+        self._size += 1
+
+    def remove(self, key: str, resource: Resource) -> None:
+        """Remove a previously indexed resource.
+
+        Args:
+            key: The key the resource was indexed under.
+            resource: The resource as it was indexed.
+        """
+        forms = self._release_forms(resource)
+        bucket = (resource.category, resource.difficulty.rank)
+        for form in forms:
+            postings = self._postings[form]
+            postings[bucket].pop(key, None)
+            if not postings[bucket]:
+                del postings[bucket]
+            if not postings:
+                del self._postings[form]
+            self._counts[form] -= 1
+            if not self._counts[form]:
+                del self._counts[form]
+            related = self._cooccurrence.get(form)
+            if related is None:
+                continue
+            for other in forms:
+                if other != form:
+                    related[other] -= 1
+                    if not related[other]:
+                        del related[other]
+            if not related:
+                del self._cooccurrence[form]
+        self._size -= 1
+
+    def recommend(
+        self,
+        completed: Iterable[Resource],
+        *,
+        exclude: Collection[str] = (),
+        limit: int = 5,
+    ) -> list[tuple[str, float, tuple[str, ...]]]:
+        """Suggest what to study after the completed resources.
+
+        Args:
+            completed: Resources the learner has completed.
+            exclude: Keys never to suggest, such as the completed resources.
+            limit: Maximum number of suggestions.
+
+        Returns:
+            ``(key, score, matched tags)`` triples, best first.
+        """
+        return suggest(self, completed, exclude=exclude, limit=limit)
+
+    def tag_counts(self, forms: Iterable[str]) -> dict[str, int]:
+        """Count the resources tagged with each normalized tag.
+
+        Args:
+            forms: Normalized tags.
+
+        Returns:
+            The number of resources per tag, omitting tags never used.
+        """
+        counts = self._counts
+        return {form: counts[form] for form in forms if form in counts}
+
+    def related_tags(self, form: str) -> Mapping[str, int]:
+        """Count the resources tagged with both ``form`` and each other tag.
+
+        Args:
+            form: A normalized tag.
+
+        Returns:
+            The number of resources per co-occurring normalized tag.
+        """
+        return self._cooccurrence.get(form, {})
+
+    def newest_tagged(
+        self, form: str, category: ResourceCategory, rank: int, limit: int
+    ) -> Iterable[str]:
+        """Find the latest resources with a tag, category and difficulty rank.
+
+        Args:
+            form: A normalized tag.
+            category: The category of the resources.
+            rank: The ``DifficultyLevel.rank`` of the resources.
+            limit: Maximum number of keys.
+
+        Returns:
+            Keys of the resources, most recently added first.
+        """
+        keys = self._postings.get(form, {}).get((category, rank))
+        return islice(reversed(keys), limit) if keys else ()
+
+    def _acquire_forms(self, resource: Resource) -> list[str]:
+        """Distinct normalized tags of a resource being added, in tag order."""
+        spellings = dict.fromkeys(resource.tags or ())
+        for tag in spellings:
+            uses = self._spellings.get(tag, 0)
+            if not uses:
+                self._forms[tag] = normalize_tag(tag)
+            self._spellings[tag] = uses + 1
+        return tag_forms(spellings, self._forms.__getitem__)
+
+    def _release_forms(self, resource: Resource) -> list[str]:
+        """Distinct normalized tags of a resource being removed, in tag order."""
+        spellings = dict.fromkeys(resource.tags or ())
+        forms = tag_forms(spellings, self._forms.__getitem__)
+        for tag in spellings:
+            self._spellings[tag] -= 1
+            if not self._spellings[tag]:
+                del self._spellings[tag]
+                del self._forms[tag]
+        return forms
+
+
+def tag_forms(tags: Iterable[str], normalize: Callable[[str], str] = normalize_tag) -> list[str]:
+    """Distinct normalized forms of some tags, in tag order, skipping empty ones.
+
+    Args:
+        tags: Tags as spelled on a resource.
+        normalize: Function normalizing one tag.
+
+    Returns:
+        The normalized tags.
+
+    Examples:
+        >>> tag_forms(["Deep Learning", "deep-learning", "C++", "--"])
+        ['deep-learning', 'c']
+    """
+    result: list[str] = []
+    for tag in tags:
+        form = normalize(tag)
+        if form and form not in result:
+            result.append(form)
+    return result
+
+
+def suggest(
+    index: TagIndex,
+    completed: Iterable[Resource],
+    *,
+    exclude: Collection[str] = (),
+    limit: int = 5,
+) -> list[tuple[str, float, tuple[str, ...]]]:
+    """Score suggestions for what to study after the completed resources.
+
+    Args:
+        index: Tag statistics of the catalog to suggest from.
+        completed: Resources the learner has completed.
+        exclude: Keys never to suggest, such as the completed resources.
+        limit: Maximum number of suggestions.
+
+    Returns:
+        ``(key, score, matched tags)`` triples, best first.
+    """
+    if limit <= 0:
+        return []
+    profile: dict[str, int] = {}
+    # Highest difficulty rank completed per category.
+    reached: dict[ResourceCategory, int] = {}
+    for resource in completed:
+        for form in tag_forms(resource.tags or ()):
+            profile[form] = profile.get(form, 0) + 1
+        rank = resource.difficulty.rank
+        reached[resource.category] = max(reached.get(resource.category, rank), rank)
+    # Category and difficulty buckets continuing the progression, with their factors.
+    steps = [
+        (category, level.rank, factor)
+        for category in ResourceCategory
+        for level in DifficultyLevel
+        if (factor := _STEP_FACTORS.get(level.rank - reached.get(category, -1))) is not None
+    ]
+
+    scores: dict[str, float] = {}
+    matched: dict[str, list[str]] = {}
+    for weight, form in _strongest_tags(index, profile):
+        for category, rank, factor in steps:
+            for key in index.newest_tagged(form, category, rank, _CANDIDATES_PER_BUCKET):
+                if key in exclude:
+                    continue
+                scores[key] = scores.get(key, 0.0) + weight * factor
+                matched.setdefault(key, []).append(form)
+    best = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+    return [(key, score, tuple(matched[key][:_REASONS])) for key, score in best]
+
+
+def _strongest_tags(index: TagIndex, profile: dict[str, int]) -> list[tuple[float, str]]:
+    """Weight the profile tags and their co-occurring tags, strongest first."""
+    counts = index.tag_counts(profile)
+    related = {form: index.related_tags(form) for form in counts}
+    others = {other for tags in related.values() for other in tags if other not in counts}
+    counts.update(index.tag_counts(others))
+    weights: dict[str, float] = {}
+    for form, tags in related.items():
+        uses = profile[form]
+        count = counts[form]
+        weights[form] = weights.get(form, 0.0) + uses
+        for other, both in tags.items():
+            similarity = both / math.sqrt(count * counts[other])
+            weights[other] = weights.get(other, 0.0) + uses * similarity * _RELATED_WEIGHT
+    size = len(index)
+    weighted = (
+        (weight * math.log(1 + size / counts[form]), form) for form, weight in weights.items()
+    )
+    return heapq.nlargest(_PROFILE_TAGS, weighted)
+
+
+def recommend_next(
+    manager: ResourceManager, tracker: LearningTracker, *, limit: int = 5
+) -> list[Recommendation]:
+    """Suggest resources to study next from a learner's tracked progress.
+
+    Resources the learner has completed shape the suggestions, and every
+    resource they have started is left out of them.
+
+    Args:
+        manager: The catalog to suggest from.
+        tracker: The learner's progress.
+        limit: Maximum number of suggestions.
+
+    Returns:
+        The suggestions, best first.
+    """
+    completed = [progress.resource_url for progress in tracker.get_completed_resources()]
+    started = [progress.resource_url for progress in tracker.get_all_progress()]
+    return manager.recommend(completed, exclude=started, limit=limit)
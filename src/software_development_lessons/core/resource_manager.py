@@ -1,9 +1,26 @@
 """Resource Manager for managing learning resources."""
 
-from dataclasses import dataclass
+import sys
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, fields
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from threading import Lock
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from software_development_lessons.core.jsonl import read_jsonl, read_lines, write_jsonl
+from software_development_lessons.core.metrics import instrument
+from software_development_lessons.core.query import ResourceQuery
+from software_development_lessons.core.search import SearchIndex
+from software_development_lessons.core.tags import TagDictionary
+from software_development_lessons.utils.helpers import canonicalize_url, validate_url
+
+if TYPE_CHECKING:
+    from software_development_lessons.core.ingest import IngestResult
+    from software_development_lessons.core.recommend import Recommendation
+    from software_development_lessons.core.storage import StorageBackend
+
+_K = TypeVar("_K")
 
 
 class ResourceCategory(Enum):
@@ -20,25 +37,65 @@ class ResourceCategory(Enum):
 
 
 class DifficultyLevel(Enum):
-    """Difficulty levels for resources."""
+    """Difficulty levels for resources, from easiest to hardest."""
 
     BEGINNER = "beginner"
     INTERMEDIATE = "intermediate"
     ADVANCED = "advanced"
     EXPERT = "expert"
 
+    @property
+    def rank(self) -> int:
+        """Position in the progression, from 0 for beginner to 3 for expert."""
+        return _RANKS[self]
+
+
+_RANKS = {level: rank for rank, level in enumerate(DifficultyLevel)}
+
+
+class OnConflict(Enum):
+    """What a bulk add does with a resource whose URL is already present."""
+
+    ERROR = "error"
+    SKIP = "skip"
+    REPLACE = "replace"
+
 
-@dataclass
+@dataclass(slots=True)
+class BulkSummary:
+    """Outcome of a bulk add or remove.
+
+    Attributes:
+        added: Resources added under a URL not present before.
+        skipped: Resources or URLs left alone: duplicates skipped by an add,
+            or URLs a remove did not find.
+        replaced: Resources that replaced one with the same URL.
+        removed: Resources removed.
+    """
+
+    added: int = 0
+    skipped: int = 0
+    replaced: int = 0
+    removed: int = 0
+
+
+@dataclass(frozen=True, slots=True)
 class Resource:
     """Represents a learning resource.
 
+    Resources are immutable and hashable. They use ``__slots__`` instead of a
+    per-instance ``__dict__``, and tags are stored as a tuple of interned
+    strings, so a tag shared by many resources is kept in memory only once.
+
     Attributes:
         title: The title of the resource.
         url: The URL to access the resource.
         category: The category this resource belongs to.
         difficulty: The difficulty level of the resource.
         description: A brief description of the resource.
-        tags: Optional tags for better categorization.
+        tags: Optional tags for better categorization; any sequence of
+            strings other than a single string is accepted and stored as a
+            tuple.
         is_free: Whether the resource is free to access.
     """
 
@@ -47,17 +104,23 @@ class Resource:
     category: ResourceCategory
     difficulty: DifficultyLevel
     description: str
-    tags: list[str] | None = None
+    tags: Sequence[str] | None = None
     is_free: bool = True
 
     def __post_init__(self) -> None:
-        """Validate resource data after initialization."""
+        """Validate resource data and intern its tags after initialization."""
         if not self.title:
             msg = "Resource title cannot be empty"
             raise ValueError(msg)
-        if not self.url.startswith(("http://", "https://")):
+        if not validate_url(self.url):
             msg = "Resource URL must start with http:// or https://"
             raise ValueError(msg)
+        if isinstance(self.tags, str):
+            msg = "Resource tags must be a sequence of strings, not a string"
+            raise ValueError(msg)
+        if self.tags is not None:
+            # The dataclass is frozen, so the field is set through object.
+            object.__setattr__(self, "tags", tuple(sys.intern(tag) for tag in self.tags))
 
     def to_dict(self) -> dict[str, Any]:
         """Convert resource to dictionary representation.
@@ -71,21 +134,157 @@ class Resource:
             "category": self.category.value,
             "difficulty": self.difficulty.value,
             "description": self.description,
-            "tags": self.tags or [],
+            "tags": list(self.tags or ()),
             "is_free": self.is_free,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Resource":
+        """Create a resource from its dictionary representation.
+
+        Args:
+            data: Dictionary in the format produced by ``to_dict``.
+
+        Returns:
+            The reconstructed resource.
+
+        Raises:
+            KeyError: If a required field is missing.
+            ValueError: If a field holds an invalid value.
+        """
+        return cls(
+            title=data["title"],
+            url=data["url"],
+            category=ResourceCategory(data["category"]),
+            difficulty=DifficultyLevel(data["difficulty"]),
+            description=data.get("description", ""),
+            tags=data.get("tags"),
+            is_free=data.get("is_free", True),
+        )
+
+    @classmethod
+    def from_row(cls, values: tuple[Any, ...]) -> "Resource":
+        """Rebuild a resource from field values validated elsewhere, skipping validation.
+
+        Used where the values come from a trusted source, such as a catalog
+        snapshot or a worker that already built the resource once.
+
+        Args:
+            values: The fields in declaration order, with the category and
+                difficulty as their string values and the tags as a tuple
+                or None. The tags are interned here, since strings read from
+                a file or unpickled from another process are not.
+
+        Returns:
+            The resource.
+
+        Raises:
+            KeyError: If the category or difficulty is unknown.
+        """
+        title, url, category, difficulty, description, tags, is_free = values
+        if tags:
+            tags = tuple(map(sys.intern, tags))
+        resource = object.__new__(cls)
+        restored = (
+            title,
+            url,
+            _CATEGORIES[category],
+            _DIFFICULTIES[difficulty],
+            description,
+            tags,
+            is_free,
+        )
+        for set_field, value in zip(_FIELD_SETTERS, restored, strict=True):
+            set_field(resource, value)
+        return resource
+
+
+# Slot descriptors of the resource fields, in field order; setting fields
+# through them bypasses the frozen ``__setattr__``.
+_FIELD_SETTERS = tuple(getattr(Resource, f.name).__set__ for f in fields(Resource))
+_CATEGORIES = {category.value: category for category in ResourceCategory}
+_DIFFICULTIES = {difficulty.value: difficulty for difficulty in DifficultyLevel}
+
+
+def canonical_key(url: str) -> str:
+    """Map a URL to the key ``ResourceManager`` stores it under.
+
+    Valid URLs map to their canonical form (see ``canonicalize_url``); any
+    other string is its own key, so looking it up simply finds nothing.
+
+    Args:
+        url: The URL to look up.
+
+    Returns:
+        The collection key.
+
+    Examples:
+        >>> canonical_key("HTTPS://Example.com/x/")
+        'https://example.com/x'
+        >>> canonical_key("not-a-url")
+        'not-a-url'
+    """
+    try:
+        return canonicalize_url(url)
+    except ValueError:
+        return url
+
 
+@instrument
 class ResourceManager:
     """Manages a collection of learning resources.
 
     This class provides methods to add, remove, search, and filter
     learning resources across different categories and difficulty levels.
+
+    Resources are keyed by their canonical URL (see ``canonicalize_url``), so
+    spellings such as ``https://Example.com/x/`` and ``https://example.com/x``
+    refer to the same resource.
+
+    The manager is safe to use from several threads. Mutations and reads hold
+    a lock only while touching the in-memory collection; reads return copies,
+    so callers never observe an index while it is being updated.
+
+    Unlike ``LearningTracker``, the manager uses one lock rather than one per
+    URL: every change also touches indexes shared by all resources (category,
+    tag and search postings, the tag dictionary and the recommender), so
+    changes to different resources would contend for those anyway.
     """
 
-    def __init__(self) -> None:
-        """Initialize the ResourceManager with an empty collection."""
-        self._resources: list[Resource] = []
+    def __init__(self, storage: "StorageBackend | None" = None) -> None:
+        """Initialize the ResourceManager.
+
+        Args:
+            storage: Optional backend to load resources from and persist every
+                change to. Without one, the collection lives only in memory.
+        """
+        # Keyed by canonical URL; dicts preserve insertion order, so this
+        # doubles as the ordered collection returned by ``get_all``.
+        self._resources: dict[str, Resource] = {}
+        # Secondary indexes mapping a filter value to the keys matching it. The
+        # inner dicts are used as insertion-ordered sets so filtered results keep
+        # the same relative order as ``get_all``.
+        self._by_category: dict[ResourceCategory, dict[str, None]] = {}
+        self._by_difficulty: dict[DifficultyLevel, dict[str, None]] = {}
+        self._by_tag: dict[str, dict[str, None]] = {}
+        self._free: dict[str, None] = {}
+        self._search = SearchIndex()
+        self._tags = TagDictionary()
+        # Imported here: the recommender module needs this one at import time.
+        from software_development_lessons.core.recommend import Recommender
+
+        self._recommender = Recommender()
+        self._lock = Lock()
+        self._storage = storage
+        if storage is not None:
+            loaded: dict[str, Resource] = {}
+            for resource in storage.iter_resources():
+                # Rows saved without going through the manager may share a
+                # canonical URL; the first one wins, as with ``add_resource``.
+                loaded.setdefault(canonicalize_url(resource.url), resource)
+            batch = list(loaded.items())
+            self._resources.update(batch)
+            self._index_many(batch)
 
     def add_resource(self, resource: Resource) -> None:
         """Add a new resource to the collection.
@@ -94,12 +293,104 @@ class ResourceManager:
             resource: The resource to add.
 
         Raises:
-            ValueError: If the resource already exists.
+            ValueError: If a resource with the same canonical URL already exists.
         """
-        if any(r.url == resource.url for r in self._resources):
-            msg = f"Resource with URL {resource.url} already exists"
-            raise ValueError(msg)
-        self._resources.append(resource)
+        key = canonicalize_url(resource.url)
+        with self._lock:
+            if key in self._resources:
+                msg = f"Resource with URL {resource.url} already exists"
+                raise ValueError(msg)
+            if self._storage is not None:
+                self._storage.save_resource(resource)
+            self._resources[key] = resource
+            self._index(key, resource)
+
+    def add_resources(
+        self,
+        resources: Iterable[Resource],
+        on_conflict: OnConflict | str = OnConflict.ERROR,
+    ) -> BulkSummary:
+        """Add many resources in one pass.
+
+        A resource conflicts if its canonical URL is already in the collection
+        or occurs earlier in the batch, and the outcome is the same as adding
+        the resources one at a time. Conflicts are found with set lookups
+        before anything changes; the batch is then indexed under a single lock
+        acquisition and written in a single storage transaction.
+
+        Args:
+            resources: The resources to add.
+            on_conflict: ``"error"`` rejects the whole batch, ``"skip"`` keeps
+                the resource already present and ``"replace"`` removes it and
+                adds the new one at the end.
+
+        Returns:
+            How many resources were added, skipped and replaced.
+
+        Raises:
+            ValueError: If ``on_conflict`` is unknown, or is ``"error"`` and a
+                resource conflicts; nothing is added then.
+        """
+        on_conflict = OnConflict(on_conflict)
+        batch = [(canonicalize_url(resource.url), resource) for resource in resources]
+        summary = BulkSummary()
+        with self._lock:
+            # Keys to add, in order, and the existing resources they replace.
+            pending: dict[str, Resource] = {}
+            replaced: dict[str, Resource] = {}
+            for key, resource in batch:
+                if key not in pending and key not in self._resources:
+                    summary.added += 1
+                elif on_conflict is OnConflict.ERROR:
+                    msg = f"Resource with URL {resource.url} already exists"
+                    raise ValueError(msg)
+                elif on_conflict is OnConflict.SKIP:
+                    summary.skipped += 1
+                    continue
+                else:
+                    summary.replaced += 1
+                    if pending.pop(key, None) is None:
+                        replaced[key] = self._resources[key]
+                pending[key] = resource
+            storage = self._storage
+            if storage is not None:
+                with storage.transaction():
+                    for resource in replaced.values():
+                        storage.delete_resource(resource.url)
+                    for resource in pending.values():
+                        storage.save_resource(resource)
+            # Only change memory once storage has accepted every write.
+            self._forget(replaced)
+            self._remember(list(pending.items()))
+        return summary
+
+    def remove_resources(self, urls: Iterable[str]) -> BulkSummary:
+        """Remove many resources by URL in one pass.
+
+        The resources are removed under a single lock acquisition and storage
+        transaction, and every affected search posting list is rewritten once
+        rather than once per resource.
+
+        Args:
+            urls: URLs of the resources to remove.
+
+        Returns:
+            How many resources were removed, and how many URLs were skipped
+            because they were not found or repeated.
+        """
+        keys = [canonical_key(url) for url in urls]
+        summary = BulkSummary()
+        with self._lock:
+            found: dict[str, Resource] = {}
+            for key in keys:
+                resource = self._resources.get(key)
+                if resource is None or key in found:
+                    summary.skipped += 1
+                else:
+                    found[key] = resource
+            self._delete(found)
+        summary.removed = len(found)
+        return summary
 
     def remove_resource(self, url: str) -> bool:
         """Remove a resource by its URL.
@@ -110,9 +401,37 @@ class ResourceManager:
         Returns:
             True if the resource was removed, False if not found.
         """
-        original_length = len(self._resources)
-        self._resources = [r for r in self._resources if r.url != url]
-        return len(self._resources) < original_length
+        key = canonical_key(url)
+        with self._lock:
+            resource = self._resources.pop(key, None)
+            if resource is None:
+                return False
+            if self._storage is not None:
+                self._storage.delete_resource(resource.url)
+            self._unindex(key, resource)
+            return True
+
+    def get_by_url(self, url: str) -> Resource | None:
+        """Get a resource by its URL.
+
+        Args:
+            url: The URL of the resource.
+
+        Returns:
+            The resource, or None if not found.
+        """
+        return self._resources.get(canonical_key(url))
+
+    def contains(self, url: str) -> bool:
+        """Check whether a resource with the given URL exists.
+
+        Args:
+            url: The URL to look up.
+
+        Returns:
+            True if a resource with this URL is in the collection.
+        """
+        return canonical_key(url) in self._resources
 
     def get_by_category(self, category: ResourceCategory) -> list[Resource]:
         """Get all resources in a specific category.
@@ -123,7 +442,7 @@ class ResourceManager:
         Returns:
             List of resources in the specified category.
         """
-        return [r for r in self._resources if r.category == category]
+        return self._lookup(self._by_category.get(category))
 
     def get_by_difficulty(self, difficulty: DifficultyLevel) -> list[Resource]:
         """Get all resources at a specific difficulty level.
@@ -134,18 +453,54 @@ class ResourceManager:
         Returns:
             List of resources at the specified difficulty level.
         """
-        return [r for r in self._resources if r.difficulty == difficulty]
+        return self._lookup(self._by_difficulty.get(difficulty))
 
-    def search_by_tag(self, tag: str) -> list[Resource]:
+    def search_by_tag(self, tag: str, *, fuzzy: bool = False) -> list[Resource]:
         """Search resources by tag.
 
         Args:
             tag: The tag to search for.
+            fuzzy: Also match other spellings of the tag, ignoring case and
+                separators (``"Deep Learning"`` finds ``"deep-learning"``),
+                and tolerate typos (``"kubernets"`` finds ``"kubernetes"``).
 
         Returns:
-            List of resources containing the specified tag.
+            List of resources containing the specified tag. Fuzzy results
+            list the closest matching tags first.
+
+        Examples:
+            >>> ResourceManager().search_by_tag("kubernets", fuzzy=True)
+            []
         """
-        return [r for r in self._resources if r.tags and tag in r.tags]
+        if not fuzzy:
+            return self._lookup(self._by_tag.get(tag))
+        with self._lock:
+            keys: dict[str, None] = {}
+            for spelling in self._tags.lookup(tag):
+                keys.update(self._by_tag[spelling])
+            return [self._resources[key] for key in keys]
+
+    def suggest_tags(self, prefix: str, limit: int = 10) -> list[str]:
+        """Complete a partially typed tag.
+
+        Case and separators are ignored, so ``"deep l"`` completes to
+        ``"deep-learning"``.
+
+        Args:
+            prefix: The start of a tag.
+            limit: Maximum number of suggestions.
+
+        Returns:
+            Tags starting with the prefix, most used first.
+
+        Raises:
+            ValueError: If limit is negative.
+        """
+        if limit < 0:
+            msg = "Limit cannot be negative"
+            raise ValueError(msg)
+        with self._lock:
+            return self._tags.suggest(prefix, limit)
 
     def get_free_resources(self) -> list[Resource]:
         """Get all free resources.
@@ -153,7 +508,102 @@ class ResourceManager:
         Returns:
             List of free resources.
         """
-        return [r for r in self._resources if r.is_free]
+        return self._lookup(self._free)
+
+    def search(self, text: str, limit: int = 10) -> list[Resource]:
+        """Full-text search over titles, descriptions and tags.
+
+        Every word of ``text`` must occur in a resource, either exactly or as
+        the start of a longer word; results are ranked with BM25.
+
+        Args:
+            text: The search text.
+            limit: Maximum number of resources to return.
+
+        Returns:
+            Matching resources, best match first.
+
+        Raises:
+            ValueError: If limit is negative.
+
+        Examples:
+            >>> ResourceManager().search("kubernetes tutorial")
+            []
+        """
+        if limit < 0:
+            msg = "Limit cannot be negative"
+            raise ValueError(msg)
+        with self._lock:
+            return [self._resources[key] for key in self._search.search(text, limit)]
+
+    def recommend(
+        self, completed_urls: Iterable[str], *, exclude: Iterable[str] = (), limit: int = 5
+    ) -> "list[Recommendation]":
+        """Suggest resources to study after the completed ones.
+
+        Suggestions share tags, or tags that often occur with them, with the
+        completed resources, and continue their progression: the next
+        difficulty level is preferred, the level already reached in a
+        category is fine, and easier or much harder resources are left out.
+        The tag statistics behind them are kept up to date as resources are
+        added and removed, so a call never rebuilds them.
+
+        Args:
+            completed_urls: URLs of completed resources; unknown ones are ignored.
+            exclude: URLs never to suggest, such as resources in progress.
+            limit: Maximum number of suggestions.
+
+        Returns:
+            The suggestions, best first.
+
+        Raises:
+            ValueError: If limit is negative.
+        """
+        from software_development_lessons.core.recommend import Recommendation
+
+        if limit < 0:
+            msg = "Limit cannot be negative"
+            raise ValueError(msg)
+        with self._lock:
+            done = {
+                key: self._resources[key]
+                for key in map(canonical_key, completed_urls)
+                if key in self._resources
+            }
+            skip = done.keys() | set(map(canonical_key, exclude))
+            suggestions = self._recommender.recommend(done.values(), exclude=skip, limit=limit)
+            return [
+                Recommendation(self._resources[key], score, tags)
+                for key, score, tags in suggestions
+            ]
+
+    def query(self) -> ResourceQuery:
+        """Start a composable query over the collection.
+
+        Returns:
+            A new query that can be narrowed with chained filters.
+
+        Examples:
+            >>> manager = ResourceManager()
+            >>> query = (
+            ...     manager.query()
+            ...     .category(ResourceCategory.AI_ML)
+            ...     .difficulty(DifficultyLevel.INTERMEDIATE)
+            ...     .tag("pytorch")
+            ...     .free()
+            ...     .limit(10)
+            ... )
+            >>> query.all()
+            []
+        """
+        return ResourceQuery(
+            self._resources,
+            self._by_category,
+            self._by_difficulty,
+            self._by_tag,
+            self._free,
+            lock=self._lock,
+        )
 
     def get_all(self) -> list[Resource]:
         """Get all resources.
@@ -161,7 +611,8 @@ class ResourceManager:
         Returns:
             List of all resources.
         """
-        return self._resources.copy()
+        with self._lock:
+            return list(self._resources.values())
 
     def count(self) -> int:
         """Get the total number of resources.
@@ -171,6 +622,86 @@ class ResourceManager:
         """
         return len(self._resources)
 
+    def _insert(self, batch: list[tuple[str, Resource]]) -> None:
+        """Store and index resources under keys known to be new; the caller holds the lock."""
+        if self._storage is not None:
+            with self._storage.transaction():
+                for _, resource in batch:
+                    self._storage.save_resource(resource)
+        self._remember(batch)
+
+    def _delete(self, found: dict[str, Resource]) -> None:
+        """Delete and unindex resources keyed by canonical URL; the caller holds the lock."""
+        if not found:
+            return
+        if self._storage is not None:
+            with self._storage.transaction():
+                for resource in found.values():
+                    self._storage.delete_resource(resource.url)
+        self._forget(found)
+
+    def _remember(self, batch: list[tuple[str, Resource]]) -> None:
+        """Add stored resources to the collection and indexes; the caller holds the lock."""
+        self._resources.update(batch)
+        self._index_many(batch)
+
+    def _forget(self, found: dict[str, Resource]) -> None:
+        """Drop deleted resources from the collection and indexes; the caller holds the lock."""
+        if not found:
+            return
+        for key, resource in found.items():
+            del self._resources[key]
+            self._unindex_filters(key, resource)
+        self._search.remove_many(found.items())
+
+    def _index(self, key: str, resource: Resource) -> None:
+        """Add a resource to the secondary, tag and search indexes under its canonical URL."""
+        self._index_filters(key, resource)
+        self._search.add(key, resource)
+
+    def _index_many(self, batch: list[tuple[str, Resource]]) -> None:
+        """Index several resources, merging their search terms into the index at once."""
+        for key, resource in batch:
+            self._index_filters(key, resource)
+        self._search.add_many(batch)
+
+    def _index_filters(self, key: str, resource: Resource) -> None:
+        """Add a resource to the secondary, tag and recommendation indexes by canonical URL."""
+        self._by_category.setdefault(resource.category, {})[key] = None
+        self._by_difficulty.setdefault(resource.difficulty, {})[key] = None
+        for tag in resource.tags or ():
+            bucket = self._by_tag.setdefault(tag, {})
+            if key not in bucket:
+                self._tags.add(tag)
+            bucket[key] = None
+        if resource.is_free:
+            self._free[key] = None
+        self._recommender.add(key, resource)
+
+    def _unindex(self, key: str, resource: Resource) -> None:
+        """Remove a resource from the secondary, tag and search indexes."""
+        self._unindex_filters(key, resource)
+        self._search.remove(key, resource)
+
+    def _unindex_filters(self, key: str, resource: Resource) -> None:
+        """Remove a resource from the secondary, tag and recommendation indexes."""
+        _discard(self._by_category, resource.category, key)
+        _discard(self._by_difficulty, resource.difficulty, key)
+        for tag in resource.tags or ():
+            if key in self._by_tag.get(tag, ()):
+                self._tags.remove(tag)
+            _discard(self._by_tag, tag, key)
+        self._free.pop(key, None)
+        self._recommender.remove(key, resource)
+
+    def _lookup(self, keys: dict[str, None] | None) -> list[Resource]:
+        """Resolve a set of indexed keys to their resources."""
+        if not keys:
+            return []
+        resources = self._resources
+        with self._lock:
+            return [resources[key] for key in keys]
+
     def export_to_json(self, file_path: Path) -> None:
         """Export resources to a JSON file.
 
@@ -179,6 +710,128 @@ class ResourceManager:
         """
         import json
 
-        data = [r.to_dict() for r in self._resources]
+        data = [r.to_dict() for r in self.get_all()]
         with file_path.open("w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+
+    def export_jsonl(self, file_path: Path) -> int:
+        """Stream resources to a JSON Lines file, one resource per line.
+
+        Resources are serialized one at a time from a snapshot of the
+        collection, so only references, not serialized records, are held in
+        memory. Paths ending in ``.gz`` are written gzip-compressed.
+
+        Args:
+            file_path: The path to save the JSON Lines file.
+
+        Returns:
+            The number of resources written.
+        """
+        return write_jsonl(file_path, (r.to_dict() for r in self.get_all()))
+
+    def export_snapshot(self, file_path: Path) -> int:
+        """Write resources to a memory-mappable columnar snapshot.
+
+        The snapshot can be opened with ``MappedCatalog`` in constant time,
+        which suits read-only replicas that would otherwise parse the whole
+        catalog before answering queries.
+
+        Args:
+            file_path: The snapshot file to write.
+
+        Returns:
+            The number of resources written.
+        """
+        from software_development_lessons.core.mapped_catalog import write_mapped_catalog
+
+        return write_mapped_catalog(file_path, self.get_all())
+
+    def import_jsonl(self, file_path: Path) -> int:
+        """Load resources from a JSON Lines file.
+
+        Lines are parsed and added one at a time. Paths ending in ``.gz`` are
+        read as gzip-compressed.
+
+        Args:
+            file_path: The JSON Lines file to read.
+
+        Returns:
+            The number of resources added.
+
+        Raises:
+            ValueError: If a line is malformed or a resource already exists.
+        """
+        added = 0
+        for line_number, record in read_jsonl(file_path):
+            try:
+                resource = Resource.from_dict(record)
+            except (KeyError, TypeError, ValueError) as e:
+                msg = f"{file_path}:{line_number}: invalid resource: {e}"
+                raise ValueError(msg) from e
+            self.add_resource(resource)
+            added += 1
+        return added
+
+    def ingest_jsonl(
+        self,
+        file_path: Path,
+        *,
+        workers: int | None = None,
+        chunk_size: int | None = None,
+    ) -> "IngestResult":
+        """Load a large JSON Lines dump, parsing it in parallel worker processes.
+
+        Unlike ``import_jsonl``, bad lines do not stop the load: lines that
+        fail to parse or validate, and resources whose URL already exists or
+        occurs earlier in the file, are reported in the result and skipped.
+        Every other resource is added, in file order, one chunk per lock
+        acquisition and storage transaction.
+
+        Args:
+            file_path: The JSON Lines file to read; ``.gz`` paths are
+                decompressed.
+            workers: Worker processes; None uses one per CPU and 0 parses in
+                this process.
+            chunk_size: Lines per chunk handed to a worker.
+
+        Returns:
+            The number of resources added and the rejected lines.
+        """
+        from software_development_lessons.core.ingest import (
+            CHUNK_SIZE,
+            IngestError,
+            IngestResult,
+            parse_parallel,
+        )
+
+        result = IngestResult()
+        chunks = parse_parallel(
+            read_lines(file_path), workers=workers, chunk_size=chunk_size or CHUNK_SIZE
+        )
+        for chunk in chunks:
+            errors = chunk.errors
+            batch = []
+            with self._lock:
+                seen: set[str] = set()
+                for line_number, key, values in chunk.rows:
+                    if key in self._resources or key in seen:
+                        msg = f"Resource with URL {values[1]} already exists"
+                        errors.append(IngestError(line_number, msg))
+                        continue
+                    seen.add(key)
+                    batch.append((key, Resource.from_row(values)))
+                self._insert(batch)
+            result.added += len(batch)
+            errors.sort(key=lambda error: error.line_number)
+            result.errors.extend(errors)
+        return result
+
+
+def _discard(index: dict[_K, dict[str, None]], key: _K, url: str) -> None:
+    """Remove a URL from an index bucket, dropping the bucket once empty."""
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    bucket.pop(url, None)
+    if not bucket:
+        del index[key]
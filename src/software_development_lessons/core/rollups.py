@@ -0,0 +1,250 @@
+"""Incrementally maintained rollups of learning time per hour, day and week."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from enum import Enum
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Iterator
+
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class Granularity(Enum):
+    """Width of the buckets in a time series."""
+
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+
+    @property
+    def step(self) -> timedelta:
+        """Length of one bucket."""
+        return _STEPS[self]
+
+    def floor(self, moment: datetime) -> datetime:
+        """Start of the bucket containing ``moment``; weeks start on Monday.
+
+        Args:
+            moment: Any point in time.
+
+        Returns:
+            The start of its bucket.
+
+        Examples:
+            >>> Granularity.WEEK.floor(datetime(2024, 5, 17, 9, 30))
+            datetime.datetime(2024, 5, 13, 0, 0)
+        """
+        if self is Granularity.HOUR:
+            return moment.replace(minute=0, second=0, microsecond=0)
+        day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+        if self is Granularity.WEEK:
+            day -= timedelta(days=day.weekday())
+        return day
+
+    def split(self, start: datetime, end: datetime) -> Iterator[tuple[datetime, int]]:
+        """Split ``[start, end)`` at bucket boundaries.
+
+        Args:
+            start: Start of the stretch.
+            end: End of the stretch; nothing is yielded unless it is after ``start``.
+
+        Yields:
+            ``(bucket start, microseconds)`` of each piece, oldest first.
+
+        Examples:
+            >>> start, end = datetime(2024, 5, 1, 23, 30), datetime(2024, 5, 2, 0, 15)
+            >>> [(bucket.day, micros) for bucket, micros in Granularity.DAY.split(start, end)]
+            [(1, 1800000000), (2, 900000000)]
+        """
+        bucket = self.floor(start)
+        while start < end:
+            bucket_end = bucket + self.step
+            piece_end = min(end, bucket_end)
+            yield bucket, (piece_end - start) // _MICROSECOND
+            start = bucket = bucket_end
+
+
+_STEPS = {
+    Granularity.HOUR: timedelta(hours=1),
+    Granularity.DAY: timedelta(days=1),
+    Granularity.WEEK: timedelta(weeks=1),
+}
+
+
+def aggregate(
+    stretches: Iterable[tuple[str, datetime, datetime]],
+    granularity: Granularity | str,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> list[tuple[datetime, timedelta]]:
+    """Total time per bucket of stretches read once, such as from storage.
+
+    Unlike ``TimeRollups`` nothing is kept, so only the buckets of one
+    granularity within the range are built.
+
+    Args:
+        stretches: ``(resource_url, start, end)`` stretches of learning.
+        granularity: Bucket width, as a ``Granularity`` or its value.
+        start: Only include buckets ending after this time.
+        end: Only include buckets starting before this time.
+
+    Returns:
+        ``(bucket start, time spent)`` pairs, oldest first, skipping empty
+        buckets.
+
+    Raises:
+        ValueError: If the granularity is unknown.
+
+    Examples:
+        >>> start, end = datetime(2024, 5, 1, 23, 30), datetime(2024, 5, 2, 0, 30)
+        >>> [str(spent) for _, spent in aggregate([("https://go.dev/", start, end)], "day")]
+        ['0:30:00', '0:30:00']
+    """
+    granularity = Granularity(granularity)
+    totals: dict[datetime, int] = {}
+    low = granularity.floor(start) if start is not None else None
+    _accumulate(totals, stretches, granularity, low, end)
+    return _series(totals)
+
+
+def _accumulate(
+    totals: dict[datetime, int],
+    stretches: Iterable[tuple[str, datetime, datetime]],
+    granularity: Granularity,
+    low: datetime | None,
+    end: datetime | None,
+) -> None:
+    """Add the microseconds of stretches to the buckets from ``low`` up to ``end``."""
+    for _url, stretch_start, stretch_end in stretches:
+        for bucket, micros in granularity.split(stretch_start, stretch_end):
+            if (low is None or bucket >= low) and (end is None or bucket < end):
+                totals[bucket] = totals.get(bucket, 0) + micros
+
+
+def _series(totals: dict[datetime, int]) -> list[tuple[datetime, timedelta]]:
+    """Sorted non-empty ``(bucket, time spent)`` pairs of per-bucket microseconds."""
+    return [
+        (bucket, timedelta(microseconds=micros))
+        for bucket, micros in sorted(totals.items())
+        if micros
+    ]
+
+
+class TimeRollups:
+    """Time spent per resource, pre-aggregated into hour, day and week buckets.
+
+    Every completed stretch of learning is split at bucket boundaries and
+    added to the buckets it overlaps, so a session running from 23:30 to
+    00:30 counts half an hour towards each day. Range queries then read one
+    small per-resource mapping per bucket instead of rescanning sessions.
+    Bucket starts are kept sorted, so the buckets of a range are found by
+    bisection.
+
+    Examples:
+        >>> rollups = TimeRollups()
+        >>> start, end = datetime(2024, 5, 1, 23, 30), datetime(2024, 5, 2, 0, 30)
+        >>> rollups.add("https://go.dev/tour/", start, end)
+        >>> [(day.date().isoformat(), str(spent)) for day, spent in rollups.time_series("day")]
+        [('2024-05-01', '0:30:00'), ('2024-05-02', '0:30:00')]
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty rollups."""
+        self._lock = Lock()
+        # Per granularity: bucket start -> resource URL -> microseconds.
+        self._buckets: dict[Granularity, dict[datetime, dict[str, int]]] = {
+            granularity: {} for granularity in Granularity
+        }
+        self._starts: dict[Granularity, list[datetime]] = {
+            granularity: [] for granularity in Granularity
+        }
+
+    def add(self, resource_url: str, start: datetime, end: datetime) -> None:
+        """Add the time between ``start`` and ``end`` to a resource's buckets.
+
+        If ``end`` is before ``start`` the time is subtracted instead, which
+        undoes an earlier ``add`` of the same stretch.
+
+        Args:
+            resource_url: URL of the resource studied.
+            start: When the stretch began.
+            end: When the stretch ended.
+        """
+        with self._lock:
+            self._add(resource_url, start, end)
+
+    def add_many(self, resource_url: str, intervals: Iterable[tuple[datetime, datetime]]) -> None:
+        """Add several ``(start, end)`` stretches of one resource.
+
+        Args:
+            resource_url: URL of the resource studied.
+            intervals: The stretches to add.
+        """
+        with self._lock:
+            for start, end in intervals:
+                self._add(resource_url, start, end)
+
+    def time_series(
+        self,
+        granularity: Granularity | str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        *,
+        resource_urls: Collection[str] | None = None,
+        ongoing: Iterable[tuple[str, datetime, datetime]] = (),
+    ) -> list[tuple[datetime, timedelta]]:
+        """Total time per bucket, oldest first, skipping empty buckets.
+
+        Args:
+            granularity: Bucket width, as a ``Granularity`` or its value.
+            start: Only include buckets ending after this time.
+            end: Only include buckets starting before this time.
+            resource_urls: Only count these resources; None counts all.
+            ongoing: Extra ``(resource_url, start, end)`` stretches counted
+                on top without being stored, such as still-open sessions.
+
+        Returns:
+            ``(bucket start, time spent)`` pairs.
+
+        Raises:
+            ValueError: If the granularity is unknown.
+        """
+        granularity = Granularity(granularity)
+        wanted = None if resource_urls is None else frozenset(resource_urls)
+        low = granularity.floor(start) if start is not None else None
+        totals: dict[datetime, int] = {}
+        with self._lock:
+            starts = self._starts[granularity]
+            buckets = self._buckets[granularity]
+            first = 0 if low is None else bisect_left(starts, low)
+            last = len(starts) if end is None else bisect_left(starts, end)
+            for bucket in starts[first:last]:
+                per_resource = buckets[bucket]
+                if wanted is None:
+                    totals[bucket] = sum(per_resource.values())
+                else:
+                    totals[bucket] = sum(
+                        micros for url, micros in per_resource.items() if url in wanted
+                    )
+        if wanted is not None:
+            ongoing = (stretch for stretch in ongoing if stretch[0] in wanted)
+        _accumulate(totals, ongoing, granularity, low, end)
+        return _series(totals)
+
+    def _add(self, resource_url: str, start: datetime, end: datetime) -> None:
+        """Add a stretch to every granularity; the caller holds the lock."""
+        sign = 1
+        if end < start:
+            start, end, sign = end, start, -1
+        for granularity, buckets in self._buckets.items():
+            for bucket, micros in granularity.split(start, end):
+                per_resource = buckets.get(bucket)
+                if per_resource is None:
+                    per_resource = buckets[bucket] = {}
+                    insort(self._starts[granularity], bucket)
+                per_resource[resource_url] = per_resource.get(resource_url, 0) + sign * micros
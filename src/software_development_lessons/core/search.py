@@ -0,0 +1,390 @@
+"""In-process full-text search over resource titles, descriptions and tags."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import islice
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from software_development_lessons.core.resource_manager import Resource
+
+_TOKEN = re.compile(r"\w+")
+# BM25 parameters; the usual defaults from the literature.
+_K1 = 1.2
+_B = 0.75
+# A query token matches at most this many indexed terms it is a prefix of:
+# itself if indexed, then the extensions found in the most documents.
+_MAX_EXPANSIONS = 64
+# Removed documents whose ids stay unused before the ids are renumbered.
+_MIN_GARBAGE = 1024
+# Number of terms whose derived lookup structures are kept between queries.
+_CACHED_TERMS = 256
+
+_V = TypeVar("_V")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens.
+
+    Args:
+        text: The text to tokenize.
+
+    Returns:
+        The tokens in order of appearance.
+
+    Examples:
+        >>> tokenize("Deep-Learning with PyTorch")
+        ['deep', 'learning', 'with', 'pytorch']
+    """
+    return _TOKEN.findall(text.casefold())
+
+
+def _document_tokens(resource: Resource) -> list[str]:
+    """Tokens indexed for a resource: its title, description and tags."""
+    return tokenize(" ".join((resource.title, resource.description, *(resource.tags or ()))))
+
+
+class SearchIndex:
+    """Inverted index with BM25 ranking and prefix matching.
+
+    Documents get consecutive integer ids, so every posting list is a pair of
+    compact arrays (document ids in ascending order and term frequencies)
+    instead of a dict per term. The vocabulary is also kept sorted, so the
+    terms starting with a query token are found by bisection.
+
+    A query matches documents containing every query token, where a token
+    also matches indexed terms it is a prefix of. Matching is driven by the
+    most selective token and only the candidates it yields are intersected and
+    scored, so queries with at least one specific word stay fast however
+    large the catalog grows. Lookup tables for recently queried terms are
+    cached until their postings change, so repeated queries cost time
+    proportional to the matches rather than to the posting lists. Single-term
+    queries merge the cached runs of a posting list with equal term
+    frequency, each ordered by document length, and read only about ``limit``
+    entries; the order within a run does not depend on the average document
+    length, so changes to other terms keep the runs valid. Ids of removed documents are reclaimed by
+    renumbering the remaining ones, in order, once the removed outnumber them.
+
+    Examples:
+        >>> from software_development_lessons.core.resource_manager import (
+        ...     DifficultyLevel,
+        ...     Resource,
+        ...     ResourceCategory,
+        ... )
+        >>> index = SearchIndex()
+        >>> index.add(
+        ...     "https://kubernetes.io/",
+        ...     Resource(
+        ...         "Kubernetes Tutorial",
+        ...         "https://kubernetes.io/",
+        ...         ResourceCategory.CLOUD_DEVOPS,
+        ...         DifficultyLevel.BEGINNER,
+        ...         "Learn container orchestration",
+        ...     ),
+        ... )
+        >>> index.search("kube tutorial")
+        ['https://kubernetes.io/']
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._doc_ids: dict[str, int] = {}
+        # Key of each document id; removed documents leave an empty string.
+        self._keys: list[str] = []
+        self._doc_lengths = array("I")
+        self._total_length = 0
+        self._postings: dict[str, array[int]] = {}
+        self._frequencies: dict[str, array[int]] = {}
+        self._vocabulary: list[str] = []
+        # Query-time views of recently queried terms, dropped whenever the
+        # term's postings change: document-to-frequency lookups, and posting
+        # lists split into runs of equal term frequency, shortest document
+        # first.
+        self._lookups: dict[str, dict[int, int]] = {}
+        self._ranked: dict[str, list[tuple[int, list[int]]]] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed documents."""
+        return len(self._doc_ids)
+
+    def add(self, key: str, resource: Resource) -> None:
+        """Index a resource under ``key``.
+
+        Args:
+            key: Unique key the resource is returned as.
+            resource: The resource to index.
+
+        Raises:
+            ValueError: If the key is already indexed.
+        """
+        self._add(key, resource, None)
+
+    def add_many(self, items: Iterable[tuple[str, Resource]]) -> None:
+        """Index several resources, merging new terms into the vocabulary once.
+
+        Args:
+            items: ``(key, resource)`` pairs to index.
+
+        Raises:
+            ValueError: If a key is already indexed; the items before it stay
+                indexed.
+        """
+        new_terms: list[str] = []
+        try:
+            for key, resource in items:
+                self._add(key, resource, new_terms)
+        finally:
+            if new_terms:
+                # Two sorted runs, which sort() merges in linear time, instead
+                # of an insertion per new term.
+                self._vocabulary += sorted(new_terms)
+                self._vocabulary.sort()
+
+    def _add(self, key: str, resource: Resource, new_terms: list[str] | None) -> None:
+        """Index a resource, collecting its new terms in ``new_terms`` if given."""
+        if key in self._doc_ids:
+            msg = f"Document {key} is already indexed"
+            raise ValueError(msg)
+        doc_id = len(self._keys)
+        tokens = _document_tokens(resource)
+        self._doc_ids[key] = doc_id
+        self._keys.append(key)
+        self._doc_lengths.append(len(tokens))
+        self._total_length += len(tokens)
+        for term, frequency in Counter(tokens).items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = array("I")
+                self._frequencies[term] = array("H")
+                if new_terms is None:
+                    insort(self._vocabulary, term)
+                else:
+                    new_terms.append(term)
+            # Ids only grow, so appending keeps every posting list sorted.
+            postings.append(doc_id)
+            self._frequencies[term].append(min(frequency, 0xFFFF))
+            self._forget(term)
+
+    def remove(self, key: str, resource: Resource) -> None:
+        """Remove a previously indexed resource.
+
+        Args:
+            key: The key the resource was indexed under.
+            resource: The resource as it was indexed.
+        """
+        doc_id = self._detach(key)
+        if doc_id is None:
+            return
+        for term in set(_document_tokens(resource)):
+            postings = self._postings[term]
+            position = bisect_left(postings, doc_id)
+            del postings[position]
+            del self._frequencies[term][position]
+            self._forget(term)
+            if not postings:
+                del self._postings[term]
+                del self._frequencies[term]
+                del self._vocabulary[bisect_left(self._vocabulary, term)]
+        self._maybe_compact()
+
+    def remove_many(self, items: Iterable[tuple[str, Resource]]) -> None:
+        """Remove several indexed resources, rewriting each affected posting list once.
+
+        Args:
+            items: ``(key, resource)`` pairs as they were indexed.
+        """
+        removed: dict[str, set[int]] = {}
+        for key, resource in items:
+            doc_id = self._detach(key)
+            if doc_id is not None:
+                for term in _document_tokens(resource):
+                    removed.setdefault(term, set()).add(doc_id)
+        emptied = set()
+        for term, doc_ids in removed.items():
+            postings = self._postings[term]
+            frequencies = self._frequencies[term]
+            kept = [i for i, doc_id in enumerate(postings) if doc_id not in doc_ids]
+            self._forget(term)
+            if kept:
+                self._postings[term] = array("I", [postings[i] for i in kept])
+                self._frequencies[term] = array("H", [frequencies[i] for i in kept])
+            else:
+                del self._postings[term]
+                del self._frequencies[term]
+                emptied.add(term)
+        if emptied:
+            self._vocabulary = [term for term in self._vocabulary if term not in emptied]
+        self._maybe_compact()
+
+    def _detach(self, key: str) -> int | None:
+        """Forget a document's key and length, returning its id if it was indexed."""
+        doc_id = self._doc_ids.pop(key, None)
+        if doc_id is None:
+            return None
+        self._keys[doc_id] = ""
+        self._total_length -= self._doc_lengths[doc_id]
+        self._doc_lengths[doc_id] = 0
+        return doc_id
+
+    def _maybe_compact(self) -> None:
+        """Renumber the documents once removed ones hold most of the ids."""
+        garbage = len(self._keys) - len(self._doc_ids)
+        if garbage >= _MIN_GARBAGE and garbage > len(self._doc_ids):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Give the indexed documents consecutive ids again, keeping their order."""
+        new_ids = array("I", bytes(4 * len(self._keys)))
+        # Ids are assigned on insertion, so ``_doc_ids`` is in id order.
+        for new_id, old_id in enumerate(self._doc_ids.values()):
+            new_ids[old_id] = new_id
+        self._doc_lengths = array("I", [self._doc_lengths[i] for i in self._doc_ids.values()])
+        self._doc_ids = {key: new_id for new_id, key in enumerate(self._doc_ids)}
+        self._keys = list(self._doc_ids)
+        for term, postings in self._postings.items():
+            self._postings[term] = array("I", [new_ids[doc_id] for doc_id in postings])
+        self._lookups.clear()
+        self._ranked.clear()
+
+    def search(self, text: str, limit: int = 10) -> list[str]:
+        """Find the documents best matching a free-text query.
+
+        A query token that is a prefix of more than 64 indexed words only
+        matches the token itself and the 64 of those words found in the most
+        documents.
+
+        Args:
+            text: The query; every token must match a word of the document,
+                either exactly or as its prefix.
+            limit: Maximum number of keys to return.
+
+        Returns:
+            Keys of the matching documents, best match first.
+        """
+        tokens = list(dict.fromkeys(tokenize(text)))
+        if not tokens or limit <= 0 or not self._doc_ids:
+            return []
+
+        groups = [self._expand(token) for token in tokens]
+        if not all(groups):
+            return []
+        keys = self._keys
+        if len(groups) == 1 and len(groups[0]) == 1:
+            return [keys[doc_id] for doc_id in self._ranked_postings(groups[0][0], limit)]
+
+        # Drive matching from the token with the fewest postings.
+        groups.sort(key=lambda terms: sum(len(self._postings[t]) for t in terms))
+        candidates: set[int] = set()
+        for position, terms in enumerate(groups):
+            matches = [self._term_frequencies(t).keys() for t in terms]
+            if not position:
+                candidates = set().union(*matches)
+            elif len(matches) == 1:
+                candidates &= matches[0]
+            else:
+                candidates &= set().union(*matches)
+            if not candidates:
+                return []
+
+        scores = self._score(candidates, [t for terms in groups for t in terms])
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [keys[doc_id] for doc_id, _ in best]
+
+    def _expand(self, token: str) -> list[str]:
+        """Indexed terms matched by a query token: itself and its extensions."""
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, token)
+        # Every term with the prefix sorts before the prefix with its last
+        # character incremented.
+        end = bisect_left(vocabulary, token[:-1] + chr(ord(token[-1]) + 1), start)
+        terms = vocabulary[start:end]
+        if len(terms) <= _MAX_EXPANSIONS:
+            return terms
+        postings = self._postings
+        return heapq.nlargest(
+            _MAX_EXPANSIONS, terms, key=lambda term: (term == token, len(postings[term]))
+        )
+
+    def _ranked_postings(self, term: str, limit: int) -> list[int]:
+        """The ``limit`` documents with the highest BM25 contribution of ``term``."""
+        runs = self._ranked.get(term)
+        if runs is None:
+            # Within one term the idf is shared, so only the saturated term
+            # frequency decides the order. For equal frequencies it falls with
+            # the document length whatever the average, so each run is sorted
+            # once; the stable sort keeps insertion order for equal lengths.
+            by_frequency: dict[int, list[int]] = {}
+            for doc_id, tf in zip(self._postings[term], self._frequencies[term], strict=True):
+                by_frequency.setdefault(tf, []).append(doc_id)
+            lengths = self._doc_lengths
+            runs = [
+                (tf, sorted(doc_ids, key=lengths.__getitem__))
+                for tf, doc_ids in by_frequency.items()
+            ]
+            _cache(self._ranked, term, runs)
+        if len(runs) == 1:
+            return runs[0][1][:limit]
+        scale = _K1 * _B / self._average_length()
+        scored = [self._contributions(tf, doc_ids, scale) for tf, doc_ids in runs]
+        return [doc_id for _, doc_id in islice(heapq.merge(*scored), limit)]
+
+    def _contributions(
+        self, tf: int, doc_ids: list[int], scale: float
+    ) -> Iterator[tuple[float, int]]:
+        """Negated saturated term frequency of each document in a run, with its id."""
+        base = _K1 * (1 - _B)
+        lengths = self._doc_lengths
+        for doc_id in doc_ids:
+            yield -tf / (tf + base + scale * lengths[doc_id]), doc_id
+
+    def _forget(self, term: str) -> None:
+        """Drop the cached query-time views of a term whose postings changed."""
+        if self._lookups:
+            self._lookups.pop(term, None)
+        if self._ranked:
+            self._ranked.pop(term, None)
+
+    def _average_length(self) -> float:
+        """Average number of tokens per indexed document."""
+        return self._total_length / len(self._doc_ids) or 1.0
+
+    def _term_frequencies(self, term: str) -> dict[int, int]:
+        """Map each document containing ``term`` to its term frequency."""
+        frequencies = self._lookups.get(term)
+        if frequencies is None:
+            frequencies = dict(zip(self._postings[term], self._frequencies[term], strict=True))
+            _cache(self._lookups, term, frequencies)
+        return frequencies
+
+    def _score(self, candidates: set[int], terms: Sequence[str]) -> dict[int, float]:
+        """BM25 score of each candidate over the given terms."""
+        count = len(self._doc_ids)
+        lengths = self._doc_lengths
+        scale = _K1 * _B / self._average_length()
+        base = _K1 * (1 - _B)
+        scores = dict.fromkeys(candidates, 0.0)
+        for term in terms:
+            frequencies = self._term_frequencies(term)
+            document_count = len(frequencies)
+            idf = math.log(1 + (count - document_count + 0.5) / (document_count + 0.5))
+            weight = idf * (_K1 + 1)
+            for doc_id in candidates:
+                tf = frequencies.get(doc_id)
+                if tf is not None:
+                    scores[doc_id] += weight * tf / (tf + base + scale * lengths[doc_id])
+        return scores
+
+
+def _cache(cache: dict[str, _V], term: str, value: _V) -> None:
+    """Store a per-term value, evicting the oldest entry once the cache is full."""
+    if len(cache) >= _CACHED_TERMS:
+        del cache[next(iter(cache))]
+    cache[term] = value
@@ -0,0 +1,865 @@
+"""Persistent storage backends for resources and learning progress."""
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager
+from datetime import datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Protocol
+
+from software_development_lessons.core.learning_tracker import (
+    LearningProgress,
+    LearningSession,
+    ProgressStatus,
+)
+from software_development_lessons.core.metrics import instrument
+from software_development_lessons.core.recommend import Recommendation, suggest, tag_forms
+from software_development_lessons.core.resource_manager import (
+    DifficultyLevel,
+    Resource,
+    ResourceCategory,
+)
+from software_development_lessons.core.rollups import Granularity, aggregate
+from software_development_lessons.core.search import tokenize
+from software_development_lessons.core.tags import normalize_prefix, normalize_tag
+
+
+class StorageBackend(Protocol):
+    """Interface for persisting resources and learning progress.
+
+    ``ResourceManager`` and ``LearningTracker`` accept any object implementing
+    this protocol and write every change through to it.
+    """
+
+    def transaction(self) -> AbstractContextManager[None]:
+        """Group the writes issued inside the returned context into one unit."""
+
+    def save_resource(self, resource: Resource) -> None:
+        """Insert a new resource.
+
+        Raises:
+            ValueError: If a resource with the same URL is already stored.
+        """
+
+    def delete_resource(self, url: str) -> bool:
+        """Delete a resource by URL, returning whether it existed."""
+
+    def iter_resources(self, category: ResourceCategory | None = None) -> Iterator[Resource]:
+        """Iterate over stored resources in insertion order."""
+
+    def count_resources(self) -> int:
+        """Count stored resources."""
+
+    def search_resources(self, text: str, limit: int = 10) -> list[Resource]:
+        """Full-text search like ``ResourceManager.search``, best match first."""
+
+    def suggest_tags(self, prefix: str, limit: int = 10) -> list[str]:
+        """Complete a partially typed tag like ``ResourceManager.suggest_tags``."""
+
+    def recommend_next(self, limit: int = 5) -> list[Recommendation]:
+        """Suggest resources to study next, like ``recommend.recommend_next``."""
+
+    def save_progress(self, progress: LearningProgress) -> None:
+        """Insert or update a progress record, excluding its sessions."""
+
+    def save_session(self, seq: int, session: LearningSession) -> None:
+        """Insert or update the session at position ``seq`` of its resource."""
+
+    def iter_progress(self) -> Iterator[LearningProgress]:
+        """Iterate over stored progress records with their sessions."""
+
+    def time_series(
+        self,
+        granularity: Granularity | str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        category: ResourceCategory | None = None,
+    ) -> list[tuple[datetime, timedelta]]:
+        """Get time spent learning per bucket, like ``LearningTracker.time_series``."""
+
+    def progress_statistics(self) -> dict[str, Any]:
+        """Compute the same statistics as ``LearningTracker.get_statistics``."""
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    category TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    description TEXT NOT NULL,
+    tags TEXT,
+    is_free INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_resources_category ON resources (category);
+CREATE INDEX IF NOT EXISTS idx_resources_difficulty ON resources (difficulty);
+
+CREATE TABLE IF NOT EXISTS resource_tags (
+    resource_id INTEGER NOT NULL REFERENCES resources (id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (resource_id, tag)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_resource_tags_tag ON resource_tags (tag, resource_id);
+
+-- Resources carrying each tag spelling, under its normalized form, for
+-- completing tags without reading every resource_tags row.
+CREATE TABLE IF NOT EXISTS tag_spellings (
+    form TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    uses INTEGER NOT NULL,
+    PRIMARY KEY (form, tag)
+) WITHOUT ROWID;
+
+-- Recommendation statistics by normalized tag, as kept by Recommender: the
+-- resources carrying it by category and difficulty rank, their number, and
+-- how many of them also carry each other tag.
+CREATE TABLE IF NOT EXISTS tag_postings (
+    form TEXT NOT NULL,
+    category TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    resource_id INTEGER NOT NULL,
+    PRIMARY KEY (form, category, rank, resource_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS tag_counts (
+    form TEXT PRIMARY KEY,
+    resources INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS tag_pairs (
+    form TEXT NOT NULL,
+    other TEXT NOT NULL,
+    resources INTEGER NOT NULL,
+    PRIMARY KEY (form, other)
+) WITHOUT ROWID;
+
+-- Contentless full-text index of titles, descriptions and tags, keyed by
+-- resource id; the triggers keep it in step with the resources table.
+CREATE VIRTUAL TABLE IF NOT EXISTS resources_fts USING fts5 (
+    title, description, tags,
+    content = '',
+    tokenize = "unicode61 remove_diacritics 0 tokenchars '_'"
+);
+CREATE TRIGGER IF NOT EXISTS resources_fts_insert AFTER INSERT ON resources BEGIN
+    INSERT INTO resources_fts (rowid, title, description, tags)
+    VALUES (new.id, new.title, new.description,
+            (SELECT group_concat(value, ' ') FROM json_each(new.tags)));
+END;
+CREATE TRIGGER IF NOT EXISTS resources_fts_delete AFTER DELETE ON resources BEGIN
+    INSERT INTO resources_fts (resources_fts, rowid, title, description, tags)
+    VALUES ('delete', old.id, old.title, old.description,
+            (SELECT group_concat(value, ' ') FROM json_each(old.tags)));
+END;
+
+CREATE TABLE IF NOT EXISTS progress (
+    resource_url TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    completion_percentage INTEGER NOT NULL,
+    started_at REAL,
+    completed_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_progress_status ON progress (status);
+
+CREATE TABLE IF NOT EXISTS sessions (
+    resource_url TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    start_time REAL NOT NULL,
+    end_time REAL,
+    notes TEXT NOT NULL,
+    PRIMARY KEY (resource_url, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_sessions_open ON sessions (resource_url) WHERE end_time IS NULL;
+
+CREATE TABLE IF NOT EXISTS session_rollups (
+    granularity TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    category TEXT NOT NULL,
+    micros INTEGER NOT NULL,
+    PRIMARY KEY (granularity, bucket, category)
+) WITHOUT ROWID;
+"""
+
+# Statements are kept as module constants so sqlite3's statement cache reuses
+# the prepared form on every call.
+_INSERT_RESOURCE = (
+    "INSERT INTO resources (url, title, category, difficulty, description, tags, is_free) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?) RETURNING id"
+)
+_INSERT_TAG = "INSERT OR IGNORE INTO resource_tags (resource_id, tag) VALUES (?, ?)"
+_DELETE_RESOURCE = "DELETE FROM resources WHERE url = ?"
+_SELECT_RESOURCES = (
+    "SELECT id, title, url, category, difficulty, description, tags, is_free FROM resources"
+)
+# FTS5 ranks with BM25 by default; ties keep insertion order as in memory.
+_SEARCH_RESOURCES = (
+    "SELECT id, title, url, category, difficulty, description, tags, is_free FROM resources "
+    "JOIN (SELECT rowid AS hit, rank FROM resources_fts WHERE resources_fts MATCH ? "
+    "ORDER BY rank, rowid LIMIT ?) ON hit = id ORDER BY rank, id"
+)
+_SELECT_RESOURCE = (
+    "SELECT id, title, url, category, difficulty, description, tags, is_free FROM resources "
+    "WHERE url = ?"
+)
+_SELECT_COMPLETED = (
+    "SELECT id, title, url, category, difficulty, description, tags, is_free FROM resources "
+    "WHERE url IN (SELECT resource_url FROM progress WHERE status = ?) ORDER BY id"
+)
+_SELECT_INDEXED = "SELECT id, category, difficulty FROM resources WHERE url = ?"
+_SELECT_TAGS = "SELECT tag FROM resource_tags WHERE resource_id = ?"
+_ADD_TAG_USES = (
+    "INSERT INTO tag_spellings (form, tag, uses) VALUES (?, ?, ?) "
+    "ON CONFLICT (form, tag) DO UPDATE SET uses = uses + excluded.uses"
+)
+_DROP_UNUSED_TAG = "DELETE FROM tag_spellings WHERE form = ? AND tag = ? AND uses <= 0"
+_ADD_POSTING = "INSERT INTO tag_postings (form, category, rank, resource_id) VALUES (?, ?, ?, ?)"
+_DELETE_POSTING = (
+    "DELETE FROM tag_postings WHERE form = ? AND category = ? AND rank = ? AND resource_id = ?"
+)
+_ADD_TAG_COUNT = (
+    "INSERT INTO tag_counts (form, resources) VALUES (?, ?) "
+    "ON CONFLICT (form) DO UPDATE SET resources = resources + excluded.resources"
+)
+_DROP_UNUSED_COUNT = "DELETE FROM tag_counts WHERE form = ? AND resources <= 0"
+_ADD_TAG_PAIR = (
+    "INSERT INTO tag_pairs (form, other, resources) VALUES (?, ?, ?) "
+    "ON CONFLICT (form, other) DO UPDATE SET resources = resources + excluded.resources"
+)
+_DROP_UNUSED_PAIR = "DELETE FROM tag_pairs WHERE form = ? AND other = ? AND resources <= 0"
+_SELECT_TAG_COUNTS = (
+    "SELECT form, resources FROM tag_counts WHERE form IN (SELECT value FROM json_each(?))"
+)
+_SELECT_RELATED_TAGS = "SELECT other, resources FROM tag_pairs WHERE form = ?"
+_SELECT_NEWEST_TAGGED = (
+    "SELECT url FROM tag_postings JOIN resources ON id = resource_id "
+    "WHERE form = ? AND tag_postings.category = ? AND rank = ? "
+    "ORDER BY resource_id DESC LIMIT ?"
+)
+_TAG_TABLES = ("tag_spellings", "tag_postings", "tag_counts", "tag_pairs")
+# Forms under a prefix, most used first, each with its most used spelling.
+_SUGGEST_TAGS = (
+    "SELECT (SELECT tag FROM tag_spellings AS s WHERE s.form = t.form "
+    "ORDER BY uses DESC, tag LIMIT 1) "
+    "FROM (SELECT form, SUM(uses) AS total FROM tag_spellings WHERE form >= ? AND form < ? "
+    "GROUP BY form ORDER BY total DESC, form LIMIT ?) AS t ORDER BY total DESC, form"
+)
+_BACKFILL_SEARCH = (
+    "INSERT INTO resources_fts (rowid, title, description, tags) "
+    "SELECT id, title, description, (SELECT group_concat(value, ' ') FROM json_each(tags)) "
+    "FROM resources"
+)
+_UPSERT_PROGRESS = (
+    "INSERT INTO progress (resource_url, status, completion_percentage, started_at, completed_at) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (resource_url) DO UPDATE SET status = excluded.status, "
+    "completion_percentage = excluded.completion_percentage, "
+    "started_at = excluded.started_at, completed_at = excluded.completed_at"
+)
+_UPSERT_SESSION = (
+    "INSERT OR REPLACE INTO sessions (resource_url, seq, start_time, end_time, notes) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_SELECT_PROGRESS = (
+    "SELECT resource_url, status, completion_percentage, started_at, completed_at "
+    "FROM progress ORDER BY rowid"
+)
+_SELECT_SESSIONS = (
+    "SELECT resource_url, start_time, end_time, notes FROM sessions ORDER BY resource_url, seq"
+)
+_SELECT_SESSION = "SELECT start_time, end_time FROM sessions WHERE resource_url = ? AND seq = ?"
+_SELECT_CLOSED_SESSIONS = (
+    "SELECT start_time, end_time FROM sessions WHERE resource_url = ? AND end_time IS NOT NULL"
+)
+_SELECT_CATEGORY = "SELECT category FROM resources WHERE url = ?"
+_ADD_ROLLUP = (
+    "INSERT INTO session_rollups (granularity, bucket, category, micros) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (granularity, bucket, category) DO UPDATE SET micros = micros + excluded.micros"
+)
+_RANKS = {level.value: level.rank for level in DifficultyLevel}
+# Rollup category of sessions whose resource is not in the catalog.
+_UNCATALOGED = ""
+
+_FETCH_SIZE = 512
+
+
+@instrument
+class SQLiteStorage:
+    """SQLite-backed storage using only the standard library.
+
+    The database runs in WAL mode so readers never block the single writer,
+    and every write outside an explicit ``transaction()`` commits on its own.
+    The connection may be shared between threads: a re-entrant lock is held
+    for the duration of each transaction and around every query, so one
+    thread's transaction never interleaves with another's statements.
+
+    Titles, descriptions and tags are indexed for full-text search with
+    SQLite's FTS5, and the tags of every resource are counted under their
+    normalized forms as resources are added and deleted, together with the
+    tag co-occurrences and postings ``Recommender`` keeps in memory, so
+    ``search_resources``, ``suggest_tags`` and ``recommend_next`` answer
+    from those tables without loading the catalog.
+
+    Completed sessions are also rolled up into hour, day and week buckets per
+    resource category as they are written, and moved between categories when
+    a resource is added or deleted, so ``time_series`` reads bucket totals
+    instead of rescanning sessions.
+
+    Examples:
+        >>> storage = SQLiteStorage(":memory:")
+        >>> storage.count_resources()
+        0
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Open (and if needed create) the database at ``path``.
+
+        Args:
+            path: Database file path, or ``":memory:"`` for a private
+                in-memory database.
+        """
+        if isinstance(path, Path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; transactions are managed explicitly below.
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        tables = {
+            name
+            for (name,) in self._conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        self._conn.executescript(_SCHEMA)
+        self._depth = 0
+        # Fill tables added to the schema after the database was created.
+        if "resources_fts" not in tables:
+            with self.transaction():
+                self._conn.execute(_BACKFILL_SEARCH)
+        if not tables.issuperset(_TAG_TABLES):
+            self._backfill_tags()
+        if "session_rollups" not in tables:
+            self._backfill_rollups()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run the enclosed writes in a single transaction.
+
+        Transactions nest; only the outermost one commits or rolls back.
+
+        Yields:
+            None.
+        """
+        with self._lock:
+            if self._depth == 0:
+                self._conn.execute("BEGIN")
+            self._depth += 1
+            try:
+                yield
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._conn.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                self._conn.execute("COMMIT")
+
+    def save_resource(self, resource: Resource) -> None:
+        """Insert a new resource.
+
+        Args:
+            resource: The resource to store.
+
+        Raises:
+            ValueError: If a resource with the same URL is already stored.
+        """
+        with self.transaction():
+            try:
+                cursor = self._conn.execute(
+                    _INSERT_RESOURCE,
+                    (
+                        resource.url,
+                        resource.title,
+                        resource.category.value,
+                        resource.difficulty.value,
+                        resource.description,
+                        json.dumps(resource.tags) if resource.tags is not None else None,
+                        int(resource.is_free),
+                    ),
+                )
+            except sqlite3.IntegrityError as e:
+                msg = f"Resource with URL {resource.url} already exists"
+                raise ValueError(msg) from e
+            (resource_id,) = cursor.fetchone()
+            if resource.tags:
+                tags = list(dict.fromkeys(resource.tags))
+                self._conn.executemany(_INSERT_TAG, ((resource_id, tag) for tag in tags))
+                self._index_tags(
+                    resource_id, resource.category.value, resource.difficulty.rank, tags
+                )
+            self._move_rollups(resource.url, _UNCATALOGED, resource.category.value)
+
+    def delete_resource(self, url: str) -> bool:
+        """Delete a resource by URL.
+
+        Args:
+            url: The URL of the resource to delete.
+
+        Returns:
+            True if the resource existed.
+        """
+        with self.transaction():
+            row = self._conn.execute(_SELECT_INDEXED, (url,)).fetchone()
+            if row is None:
+                return False
+            resource_id, category, difficulty = row
+            tags = [tag for (tag,) in self._conn.execute(_SELECT_TAGS, (resource_id,))]
+            self._conn.execute(_DELETE_RESOURCE, (url,))
+            self._index_tags(resource_id, category, _RANKS[difficulty], tags, sign=-1)
+            self._move_rollups(url, category, _UNCATALOGED)
+            return True
+
+    def iter_resources(self, category: ResourceCategory | None = None) -> Iterator[Resource]:
+        """Lazily iterate over stored resources in insertion order.
+
+        Args:
+            category: Optional category to filter by, served from its index.
+
+        Yields:
+            Stored resources.
+        """
+        for _row_id, resource in self.page_resources(category):
+            yield resource
+
+    def page_resources(
+        self,
+        category: ResourceCategory | None = None,
+        *,
+        after: int = 0,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[tuple[int, Resource]]:
+        """Lazily iterate over one page of stored resources in insertion order.
+
+        Pages are keyed on the row id: passing the id of the last row of one
+        page as ``after`` starts the next page from the primary key index,
+        so deep pages cost the same as the first. ``offset`` still skips
+        rows one by one.
+
+        Args:
+            category: Optional category to filter by, served from its index.
+            after: Only return resources stored after the row with this id.
+            offset: Number of matching resources to skip.
+            limit: Maximum number of resources to return; None for all.
+
+        Yields:
+            Tuples of each resource's row id and the resource.
+
+        Raises:
+            ValueError: If offset or limit is negative.
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            msg = "Offset and limit cannot be negative"
+            raise ValueError(msg)
+        where = "WHERE id > ?"
+        params: list[int | str] = [after]
+        if category is not None:
+            where += " AND category = ?"
+            params.append(category.value)
+        sql = f"{_SELECT_RESOURCES} {where} ORDER BY id LIMIT ? OFFSET ?"
+        params += [-1 if limit is None else limit, offset]
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+        while True:
+            # Fetch in batches so the lock is never held across a yield.
+            with self._lock:
+                rows = cursor.fetchmany(_FETCH_SIZE)
+            if not rows:
+                return
+            for row in rows:
+                yield row[0], _to_resource(row)
+
+    def count_resources(self) -> int:
+        """Count stored resources.
+
+        Returns:
+            The number of stored resources.
+        """
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM resources").fetchone()
+        return int(count)
+
+    def search_resources(self, text: str, limit: int = 10) -> list[Resource]:
+        """Full-text search over titles, descriptions and tags.
+
+        Resources match as in ``ResourceManager.search``: every word of
+        ``text`` must occur, either exactly or as the start of a longer word.
+        They are ranked with FTS5's BM25, which scores prefixes and rare
+        words slightly differently, so close matches may be ordered
+        differently. Only the matching rows are read.
+
+        Args:
+            text: The search text.
+            limit: Maximum number of resources to return.
+
+        Returns:
+            Matching resources, best match first.
+
+        Raises:
+            ValueError: If limit is negative.
+        """
+        if limit < 0:
+            msg = "Limit cannot be negative"
+            raise ValueError(msg)
+        # Tokens are runs of word characters, so quoting them is enough to
+        # keep FTS5 from reading them as query syntax.
+        query = " ".join(f'"{token}"*' for token in dict.fromkeys(tokenize(text)))
+        if not query or not limit:
+            return []
+        with self._lock:
+            rows = self._conn.execute(_SEARCH_RESOURCES, (query, limit)).fetchall()
+        return [_to_resource(row) for row in rows]
+
+    def suggest_tags(self, prefix: str, limit: int = 10) -> list[str]:
+        """Complete a partially typed tag.
+
+        Case and separators are ignored, as in ``ResourceManager.suggest_tags``;
+        only the counts of the tags under the prefix are read.
+
+        Args:
+            prefix: The start of a tag.
+            limit: Maximum number of suggestions.
+
+        Returns:
+            The most used spelling of each completion, the first in code point
+            order on a tie, most used tags first.
+
+        Raises:
+            ValueError: If limit is negative.
+        """
+        if limit < 0:
+            msg = "Limit cannot be negative"
+            raise ValueError(msg)
+        form = normalize_prefix(prefix)
+        with self._lock:
+            rows = self._conn.execute(_SUGGEST_TAGS, (form, form + "\U0010ffff", limit))
+            return [tag for (tag,) in rows]
+
+    def recommend_next(self, limit: int = 5) -> list[Recommendation]:
+        """Suggest resources to study next from the stored progress.
+
+        Suggestions are scored as by ``recommend.recommend_next`` over a
+        manager and tracker loaded from this store, but only the statistics
+        of the completed resources' tags and the candidates they lead to are
+        read. Progress records are matched to resources by exact URL.
+
+        Args:
+            limit: Maximum number of suggestions.
+
+        Returns:
+            The suggestions, best first.
+
+        Raises:
+            ValueError: If limit is negative.
+        """
+        if limit < 0:
+            msg = "Limit cannot be negative"
+            raise ValueError(msg)
+        with self._lock:
+            completed = [
+                _to_resource(row)
+                for row in self._conn.execute(_SELECT_COMPLETED, (ProgressStatus.COMPLETED.value,))
+            ]
+            started = {url for (url,) in self._conn.execute("SELECT resource_url FROM progress")}
+            suggestions = suggest(_StoredTags(self._conn), completed, exclude=started, limit=limit)
+            return [
+                Recommendation(
+                    _to_resource(self._conn.execute(_SELECT_RESOURCE, (url,)).fetchone()),
+                    score,
+                    tags,
+                )
+                for url, score, tags in suggestions
+            ]
+
+    def save_progress(self, progress: LearningProgress) -> None:
+        """Insert or update a progress record, excluding its sessions.
+
+        Args:
+            progress: The progress record to store.
+        """
+        with self.transaction():
+            self._conn.execute(
+                _UPSERT_PROGRESS,
+                (
+                    progress.resource_url,
+                    progress.status.value,
+                    progress.completion_percentage,
+                    _to_epoch(progress.started_at),
+                    _to_epoch(progress.completed_at),
+                ),
+            )
+
+    def save_session(self, seq: int, session: LearningSession) -> None:
+        """Insert or update a learning session.
+
+        Args:
+            seq: Position of the session within its resource's sessions.
+            session: The session to store.
+        """
+        url = session.resource_url
+        start, end = session.start_time.timestamp(), _to_epoch(session.end_time)
+        with self.transaction():
+            old = self._conn.execute(_SELECT_SESSION, (url, seq)).fetchone()
+            self._conn.execute(_UPSERT_SESSION, (url, seq, start, end, session.notes))
+            # Roll up only the change in closed time, e.g. a session completing.
+            old_closed = old is not None and old[1] is not None
+            if old == (start, end) or not (old_closed or end is not None):
+                return
+            category = self._category(url)
+            if old_closed:
+                self._roll_up(category, *old, sign=-1)
+            if end is not None:
+                self._roll_up(category, start, end)
+
+    def iter_progress(self) -> Iterator[LearningProgress]:
+        """Iterate over stored progress records with their sessions.
+
+        Yields:
+            Stored progress records.
+        """
+        with self._lock:
+            session_rows = self._conn.execute(_SELECT_SESSIONS).fetchall()
+            progress_rows = self._conn.execute(_SELECT_PROGRESS).fetchall()
+        sessions: dict[str, list[LearningSession]] = {}
+        for resource_url, start_time, end_time, notes in session_rows:
+            sessions.setdefault(resource_url, []).append(
+                LearningSession(
+                    resource_url=resource_url,
+                    start_time=datetime.fromtimestamp(start_time),
+                    end_time=_from_epoch(end_time),
+                    notes=notes,
+                )
+            )
+        for url, status, percentage, started_at, completed_at in progress_rows:
+            yield LearningProgress(
+                resource_url=url,
+                status=ProgressStatus(status),
+                completion_percentage=percentage,
+                sessions=sessions.get(url, []),
+                started_at=_from_epoch(started_at),
+                completed_at=_from_epoch(completed_at),
+            )
+
+    def time_series(
+        self,
+        granularity: Granularity | str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        category: ResourceCategory | None = None,
+    ) -> list[tuple[datetime, timedelta]]:
+        """Get time spent learning per hour, day or week from the stored rollups.
+
+        Completed sessions are read as bucket totals, so the cost depends on
+        the number of buckets in range; only open sessions are read one by
+        one, and count up to now.
+
+        Args:
+            granularity: "hour", "day" or "week", or a ``Granularity``.
+            start: Only include buckets ending after this time.
+            end: Only include buckets starting before this time.
+            category: Only count resources in this category.
+
+        Returns:
+            ``(bucket start, time spent)`` pairs, oldest first, skipping
+            buckets with no time.
+
+        Raises:
+            ValueError: If the granularity is unknown.
+        """
+        granularity = Granularity(granularity)
+        sql = "SELECT bucket, SUM(micros) FROM session_rollups WHERE granularity = ?"
+        params = [granularity.value]
+        open_sql = "SELECT resource_url, start_time FROM sessions WHERE end_time IS NULL"
+        open_params = []
+        if start is not None:
+            sql += " AND bucket >= ?"
+            params.append(granularity.floor(start).isoformat())
+        if end is not None:
+            sql += " AND bucket < ?"
+            params.append(end.isoformat())
+        if category is not None:
+            sql += " AND category = ?"
+            params.append(category.value)
+            open_sql += " AND resource_url IN (SELECT url FROM resources WHERE category = ?)"
+            open_params.append(category.value)
+        with self._lock:
+            rows = self._conn.execute(f"{sql} GROUP BY bucket", params).fetchall()
+            open_rows = self._conn.execute(open_sql, open_params).fetchall()
+        totals = {datetime.fromisoformat(bucket): timedelta(microseconds=m) for bucket, m in rows}
+        now = datetime.now()
+        ongoing = ((url, datetime.fromtimestamp(started), now) for url, started in open_rows)
+        for bucket, spent in aggregate(ongoing, granularity, start, end):
+            totals[bucket] = totals.get(bucket, timedelta()) + spent
+        return [(bucket, spent) for bucket, spent in sorted(totals.items()) if spent]
+
+    def progress_statistics(self) -> dict[str, Any]:
+        """Compute learning statistics with aggregate queries.
+
+        Returns:
+            Dictionary with the same keys as ``LearningTracker.get_statistics``.
+        """
+        with self._lock:
+            return self._progress_statistics()
+
+    def _progress_statistics(self) -> dict[str, Any]:
+        """Run the statistics queries; the caller holds ``_lock``."""
+        total, completed, in_progress, average = self._conn.execute(
+            "SELECT COUNT(*), "
+            "COALESCE(SUM(status = ?), 0), "
+            "COALESCE(SUM(status = ?), 0), "
+            "COALESCE(AVG(completion_percentage), 0) FROM progress",
+            (ProgressStatus.COMPLETED.value, ProgressStatus.IN_PROGRESS.value),
+        ).fetchone()
+        (seconds,) = self._conn.execute(
+            "SELECT COALESCE(SUM(COALESCE(end_time, ?) - start_time), 0) FROM sessions",
+            (datetime.now().timestamp(),),
+        ).fetchone()
+        return {
+            "total_resources": total,
+            "completed": completed,
+            "in_progress": in_progress,
+            "average_completion": average,
+            "total_hours_spent": seconds / 3600,
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def _index_tags(
+        self, resource_id: int, category: str, rank: int, tags: list[str], *, sign: int = 1
+    ) -> None:
+        """Add (or with ``sign=-1`` remove) a resource's distinct tags in the tag statistics."""
+        spellings = [(form, tag, sign) for tag in tags if (form := normalize_tag(tag))]
+        forms = tag_forms(tags)
+        pairs = [(form, other, sign) for form in forms for other in forms if other != form]
+        postings = [(form, category, rank, resource_id) for form in forms]
+        self._conn.executemany(_ADD_TAG_USES, spellings)
+        self._conn.executemany(_ADD_TAG_COUNT, ((form, sign) for form in forms))
+        self._conn.executemany(_ADD_TAG_PAIR, pairs)
+        if sign > 0:
+            self._conn.executemany(_ADD_POSTING, postings)
+            return
+        self._conn.executemany(_DELETE_POSTING, postings)
+        self._conn.executemany(_DROP_UNUSED_TAG, (row[:2] for row in spellings))
+        self._conn.executemany(_DROP_UNUSED_COUNT, ((form,) for form in forms))
+        self._conn.executemany(_DROP_UNUSED_PAIR, (row[:2] for row in pairs))
+
+    def _backfill_tags(self) -> None:
+        """Rebuild the tag statistics of a database created without some of them."""
+        with self.transaction():
+            self._conn.execute("DELETE FROM tag_spellings")
+            self._conn.execute("DELETE FROM tag_postings")
+            self._conn.execute("DELETE FROM tag_counts")
+            self._conn.execute("DELETE FROM tag_pairs")
+            rows = self._conn.execute(
+                "SELECT r.id, r.category, r.difficulty, t.tag FROM resource_tags t "
+                "JOIN resources r ON r.id = t.resource_id ORDER BY t.resource_id"
+            ).fetchall()
+            for (resource_id, category, difficulty), group in groupby(rows, itemgetter(0, 1, 2)):
+                tags = [tag for *_, tag in group]
+                self._index_tags(resource_id, category, _RANKS[difficulty], tags)
+
+    def _category(self, url: str) -> str:
+        """Rollup category of a resource's sessions; the caller holds ``_lock``."""
+        row = self._conn.execute(_SELECT_CATEGORY, (url,)).fetchone()
+        return _UNCATALOGED if row is None else str(row[0])
+
+    def _roll_up(self, category: str, start: float, end: float, *, sign: int = 1) -> None:
+        """Add (or with ``sign=-1`` remove) a closed session's time in every granularity."""
+        start_time, end_time = datetime.fromtimestamp(start), datetime.fromtimestamp(end)
+        self._conn.executemany(
+            _ADD_ROLLUP,
+            (
+                (granularity.value, bucket.isoformat(), category, sign * micros)
+                for granularity in Granularity
+                for bucket, micros in granularity.split(start_time, end_time)
+            ),
+        )
+
+    def _move_rollups(self, url: str, old: str, new: str) -> None:
+        """Move a resource's closed session time between rollup categories."""
+        for start, end in self._conn.execute(_SELECT_CLOSED_SESSIONS, (url,)).fetchall():
+            self._roll_up(old, start, end, sign=-1)
+            self._roll_up(new, start, end)
+
+    def _backfill_rollups(self) -> None:
+        """Roll up every closed session of a database created without rollups."""
+        with self.transaction():
+            rows = self._conn.execute(
+                "SELECT s.start_time, s.end_time, COALESCE(r.category, ?) FROM sessions s "
+                "LEFT JOIN resources r ON r.url = s.resource_url WHERE s.end_time IS NOT NULL",
+                (_UNCATALOGED,),
+            ).fetchall()
+            for start, end, category in rows:
+                self._roll_up(category, start, end)
+
+
+class _StoredTags:
+    """The stored tag statistics as a ``recommend.TagIndex`` keyed by resource URL.
+
+    Reads go straight to the connection, so the caller holds the storage lock.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        """Read the tag statistics through ``conn``."""
+        self._conn = conn
+
+    def __len__(self) -> int:
+        """Number of stored resources."""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM resources").fetchone()
+        return int(count)
+
+    def tag_counts(self, forms: Iterable[str]) -> dict[str, int]:
+        """Resources tagged with each of ``forms``, omitting tags never used."""
+        return dict(self._conn.execute(_SELECT_TAG_COUNTS, (json.dumps(list(forms)),)))
+
+    def related_tags(self, form: str) -> Mapping[str, int]:
+        """Resources tagged with both ``form`` and each other tag."""
+        return dict(self._conn.execute(_SELECT_RELATED_TAGS, (form,)))
+
+    def newest_tagged(
+        self, form: str, category: ResourceCategory, rank: int, limit: int
+    ) -> Iterable[str]:
+        """URLs of the latest resources with a tag, category and difficulty rank, newest first."""
+        rows = self._conn.execute(_SELECT_NEWEST_TAGGED, (form, category.value, rank, limit))
+        return [url for (url,) in rows]
+
+
+def _to_resource(row: tuple[Any, ...]) -> Resource:
+    """Build a resource from a row selected as in ``_SELECT_RESOURCES``."""
+    _row_id, title, url, category, difficulty, description, tags, is_free = row
+    return Resource(
+        title=title,
+        url=url,
+        category=ResourceCategory(category),
+        difficulty=DifficultyLevel(difficulty),
+        description=description,
+        tags=json.loads(tags) if tags is not None else None,
+        is_free=bool(is_free),
+    )
+
+
+def _to_epoch(value: datetime | None) -> float | None:
+    """Convert an optional datetime to a POSIX timestamp."""
+    return value.timestamp() if value is not None else None
+
+
+def _from_epoch(value: float | None) -> datetime | None:
+    """Convert an optional POSIX timestamp back to a datetime."""
+    return datetime.fromtimestamp(value) if value is not None else None
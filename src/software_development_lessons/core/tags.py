@@ -0,0 +1,300 @@
+"""Tag dictionary with prefix completion and typo-tolerant lookup."""
+
+import heapq
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+
+_WORD = re.compile(r"[^\W_]+")
+# Tags are compared by their character trigrams, padded at both ends so that
+# short tags and word boundaries still produce grams.
+_GRAM = 3
+_PAD = " " * (_GRAM - 1)
+# Normalized tags shorter than these tolerate no typo and one typo respectively;
+# longer tags tolerate two.
+_EXACT_BELOW = 4
+_ONE_TYPO_BELOW = 8
+# Number of prefixes whose completions are kept between lookups.
+_CACHED_PREFIXES = 1024
+
+
+def normalize_tag(tag: str) -> str:
+    """Reduce a tag to the form used for matching.
+
+    Case is folded and runs of spaces, hyphens, underscores and other
+    punctuation become a single hyphen.
+
+    Args:
+        tag: The tag to normalize.
+
+    Returns:
+        The normalized tag, empty if it holds no letters or digits.
+
+    Examples:
+        >>> normalize_tag("Deep Learning")
+        'deep-learning'
+        >>> normalize_tag("deep_learning")
+        'deep-learning'
+    """
+    return "-".join(_WORD.findall(tag.casefold()))
+
+
+def normalize_prefix(prefix: str) -> str:
+    """Reduce a partially typed tag to the start of the normalized forms it completes.
+
+    A trailing separator is part of what was typed, so it is kept as a hyphen.
+
+    Args:
+        prefix: The start of a tag, in any spelling.
+
+    Returns:
+        The normalized prefix.
+
+    Examples:
+        >>> normalize_prefix("Deep L")
+        'deep-l'
+        >>> normalize_prefix("deep ")
+        'deep-'
+    """
+    form = normalize_tag(prefix)
+    if form and prefix[-1:] and not _WORD.match(prefix[-1].casefold()):
+        form += "-"
+    return form
+
+
+def max_typos(tag: str) -> int:
+    """Number of edits a normalized tag tolerates in fuzzy lookups.
+
+    Args:
+        tag: A normalized tag.
+
+    Returns:
+        0 for very short tags, 1 up to seven characters, 2 beyond.
+    """
+    if len(tag) < _EXACT_BELOW:
+        return 0
+    return 1 if len(tag) < _ONE_TYPO_BELOW else 2
+
+
+class TagDictionary:
+    """Incrementally maintained dictionary of the tags in use.
+
+    Every tag is stored under its normalized form (see ``normalize_tag``), so
+    spellings such as ``"Deep Learning"`` and ``"deep-learning"`` are one
+    entry; the entry remembers how often each spelling is used. The
+    normalized forms are kept sorted, so completions for a prefix are found
+    by bisection, and the ranked completions of recently typed prefixes are
+    cached until a tag under the prefix changes. Each form is also indexed by
+    its length and trigrams, so fuzzy lookups only compute edit distances for
+    forms of a reachable length sharing one of the query's rarest trigrams.
+
+    Examples:
+        >>> tags = TagDictionary()
+        >>> for tag in ("kubernetes", "deep-learning", "Deep Learning", "devops"):
+        ...     tags.add(tag)
+        >>> tags.suggest("de")
+        ['deep-learning', 'devops']
+        >>> tags.lookup("kubernets")
+        ['kubernetes']
+        >>> tags.lookup("deep learning")
+        ['deep-learning', 'Deep Learning']
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty dictionary."""
+        # Normalized form -> spelling -> number of uses, and the total uses.
+        self._spellings: dict[str, Counter[str]] = {}
+        self._uses: dict[str, int] = {}
+        self._forms: list[str] = []
+        # Form length -> trigram -> forms containing it.
+        self._grams: dict[int, dict[str, set[str]]] = {}
+        # Prefix -> (limit, ranked completions) for recently typed prefixes.
+        self._completions: dict[str, tuple[int, list[str]]] = {}
+
+    def __len__(self) -> int:
+        """Number of distinct normalized tags."""
+        return len(self._forms)
+
+    def add(self, tag: str) -> None:
+        """Record one use of a tag.
+
+        Args:
+            tag: The tag as spelled on a resource.
+        """
+        form = normalize_tag(tag)
+        if not form:
+            return
+        spellings = self._spellings.get(form)
+        if spellings is None:
+            spellings = self._spellings[form] = Counter()
+            insort(self._forms, form)
+            grams = self._grams.setdefault(len(form), {})
+            for gram in _grams(form):
+                grams.setdefault(gram, set()).add(form)
+        spellings[tag] += 1
+        self._uses[form] = self._uses.get(form, 0) + 1
+        self._forget(form)
+
+    def remove(self, tag: str) -> None:
+        """Forget one use of a tag, dropping it once no longer used.
+
+        Args:
+            tag: The tag as spelled on a resource.
+        """
+        form = normalize_tag(tag)
+        spellings = self._spellings.get(form)
+        if spellings is None or not spellings[tag]:
+            return
+        self._forget(form)
+        spellings[tag] -= 1
+        self._uses[form] -= 1
+        if spellings[tag]:
+            return
+        del spellings[tag]
+        if spellings:
+            return
+        del self._spellings[form]
+        del self._uses[form]
+        del self._forms[bisect_left(self._forms, form)]
+        grams = self._grams[len(form)]
+        for gram in _grams(form):
+            forms = grams[gram]
+            forms.remove(form)
+            if not forms:
+                del grams[gram]
+        if not grams:
+            del self._grams[len(form)]
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[str]:
+        """Complete a partially typed tag.
+
+        Args:
+            prefix: The start of a tag, in any spelling.
+            limit: Maximum number of suggestions.
+
+        Returns:
+            The most used spelling of each completion, most used tags first.
+        """
+        # "deep " completes to "deep-learning" but not to "deepmind".
+        form = normalize_prefix(prefix)
+        cached = self._completions.get(form)
+        if cached is not None and cached[0] >= limit:
+            return cached[1][:limit]
+
+        forms = self._forms
+        start = bisect_left(forms, form)
+        end = bisect_left(forms, form + "\U0010ffff", lo=start)
+        completions = forms[start:end]
+        if len(completions) > limit:
+            completions = heapq.nsmallest(limit, completions, key=self._popularity)
+        else:
+            completions.sort(key=self._popularity)
+        suggestions = [self._spellings[c].most_common(1)[0][0] for c in completions]
+        if len(self._completions) >= _CACHED_PREFIXES:
+            del self._completions[next(iter(self._completions))]
+        self._completions[form] = (limit, suggestions)
+        return suggestions
+
+    def lookup(self, tag: str) -> list[str]:
+        """Find the tags matching a possibly misspelled tag.
+
+        Args:
+            tag: The tag to look up, in any spelling.
+
+        Returns:
+            Every known spelling of the matching tags, closest matches first,
+            then most used.
+        """
+        return [
+            spelling
+            for form in self.matches(tag)
+            for spelling, _ in self._spellings[form].most_common()
+        ]
+
+    def matches(self, tag: str) -> list[str]:
+        """Normalized forms within ``max_typos`` edits of a tag.
+
+        Args:
+            tag: The tag to look up, in any spelling.
+
+        Returns:
+            The matching normalized forms, closest first, then most used.
+        """
+        form = normalize_tag(tag)
+        if not form:
+            return []
+        typos = max_typos(form)
+        if not typos:
+            return [form] if form in self._spellings else []
+
+        # One edit changes at most _GRAM + 1 of the padded trigrams (a
+        # transposition touches two characters), so a form within k edits
+        # shares at least one of any k * (_GRAM + 1) + 1 distinct trigrams of
+        # the query. Candidates are drawn from the rarest ones.
+        indexed = [
+            self._grams[length]
+            for length in range(len(form) - typos, len(form) + typos + 1)
+            if length in self._grams
+        ]
+        grams = sorted(_grams(form), key=lambda g: sum(len(i.get(g, ())) for i in indexed))
+        probes = typos * (_GRAM + 1) + 1
+        candidates: set[str] = set()
+        if len(grams) < probes:
+            lengths = range(len(form) - typos, len(form) + typos + 1)
+            candidates.update(other for other in self._forms if len(other) in lengths)
+        for gram in grams[:probes]:
+            for grams_of_length in indexed:
+                candidates.update(grams_of_length.get(gram, ()))
+        found = []
+        for other in candidates:
+            distance = _edit_distance(form, other, typos)
+            if distance <= typos:
+                found.append((distance, self._popularity(other), other))
+        return [other for _, _, other in sorted(found)]
+
+    def _popularity(self, form: str) -> tuple[int, str]:
+        """Sort key ordering forms by descending use, then alphabetically."""
+        return -self._uses[form], form
+
+    def _forget(self, form: str) -> None:
+        """Drop the cached completions of every prefix of a changed form."""
+        if self._completions:
+            for end in range(len(form) + 1):
+                self._completions.pop(form[:end], None)
+
+
+def _grams(form: str) -> set[str]:
+    """Distinct padded character trigrams of a normalized tag."""
+    padded = f"{_PAD}{form}{_PAD}"
+    return {padded[i : i + _GRAM] for i in range(len(padded) - _GRAM + 1)}
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Edit distance between two strings, capped at ``limit + 1``.
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters each count as one edit (optimal string alignment). Only the
+    diagonal band of width ``2 * limit + 1`` is computed, and the computation
+    stops as soon as every cell in a row exceeds the limit.
+    """
+    if a == b:
+        return 0
+    beyond = limit + 1
+    before: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        low = max(1, i - limit)
+        high = min(len(b), i + limit)
+        current = [beyond] * (len(b) + 1)
+        current[0] = i if i <= limit else beyond
+        for j in range(low, high + 1):
+            distance = min(
+                previous[j - 1] + (char != b[j - 1]), previous[j] + 1, current[j - 1] + 1
+            )
+            if i > 1 and j > 1 and char == b[j - 2] and a[i - 2] == b[j - 1]:
+                distance = min(distance, before[j - 2] + 1)
+            current[j] = min(distance, beyond)
+        if min(current[max(0, low - 1) : high + 1]) > limit:
+            return beyond
+        before, previous = previous, current
+    return previous[len(b)]
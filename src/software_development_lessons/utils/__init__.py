@@ -1,5 +1,17 @@
 """Utility modules for Software Development Lessons."""
 
-from software_development_lessons.utils.helpers import format_duration, validate_url
+from software_development_lessons.utils.helpers import (
+    canonicalize_url,
+    canonicalize_urls,
+    format_duration,
+    validate_url,
+    validate_urls,
+)
 
-__all__ = ["format_duration", "validate_url"]
+__all__ = [
+    "canonicalize_url",
+    "canonicalize_urls",
+    "format_duration",
+    "validate_url",
+    "validate_urls",
+]
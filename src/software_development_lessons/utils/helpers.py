@@ -1,7 +1,23 @@
 """Helper utilities for the application."""
 
+import re
+from collections.abc import Iterable, Iterator
 from datetime import timedelta
-from urllib.parse import urlparse
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+# Splits an absolute http(s) URL into scheme, authority, path and query; the
+# fragment is matched but dropped. Compiled once and shared by every check.
+# It accepts what ``urlparse`` accepts as an http(s) URL with a host, once
+# the characters ``urlsplit`` ignores are removed (see ``_match``).
+_HTTP_URL = re.compile(
+    r"(?i:(https?))://([^/?#\t\r\n]+)([^?#\t\r\n]*)(\?[^#\t\r\n]*)?(?:#.*)?\Z", re.DOTALL
+)
+# ``urlsplit`` strips control characters and spaces from the start of a URL
+# and drops tabs and newlines anywhere in it.
+_LEADING_JUNK = "".join(map(chr, range(0x21)))
+_DROPPED = str.maketrans("", "", "\t\r\n")
+_DEFAULT_PORTS = {"http": ":80", "https": ":443"}
 
 
 def validate_url(url: str) -> bool:
@@ -19,11 +35,116 @@ def validate_url(url: str) -> bool:
         >>> validate_url("not-a-url")
         False
     """
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc]) and result.scheme in ("http", "https")
-    except (ValueError, AttributeError):
-        return False
+    return _match(url) is not None
+
+
+def validate_urls(urls: Iterable[str]) -> Iterator[bool]:
+    """Validate many URLs lazily.
+
+    Args:
+        urls: The URL strings to validate.
+
+    Returns:
+        Iterator yielding whether each URL is valid, in input order; like
+        ``validate_url``, anything but a string is invalid.
+
+    Examples:
+        >>> list(validate_urls(["https://example.com", "not-a-url", None]))
+        [True, False, False]
+    """
+    return map(validate_url, urls)
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL so equivalent spellings compare equal.
+
+    The scheme and host are lowercased, default ports and fragments are
+    dropped, an empty path becomes ``/`` and a trailing slash is removed
+    from any other path. The query string is kept as is.
+
+    Args:
+        url: The URL to normalize.
+
+    Returns:
+        The canonical form of the URL.
+
+    Raises:
+        ValueError: If the string is not a valid http(s) URL.
+
+    Examples:
+        >>> canonicalize_url("HTTPS://Example.com:443/x/#intro")
+        'https://example.com/x'
+    """
+    canonical = _canonicalize(url)
+    if canonical is None:
+        msg = f"Invalid URL: {url}"
+        raise ValueError(msg)
+    return canonical
+
+
+def canonicalize_urls(urls: Iterable[str]) -> Iterator[str | None]:
+    """Canonicalize many URLs lazily.
+
+    Hosts are normalized through a shared LRU cache, so large batches of
+    links to the same sites only lowercase each host once.
+
+    Args:
+        urls: The URLs to normalize.
+
+    Returns:
+        Iterator yielding the canonical form of each URL, or None for an
+        invalid one, in input order.
+
+    Examples:
+        >>> list(canonicalize_urls(["https://Example.com/x/", "not-a-url"]))
+        ['https://example.com/x', None]
+    """
+    return map(_canonicalize, urls)
+
+
+def _match(url: object) -> re.Match[str] | None:
+    """Split a URL with ``_HTTP_URL``, returning None if it is invalid."""
+    if not isinstance(url, str):
+        return None
+    match = _HTTP_URL.match(url)
+    if match is None:
+        cleaned = url.lstrip(_LEADING_JUNK).translate(_DROPPED)
+        if cleaned == url:
+            return None
+        match = _HTTP_URL.match(cleaned)
+        if match is None:
+            return None
+    authority = match[2]
+    if "[" in authority or "]" in authority or not authority.isascii():
+        # Leave the checks on IPv6 and internationalized hosts to urlsplit.
+        try:
+            urlsplit(match.string)
+        except ValueError:
+            return None
+    return match
+
+
+def _canonicalize(url: str) -> str | None:
+    """Canonicalize a URL, returning None if it is invalid."""
+    match = _match(url)
+    if match is None:
+        return None
+    scheme, authority, path, query = match.groups()
+    scheme = scheme.lower()
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/") or "/"
+    return f"{scheme}://{_canonical_authority(scheme, authority)}{path or '/'}{query or ''}"
+
+
+@lru_cache(maxsize=4096)
+def _canonical_authority(scheme: str, authority: str) -> str:
+    """Lowercase the host of an authority and drop the scheme's default port."""
+    userinfo, at, host = authority.rpartition("@")
+    host = host.lower().removesuffix(".")
+    default_port = _DEFAULT_PORTS[scheme]
+    if host.endswith(default_port):
+        host = host.removesuffix(default_port)
+    return f"{userinfo}{at}{host}"
 
 
 def format_duration(duration: timedelta) -> str:
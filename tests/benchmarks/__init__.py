@@ -0,0 +1 @@
+"""Benchmark tests for Software Development Lessons."""
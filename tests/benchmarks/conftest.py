@@ -0,0 +1,191 @@
+"""Shared fixtures for the benchmark suite: synthetic data, timing and baselines.
+
+Catalog and session sizes are parametrized from the environment:
+
+- ``SDL_BENCH_SIZES``: comma-separated catalog sizes (default ``1000,100000``).
+- ``SDL_BENCH_SESSION_SIZES``: comma-separated session counts (default ``100000``).
+
+Every measurement taken with the ``bench`` fixture is written to
+``SDL_BENCH_OUTPUT`` (default ``.benchmarks/results.json``) and compared with
+the stored ``baseline.json`` next to this file. A measurement more than
+``SDL_BENCH_TOLERANCE`` (default 0.5, i.e. 50%) slower than its baseline fails
+its test. Set ``SDL_BENCH_UPDATE_BASELINE=1`` to record a new baseline instead.
+"""
+
+import json
+import os
+import platform
+import statistics
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from software_development_lessons.core import LearningTracker
+from software_development_lessons.core.resource_manager import Resource
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+OUTPUT_PATH = Path(os.environ.get("SDL_BENCH_OUTPUT", ".benchmarks/results.json"))
+TOLERANCE = float(os.environ.get("SDL_BENCH_TOLERANCE", "0.5"))
+UPDATE_BASELINE = os.environ.get("SDL_BENCH_UPDATE_BASELINE") == "1"
+
+
+def _sizes(name: str, default: str) -> list[int]:
+    """Parse a comma-separated list of sizes from the environment."""
+    return [int(size) for size in os.environ.get(name, default).split(",") if size.strip()]
+
+
+CATALOG_SIZES = _sizes("SDL_BENCH_SIZES", "1000,100000")
+SESSION_SIZES = _sizes("SDL_BENCH_SESSION_SIZES", "100000")
+
+# Measurements of the whole run, keyed by ``<test id>::<label>``.
+_results: dict[str, dict[str, float]] = {}
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize ``catalog_size`` and ``session_count`` from the environment."""
+    if "catalog_size" in metafunc.fixturenames:
+        metafunc.parametrize("catalog_size", CATALOG_SIZES, ids=_size_id)
+    if "session_count" in metafunc.fixturenames:
+        metafunc.parametrize("session_count", SESSION_SIZES, ids=_size_id)
+
+
+def _size_id(size: int) -> str:
+    """Short test id for a size, e.g. ``100k`` or ``1M``."""
+    for divisor, suffix in ((1_000_000, "M"), (1_000, "k")):
+        if size >= divisor and size % divisor == 0:
+            return f"{size // divisor}{suffix}"
+    return str(size)
+
+
+def synthetic_resources(templates: list[Resource], count: int) -> Iterator[Resource]:
+    """Generate ``count`` distinct resources by varying the template resources.
+
+    Args:
+        templates: Resources to copy category, difficulty and tags from.
+        count: Number of resources to generate.
+
+    Yields:
+        Resources with unique URLs and titles.
+    """
+    for i in range(count):
+        template = templates[i % len(templates)]
+        yield Resource(
+            title=f"{template.title} {i}",
+            url=f"{template.url.rstrip('/')}/{i}",
+            category=template.category,
+            difficulty=template.difficulty,
+            description=template.description,
+            tags=[*(template.tags or ()), f"topic-{i % 1000}"],
+            is_free=i % 3 != 0,
+        )
+
+
+_catalogs: dict[int, list[Resource]] = {}
+
+
+@pytest.fixture
+def catalog(sample_resources: list[Resource], catalog_size: int) -> list[Resource]:
+    """Synthetic catalog of ``catalog_size`` resources, built once per size."""
+    if catalog_size not in _catalogs:
+        _catalogs[catalog_size] = list(synthetic_resources(sample_resources, catalog_size))
+    return _catalogs[catalog_size]
+
+
+@pytest.fixture
+def tracker_with_sessions(sample_resources: list[Resource], session_count: int) -> LearningTracker:
+    """Tracker holding ``session_count`` completed sessions over the sample resources."""
+    tracker = LearningTracker()
+    urls = [resource.url for resource in synthetic_resources(sample_resources, 1000)]
+    for i in range(session_count):
+        tracker.start_learning(urls[i % len(urls)]).complete()
+    for i, url in enumerate(urls):
+        tracker.update_progress(url, i % 101)
+    return tracker
+
+
+@dataclass
+class Measurement:
+    """Timing of one benchmarked operation.
+
+    Attributes:
+        median: Median seconds per round.
+        operations: Operations performed per round.
+    """
+
+    median: float
+    operations: int
+
+    @property
+    def per_operation(self) -> float:
+        """Median seconds per operation."""
+        return self.median / self.operations
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest) -> Callable[..., Measurement]:
+    """Time a callable, record the result and check it against the baseline.
+
+    The returned function takes a label, the callable, and optionally the
+    number of ``rounds`` to time and the ``operations`` each round performs.
+    """
+    baseline = _load(BASELINE_PATH).get("results", {})
+
+    def measure(
+        label: str, func: Callable[[], object], *, rounds: int = 5, operations: int = 1
+    ) -> Measurement:
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        measurement = Measurement(statistics.median(timings), operations)
+        key = f"{request.node.name}::{label}"
+        _results[key] = {"median_s": measurement.median, "operations": operations}
+        print(f"\n{key}: {measurement.per_operation * 1e6:,.2f} us/op ({rounds} rounds)")
+
+        expected = baseline.get(key)
+        if expected is not None and not UPDATE_BASELINE:
+            limit = expected["median_s"] * (1 + TOLERANCE)
+            assert measurement.median <= limit, (
+                f"{key} regressed: {measurement.median:.6f}s vs baseline "
+                f"{expected['median_s']:.6f}s (tolerance {TOLERANCE:.0%})"
+            )
+        return measurement
+
+    return measure
+
+
+def _load(path: Path) -> dict[str, Any]:
+    """Read a results file, or return an empty one if it does not exist."""
+    try:
+        with path.open(encoding="utf-8") as f:
+            return dict(json.load(f))
+    except FileNotFoundError:
+        return {}
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Write this run's measurements, and the baseline if asked to."""
+    if not _results:
+        return
+    report = {
+        "machine": {
+            "python": platform.python_version(),
+            "platform": f"{platform.system()}-{platform.machine()}",
+        },
+        "results": dict(sorted(_results.items())),
+    }
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    OUTPUT_PATH.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if UPDATE_BASELINE:
+        baseline = _load(BASELINE_PATH)
+        merged = {**baseline.get("results", {}), **_results}
+        report = {**report, "results": dict(sorted(merged.items()))}
+        BASELINE_PATH.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    reporter = session.config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is not None:
+        reporter.write_line(f"benchmark results written to {OUTPUT_PATH}")
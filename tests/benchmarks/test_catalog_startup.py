@@ -0,0 +1,63 @@
+"""Cold-start benchmark: parsing a JSON Lines catalog versus mapping a snapshot."""
+
+import os
+import time
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from software_development_lessons.core import ResourceManager
+from software_development_lessons.core.mapped_catalog import MappedCatalog
+from software_development_lessons.core.resource_manager import (
+    DifficultyLevel,
+    Resource,
+    ResourceCategory,
+)
+
+RESOURCE_COUNT = int(os.environ.get("SDL_BENCH_RESOURCES", "100000"))
+
+
+@pytest.mark.benchmark
+def test_catalog_startup(tmp_path: Path) -> None:
+    """Time from process start to the first URL and category lookup."""
+    categories = list(ResourceCategory)
+    levels = list(DifficultyLevel)
+    manager = ResourceManager()
+    for i in range(RESOURCE_COUNT):
+        manager.add_resource(
+            Resource(
+                title=f"Course {i}",
+                url=f"https://example.com/{i}",
+                category=categories[i % len(categories)],
+                difficulty=levels[i % len(levels)],
+                description=f"Description of course {i}",
+                tags=[f"tag-{i % 300}", "shared"],
+            )
+        )
+    jsonl_path = tmp_path / "catalog.jsonl"
+    snapshot_path = tmp_path / "catalog.sdlcat"
+    manager.export_jsonl(jsonl_path)
+    manager.export_snapshot(snapshot_path)
+    url = f"https://example.com/{RESOURCE_COUNT // 2}"
+
+    start = time.perf_counter()
+    loaded = ResourceManager()
+    loaded.import_jsonl(jsonl_path)
+    parsed = loaded.get_by_url(url)
+    jsonl_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with closing(MappedCatalog(snapshot_path)) as catalog:
+        mapped = catalog.get_by_url(url)
+        open_seconds = time.perf_counter() - start
+        first_category = catalog.get_by_category(ResourceCategory.WEB3)
+        category_seconds = time.perf_counter() - start - open_seconds
+
+    print(
+        f"\n{RESOURCE_COUNT} resources: JSON Lines import {jsonl_seconds * 1000:.1f} ms, "
+        f"snapshot open + URL lookup {open_seconds * 1000:.2f} ms, "
+        f"then get_by_category ({len(first_category)} rows) {category_seconds * 1000:.1f} ms"
+    )
+    assert mapped == parsed
+    assert open_seconds < jsonl_seconds
@@ -0,0 +1,84 @@
+"""Multi-threaded throughput benchmark for LearningTracker."""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from software_development_lessons.core import LearningTracker
+
+OPERATIONS = int(os.environ.get("SDL_BENCH_OPERATIONS", "20000"))
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+class _GloballyLockedTracker:
+    """Baseline: every call goes through one lock around the whole tracker."""
+
+    def __init__(self) -> None:
+        self._tracker = LearningTracker()
+        self._lock = threading.Lock()
+
+    def start_learning(self, url: str) -> None:
+        with self._lock:
+            self._tracker.start_learning(url).complete()
+
+    def update_progress(self, url: str, percentage: int) -> None:
+        with self._lock:
+            self._tracker.update_progress(url, percentage)
+
+    def get_statistics(self) -> dict[str, object]:
+        with self._lock:
+            return self._tracker.get_statistics()
+
+
+class _Tracker:
+    """The tracker under test, exposing the same calls as the baseline."""
+
+    def __init__(self) -> None:
+        self._tracker = LearningTracker()
+
+    def start_learning(self, url: str) -> None:
+        self._tracker.start_learning(url).complete()
+
+    def update_progress(self, url: str, percentage: int) -> None:
+        self._tracker.update_progress(url, percentage)
+
+    def get_statistics(self) -> dict[str, object]:
+        return self._tracker.get_statistics()
+
+
+def _run(tracker: _Tracker | _GloballyLockedTracker, threads: int) -> float:
+    """Run the workload on ``threads`` threads and return operations per second."""
+    per_thread = OPERATIONS // threads
+
+    def work(worker: int) -> None:
+        for i in range(per_thread):
+            url = f"https://example.com/{worker}/{i % 100}"
+            tracker.start_learning(url)
+            tracker.update_progress(url, i % 101)
+            if i % 100 == 0:
+                tracker.get_statistics()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(work, range(threads)))
+    elapsed = time.perf_counter() - start
+
+    assert tracker.get_statistics()["total_resources"] == threads * min(per_thread, 100)
+    return per_thread * threads / elapsed
+
+
+@pytest.mark.benchmark
+def test_tracker_thread_scaling() -> None:
+    """Compare per-record locking against a single global lock.
+
+    ``_run`` checks that no update is lost; throughput is reported, not
+    asserted, since it depends on the interpreter and the number of cores.
+    """
+    print(f"\n{'threads':>7} {'global lock ops/s':>18} {'per-record ops/s':>17}")
+    for threads in THREAD_COUNTS:
+        baseline = _run(_GloballyLockedTracker(), threads)
+        fine_grained = _run(_Tracker(), threads)
+        print(f"{threads:>7} {baseline:>18,.0f} {fine_grained:>17,.0f}")
@@ -0,0 +1,106 @@
+"""Baseline benchmarks for the ResourceManager, LearningTracker and CLI hot paths."""
+
+from collections.abc import Callable
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from software_development_lessons.cli import app
+from software_development_lessons.core import LearningTracker, ResourceManager
+from software_development_lessons.core.recommend import Recommender
+from software_development_lessons.core.resource_manager import (
+    DifficultyLevel,
+    Resource,
+    ResourceCategory,
+)
+from software_development_lessons.core.storage import SQLiteStorage
+from tests.benchmarks.conftest import Measurement
+
+Bench = Callable[..., Measurement]
+
+# Point lookups timed per round; enough to get stable per-call numbers.
+LOOKUPS = 1000
+
+
+def _manager(catalog: list[Resource]) -> ResourceManager:
+    """In-memory manager holding every resource of the catalog."""
+    manager = ResourceManager()
+    for resource in catalog:
+        manager.add_resource(resource)
+    return manager
+
+
+@pytest.mark.benchmark
+def test_add_resource(bench: Bench, catalog: list[Resource]) -> None:
+    """Time indexing a whole catalog into an empty manager."""
+    bench("add_resource", lambda: _manager(catalog), rounds=3, operations=len(catalog))
+
+
+@pytest.mark.benchmark
+def test_filters(bench: Bench, catalog: list[Resource]) -> None:
+    """Time the get_by_* filters and point lookups on a populated manager."""
+    manager = _manager(catalog)
+    urls = [catalog[i * len(catalog) // LOOKUPS].url for i in range(LOOKUPS)]
+
+    def lookups() -> None:
+        for url in urls:
+            manager.get_by_url(url)
+
+    bench("get_by_url", lookups, operations=len(urls))
+    bench("get_by_category", lambda: manager.get_by_category(ResourceCategory.AI_ML))
+    bench("get_by_difficulty", lambda: manager.get_by_difficulty(DifficultyLevel.BEGINNER))
+    bench("search_by_tag", lambda: manager.search_by_tag("devops"))
+    bench("get_free_resources", manager.get_free_resources)
+
+
+@pytest.mark.benchmark
+def test_recommend(bench: Bench, catalog: list[Resource]) -> None:
+    """Time building the recommendation index and serving suggestions from it."""
+    completed = [resource.url for resource in catalog[:: max(1, len(catalog) // 20)]]
+
+    def build() -> None:
+        recommender = Recommender()
+        for resource in catalog:
+            recommender.add(resource.url, resource)
+
+    bench("recommend_build", build, rounds=3, operations=len(catalog))
+    manager = _manager(catalog)
+    bench("recommend", lambda: manager.recommend(completed, limit=10), rounds=25)
+
+
+@pytest.mark.benchmark
+def test_export(bench: Bench, catalog: list[Resource], tmp_path: Path) -> None:
+    """Time exporting the catalog as JSON and as JSON Lines."""
+    manager = _manager(catalog)
+
+    bench("export_to_json", lambda: manager.export_to_json(tmp_path / "catalog.json"), rounds=3)
+    bench("export_jsonl", lambda: manager.export_jsonl(tmp_path / "catalog.jsonl"), rounds=3)
+
+
+@pytest.mark.benchmark
+def test_get_statistics(bench: Bench, tracker_with_sessions: LearningTracker) -> None:
+    """Time statistics and the daily series over a tracker with many sessions."""
+    tracker = tracker_with_sessions
+
+    bench("get_statistics", tracker.get_statistics, rounds=25)
+    bench("time_series_day", lambda: tracker.time_series("day"), rounds=25)
+
+
+@pytest.mark.benchmark
+def test_cli(bench: Bench, catalog: list[Resource], tmp_path: Path) -> None:
+    """Time CLI commands in-process against a SQLite catalog."""
+    db = tmp_path / "sdl.db"
+    with closing(SQLiteStorage(db)) as storage, storage.transaction():
+        for resource in catalog:
+            storage.save_resource(resource)
+    runner = CliRunner()
+
+    def invoke(*args: str) -> None:
+        result = runner.invoke(app, ["--db", str(db), *args])
+        assert result.exit_code == 0, result.output
+
+    bench("stats", lambda: invoke("stats"), rounds=3)
+    bench("list_resources_tsv", lambda: invoke("list-resources", "--format", "tsv"), rounds=3)
+    bench("search", lambda: invoke("search", "kubernetes guide"), rounds=3)
@@ -0,0 +1,67 @@
+"""Startup regression benchmark for the sdl CLI, based on ``python -X importtime``."""
+
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import software_development_lessons
+
+RUNS = int(os.environ.get("SDL_BENCH_RUNS", "5"))
+# Time the CLI may add on top of importing typer itself.
+BUDGET_MS = float(os.environ.get("SDL_BENCH_IMPORT_BUDGET_MS", "25"))
+# Modules that trivial commands such as ``sdl version`` must not load.
+HEAVY_MODULES = ("rich", "requests", "sqlite3", "software_development_lessons.core")
+
+_SRC = str(Path(software_development_lessons.__file__).parents[1])
+
+
+def _import_times(*args: str) -> tuple[list[str], float]:
+    """Run Python with ``-X importtime``.
+
+    Returns:
+        Every module imported, and the total milliseconds spent importing.
+    """
+    env = {**os.environ, "PYTHONPATH": _SRC}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    modules = []
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        modules.append(name.strip())
+        # Nested imports are indented; top-level ones already include them.
+        if not name[1:].startswith(" "):
+            total_us += int(cumulative)
+    return modules, total_us / 1000
+
+
+@pytest.mark.benchmark
+def test_cli_import_time(tmp_path: Path) -> None:
+    """Check that ``sdl version`` stays light and adds little on top of typer."""
+    db = tmp_path / "sdl.db"
+    cli_ms = []
+    typer_ms = []
+    for _ in range(RUNS):
+        modules, total = _import_times(
+            "-m", "software_development_lessons.cli", "--db", str(db), "version"
+        )
+        heavy = [name for name in modules if name.startswith(HEAVY_MODULES)]
+        assert not heavy, f"sdl version imported {heavy}"
+        cli_ms.append(total)
+        typer_ms.append(_import_times("-c", "import typer")[1])
+
+    cli = statistics.median(cli_ms)
+    baseline = statistics.median(typer_ms)
+    print(f"\nsdl version imports: {cli:.1f} ms (typer alone: {baseline:.1f} ms)")
+    assert cli <= baseline + BUDGET_MS
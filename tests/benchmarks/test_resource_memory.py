@@ -0,0 +1,96 @@
+"""Memory benchmark for catalog resources."""
+
+import json
+import os
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import pytest
+
+from software_development_lessons.core.resource_manager import (
+    DifficultyLevel,
+    Resource,
+    ResourceCategory,
+)
+
+RECORD_COUNT = int(os.environ.get("SDL_BENCH_RECORDS", "1000000"))
+TAG_POOL = [f"tag-{i}" for i in range(300)]
+
+
+@dataclass
+class _DictResource:
+    """Replica of the original ``__dict__``-based Resource dataclass."""
+
+    title: str
+    url: str
+    category: ResourceCategory
+    difficulty: DifficultyLevel
+    description: str
+    tags: list[str] | None = None
+    is_free: bool = True
+
+
+def _records(count: int) -> list[str]:
+    """Serialized records, so every parsed record gets its own tag strings."""
+    categories = list(ResourceCategory)
+    levels = list(DifficultyLevel)
+    return [
+        json.dumps(
+            {
+                "title": f"Course {i}",
+                "url": f"https://example.com/{i}",
+                "category": categories[i % len(categories)].value,
+                "difficulty": levels[i % len(levels)].value,
+                "description": "",
+                "tags": [TAG_POOL[(i * k) % len(TAG_POOL)] for k in (1, 7, 13)],
+            }
+        )
+        for i in range(count)
+    ]
+
+
+def _measure(build: Callable[[], object]) -> int:
+    """Return the bytes still allocated by the object ``build`` returns."""
+    tracemalloc.start()
+    try:
+        kept = build()
+        current, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return current
+
+
+@pytest.mark.benchmark
+def test_resource_memory() -> None:
+    """Compare per-record memory of the dict-based and the slotted Resource."""
+    records = _records(RECORD_COUNT)
+
+    def build_dict_resources() -> list[_DictResource]:
+        resources = []
+        for line in records:
+            data = json.loads(line)
+            resources.append(
+                _DictResource(
+                    title=data["title"],
+                    url=data["url"],
+                    category=ResourceCategory(data["category"]),
+                    difficulty=DifficultyLevel(data["difficulty"]),
+                    description=data["description"],
+                    tags=data["tags"],
+                )
+            )
+        return resources
+
+    def build_resources() -> list[Resource]:
+        return [Resource.from_dict(json.loads(line)) for line in records]
+
+    dict_bytes = _measure(build_dict_resources)
+    slotted_bytes = _measure(build_resources)
+
+    print(
+        f"\n{RECORD_COUNT} records: dataclass {dict_bytes / RECORD_COUNT:.1f} B/record, "
+        f"Resource {slotted_bytes / RECORD_COUNT:.1f} B/record"
+    )
+    assert slotted_bytes * 3 < dict_bytes * 2
@@ -0,0 +1,73 @@
+"""Query latency benchmark for full-text search."""
+
+import os
+import statistics
+import time
+
+import pytest
+
+from software_development_lessons.core import ResourceManager
+from software_development_lessons.core.resource_manager import (
+    DifficultyLevel,
+    Resource,
+    ResourceCategory,
+)
+
+RESOURCE_COUNT = int(os.environ.get("SDL_BENCH_RESOURCES", "100000"))
+QUERIES = ("kubernetes tutorial", "pytorch intro", "deep learn", "rust async", "graphql")
+
+_WORDS = [
+    *("python", "rust", "go", "java", "kotlin", "swift", "react", "vue", "angular"),
+    *("django", "flask", "fastapi", "pytorch", "tensorflow", "kubernetes", "docker"),
+    *("terraform", "ansible", "aws", "azure", "gcp", "graphql", "postgres", "redis"),
+    *("kafka", "spark", "pandas", "numpy", "async", "testing", "security", "compiler"),
+]
+_FILLER = [
+    *("tutorial", "guide", "course", "introduction", "intro", "basics", "advanced"),
+    *("handbook", "deep", "dive", "learn", "learning", "practical", "complete"),
+    *("modern", "fundamentals", "patterns"),
+]
+
+
+def _pick(words: list[str], seed: int, count: int) -> list[str]:
+    """Deterministically pick up to ``count`` distinct words for a seed."""
+    start = seed * 2654435761 % len(words)
+    step = 1 + seed % (len(words) - 1)
+    return list(dict.fromkeys(words[(start + k * step) % len(words)] for k in range(count)))
+
+
+def _build(count: int) -> ResourceManager:
+    """Build a manager holding ``count`` synthetic resources."""
+    manager = ResourceManager()
+    categories = list(ResourceCategory)
+    levels = list(DifficultyLevel)
+    for i in range(count):
+        topic = _pick(_WORDS, i, 2)
+        filler = _pick(_FILLER, i // 7, 5)
+        manager.add_resource(
+            Resource(
+                title=" ".join(topic + filler[:1]).title(),
+                url=f"https://example.com/{i}",
+                category=categories[i % len(categories)],
+                difficulty=levels[i % len(levels)],
+                description=" ".join(filler[1:] + topic),
+                tags=topic,
+            )
+        )
+    return manager
+
+
+@pytest.mark.benchmark
+def test_search_latency() -> None:
+    """Measure median search latency over a synthetic catalog."""
+    manager = _build(RESOURCE_COUNT)
+
+    print(f"\n{RESOURCE_COUNT} resources")
+    for query in QUERIES:
+        timings = []
+        for _ in range(20):
+            start = time.perf_counter()
+            results = manager.search(query, limit=10)
+            timings.append(time.perf_counter() - start)
+        print(f"{query!r:>24}: median {statistics.median(timings) * 1000:.2f} ms")
+        assert len(results) <= 10
@@ -0,0 +1,73 @@
+"""Memory benchmark for learning session storage."""
+
+import os
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+import pytest
+
+from software_development_lessons.core.learning_tracker import LearningSession, SessionStore
+
+SESSION_COUNT = int(os.environ.get("SDL_BENCH_SESSIONS", "100000"))
+
+
+@dataclass
+class _DictSession:
+    """Replica of the original ``__dict__``-based LearningSession dataclass."""
+
+    resource_url: str
+    start_time: datetime = field(default_factory=datetime.now)
+    end_time: datetime | None = None
+    notes: str = ""
+
+
+def _measure(build: Callable[[], object]) -> int:
+    """Return the bytes still allocated by the object ``build`` returns."""
+    tracemalloc.start()
+    try:
+        kept = build()
+        current, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return current
+
+
+@pytest.mark.benchmark
+def test_session_store_memory() -> None:
+    """Compare per-session memory of a list of dataclasses and a SessionStore."""
+    url = "https://example.com/course"
+    start = datetime.now() - timedelta(days=365)
+
+    def build_list() -> list[_DictSession]:
+        return [
+            _DictSession(
+                resource_url=url,
+                start_time=start + timedelta(minutes=i),
+                end_time=start + timedelta(minutes=i, seconds=30),
+            )
+            for i in range(SESSION_COUNT)
+        ]
+
+    def build_store() -> SessionStore:
+        store = SessionStore(resource_url=url)
+        for i in range(SESSION_COUNT):
+            store.append(
+                LearningSession(
+                    resource_url=url,
+                    start_time=start + timedelta(minutes=i),
+                    end_time=start + timedelta(minutes=i, seconds=30),
+                )
+            )
+        return store
+
+    list_bytes = _measure(build_list)
+    store_bytes = _measure(build_store)
+
+    print(
+        f"\n{SESSION_COUNT} sessions: list {list_bytes / SESSION_COUNT:.1f} B/session, "
+        f"SessionStore {store_bytes / SESSION_COUNT:.1f} B/session"
+    )
+    assert store_bytes * 5 < list_bytes
@@ -0,0 +1,50 @@
+"""Lookup latency benchmark for tag completion and fuzzy tag search."""
+
+import os
+import statistics
+import time
+from collections.abc import Callable
+
+import pytest
+
+from software_development_lessons.core.tags import TagDictionary
+
+TAG_COUNT = int(os.environ.get("SDL_BENCH_TAGS", "50000"))
+
+_STEMS = [
+    *("kubernetes", "docker", "python", "pytorch", "tensorflow", "react", "graphql"),
+    *("deep-learning", "machine-learning", "devops", "security", "networking", "rust"),
+]
+
+
+def _build(count: int) -> TagDictionary:
+    """Build a dictionary of ``count`` distinct synthetic tags."""
+    tags = TagDictionary()
+    for i in range(count):
+        tags.add(f"{_STEMS[i % len(_STEMS)]}-{i // len(_STEMS)}")
+    for stem in _STEMS:
+        tags.add(stem)
+    return tags
+
+
+def _median_us(call: Callable[[str], object], argument: str) -> float:
+    """Median wall time of ``call(argument)`` in microseconds."""
+    timings = []
+    for _ in range(50):
+        start = time.perf_counter()
+        call(argument)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1_000_000
+
+
+@pytest.mark.benchmark
+def test_tag_latency() -> None:
+    """Measure median completion and fuzzy lookup latency."""
+    tags = _build(TAG_COUNT)
+
+    print(f"\n{len(tags)} tags")
+    for prefix in ("kub", "deep l", "pytorch-12"):
+        print(f"  suggest {prefix!r:>14}: {_median_us(tags.suggest, prefix):.1f} µs")
+    for typo in ("kubernets", "deep learnin", "pytroch", "dcoker"):
+        print(f"   lookup {typo!r:>14}: {_median_us(tags.lookup, typo):.1f} µs")
+        assert tags.lookup(typo)
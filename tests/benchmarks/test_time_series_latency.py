@@ -0,0 +1,70 @@
+"""Query latency benchmark for learning time rollups versus rescanning sessions."""
+
+import os
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from software_development_lessons.core.rollups import Granularity, TimeRollups
+
+SESSION_COUNT = int(os.environ.get("SDL_BENCH_SESSIONS", "100000"))
+RESOURCE_COUNT = 500
+
+_START = datetime(2023, 1, 1)
+
+
+def _sessions(count: int) -> list[tuple[str, datetime, datetime]]:
+    """Synthetic 45-minute sessions, one every 48 minutes."""
+    sessions = []
+    for i in range(count):
+        start = _START + timedelta(minutes=48 * i)
+        sessions.append(
+            (f"https://example.com/{i % RESOURCE_COUNT}", start, start + timedelta(minutes=45))
+        )
+    return sessions
+
+
+def _scan(
+    sessions: list[tuple[str, datetime, datetime]], start: datetime, end: datetime
+) -> dict[datetime, timedelta]:
+    """Daily totals computed the old way, by rescanning every session."""
+    totals: dict[datetime, timedelta] = {}
+    for _url, session_start, session_end in sessions:
+        if session_start < end and session_end > start:
+            day = Granularity.DAY.floor(session_start)
+            totals[day] = totals.get(day, timedelta()) + session_end - session_start
+    return totals
+
+
+@pytest.mark.benchmark
+def test_time_series_latency() -> None:
+    """Compare a one-month daily series from rollups with a full session scan."""
+    sessions = _sessions(SESSION_COUNT)
+    rollups = TimeRollups()
+    started = time.perf_counter()
+    for url, start, end in sessions:
+        rollups.add(url, start, end)
+    add_us = (time.perf_counter() - started) / len(sessions) * 1_000_000
+
+    month_start = Granularity.DAY.floor(sessions[len(sessions) // 2][1])
+    month_end = month_start + timedelta(days=30)
+    rollup_ms = []
+    scan_ms = []
+    for _ in range(5):
+        started = time.perf_counter()
+        series = rollups.time_series(Granularity.DAY, month_start, month_end)
+        rollup_ms.append((time.perf_counter() - started) * 1000)
+        started = time.perf_counter()
+        _scan(sessions, month_start, month_end)
+        scan_ms.append((time.perf_counter() - started) * 1000)
+
+    rollup = statistics.median(rollup_ms)
+    scan = statistics.median(scan_ms)
+    print(
+        f"\n{len(sessions)} sessions: add {add_us:.1f} us/session, "
+        f"30-day series {rollup:.3f} ms (rescan: {scan:.1f} ms)"
+    )
+    assert len(series) == 30
+    assert rollup < scan
@@ -1,5 +1,7 @@
 """Pytest configuration and fixtures."""
 
+from collections.abc import Callable
+
 import pytest
 
 from software_development_lessons.core import LearningTracker, ResourceManager
@@ -81,3 +83,31 @@ def sample_resources() -> list[Resource]:
             tags=["kubernetes", "devops"],
         ),
     ]
+
+
+@pytest.fixture
+def make_resource() -> Callable[..., Resource]:
+    """Provide a factory for resources whose URL is derived from their title.
+
+    Returns:
+        A function taking a title and tags, with the description, category
+        and difficulty as keyword arguments.
+    """
+
+    def make(
+        title: str,
+        *tags: str,
+        description: str = "",
+        category: ResourceCategory = ResourceCategory.WEB_DEV,
+        difficulty: DifficultyLevel = DifficultyLevel.BEGINNER,
+    ) -> Resource:
+        return Resource(
+            title=title,
+            url=f"https://example.com/{title.lower().replace(' ', '-')}",
+            category=category,
+            difficulty=difficulty,
+            description=description,
+            tags=tags,
+        )
+
+    return make
@@ -0,0 +1,130 @@
+"""Unit tests for batch operation processing."""
+
+import json
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from software_development_lessons.core import LearningTracker, ResourceManager
+from software_development_lessons.core.batch import BatchRunner
+from software_development_lessons.core.learning_tracker import ProgressStatus
+from software_development_lessons.core.resource_manager import Resource
+from software_development_lessons.core.storage import SQLiteStorage
+
+
+def _lines(*records: dict[str, object]) -> list[str]:
+    """Encode records as NDJSON lines."""
+    return [json.dumps(record) + "\n" for record in records]
+
+
+class TestBatchRunner:
+    """Test cases for BatchRunner."""
+
+    def test_applies_every_op(
+        self,
+        resource_manager: ResourceManager,
+        learning_tracker: LearningTracker,
+        sample_resources: list[Resource],
+    ) -> None:
+        """Test add, start, update and remove records in order."""
+        first, second = (r.to_dict() for r in sample_resources[:2])
+        runner = BatchRunner(resource_manager, learning_tracker)
+
+        results = list(
+            runner.run(
+                _lines(
+                    first,
+                    {**second, "op": "add-resource"},
+                    {"op": "start-learning", "url": first["url"]},
+                    {"op": "update-progress", "url": first["url"], "percentage": 100},
+                    {"op": "remove-resource", "url": second["url"]},
+                )
+            )
+        )
+
+        assert all(result.ok for result in results)
+        assert [result.op for result in results] == [
+            "add-resource",
+            "add-resource",
+            "start-learning",
+            "update-progress",
+            "remove-resource",
+        ]
+        assert resource_manager.get_all() == [sample_resources[0]]
+        progress = learning_tracker.get_progress(first["url"])
+        assert progress is not None
+        assert progress.status == ProgressStatus.COMPLETED
+        assert runner.summary.succeeded == 5
+        assert runner.summary.failed == 0
+
+    def test_continues_past_failures(
+        self,
+        resource_manager: ResourceManager,
+        learning_tracker: LearningTracker,
+        sample_resource: Resource,
+    ) -> None:
+        """Test that bad records are reported and later records still applied."""
+        record = sample_resource.to_dict()
+        lines = [
+            "not json\n",
+            "\n",
+            "[1, 2]\n",
+            *_lines(
+                {"op": "explode"},
+                {"op": "start-learning"},
+                {"op": "update-progress", "url": record["url"], "percentage": "half"},
+                {"title": "No URL"},
+                record,
+                record,
+                {"op": "remove-resource", "url": "https://example.com/missing"},
+            ),
+        ]
+        runner = BatchRunner(resource_manager, learning_tracker)
+
+        results = list(runner.run(lines))
+
+        assert [(r.line_number, r.ok) for r in results] == [
+            (1, False),
+            (3, False),
+            (4, False),
+            (5, False),
+            (6, False),
+            (7, False),
+            (8, True),
+            (9, False),
+            (10, False),
+        ]
+        messages = [result.message for result in results]
+        assert messages[1] == "expected a JSON object"
+        assert messages[2] == "unknown op 'explode'"
+        assert messages[3] == "missing field 'url'"
+        assert messages[4] == "field 'percentage' must be of type int"
+        assert messages[5].startswith("missing field")
+        assert "already exists" in messages[7]
+        assert messages[8] == "Resource https://example.com/missing not found"
+        assert resource_manager.count() == 1
+        assert runner.summary.processed == 9
+        assert runner.summary.failed == 8
+
+    def test_commits_in_groups(self, sample_resources: list[Resource], tmp_path: Path) -> None:
+        """Test that records written through storage are committed and reloadable."""
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as storage:
+            runner = BatchRunner(
+                ResourceManager(storage),
+                LearningTracker(storage),
+                storage=storage,
+                commit_every=2,
+            )
+            results = list(runner.run(_lines(*(r.to_dict() for r in sample_resources))))
+
+        assert all(result.ok for result in results)
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as storage:
+            assert ResourceManager(storage).get_all() == sample_resources
+
+    def test_commit_every_must_be_positive(
+        self, resource_manager: ResourceManager, learning_tracker: LearningTracker
+    ) -> None:
+        """Test that an empty transaction size is rejected."""
+        with pytest.raises(ValueError, match="commit_every must be positive"):
+            BatchRunner(resource_manager, learning_tracker, commit_every=0)
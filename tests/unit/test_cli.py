@@ -0,0 +1,356 @@
+"""Unit tests for the sdl command-line interface."""
+
+import gzip
+import json
+from collections.abc import Callable, Iterator
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner, Result
+
+from software_development_lessons.cli import _console, app
+from software_development_lessons.core import ResourceManager, metrics
+from software_development_lessons.core.learning_tracker import ProgressStatus
+from software_development_lessons.core.link_checker import LinkChecker, LinkCheckResult
+from software_development_lessons.core.resource_manager import (
+    DifficultyLevel,
+    Resource,
+    ResourceCategory,
+)
+from software_development_lessons.core.storage import SQLiteStorage
+
+Invoke = Callable[..., Result]
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> Path:
+    """Path of a catalog database that does not exist yet."""
+    return tmp_path / "sdl.db"
+
+
+@pytest.fixture
+def invoke(db: Path) -> Invoke:
+    """Run sdl against the temporary database, returning the result."""
+    runner = CliRunner()
+
+    def invoke(*args: str, stdin: str | None = None) -> Result:
+        return runner.invoke(app, ["--db", str(db), *args], input=stdin)
+
+    return invoke
+
+
+@pytest.fixture
+def demo(invoke: Invoke) -> None:
+    """Seed the temporary database with the demo catalog and progress."""
+    result = invoke("demo")
+    assert result.exit_code == 0, result.output
+
+
+@pytest.fixture
+def dump(tmp_path: Path) -> Path:
+    """JSON Lines file holding one resource that is not in the sample data."""
+    resource = Resource(
+        title="React Patterns",
+        url="https://example.com/react-patterns",
+        category=ResourceCategory.WEB_DEV,
+        difficulty=DifficultyLevel.INTERMEDIATE,
+        description="Composition patterns for React apps",
+        tags=["react", "patterns"],
+    )
+    path = tmp_path / "dump.jsonl"
+    path.write_text(json.dumps(resource.to_dict()) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def profiling() -> Iterator[None]:
+    """Undo what --profile leaves behind in this process once the test ends."""
+    yield
+    metrics.disable()
+    metrics.reset()
+    _console.cache_clear()
+
+
+class TestDemo:
+    """Test cases for sdl demo and commands run before it."""
+
+    def test_new_catalog_is_empty(self, invoke: Invoke, db: Path) -> None:
+        """Test that commands on a new database do not seed it."""
+        assert "No resources found" in invoke("list-resources").output
+        assert "0.00h" in invoke("stats").output
+        with closing(SQLiteStorage(db)) as storage:
+            assert storage.count_resources() == 0
+            assert list(storage.iter_progress()) == []
+
+    def test_seeds_completed_sessions_once(self, invoke: Invoke, db: Path) -> None:
+        """Test that demo time is fixed and a second run adds nothing."""
+        assert "Added 3 sample resources" in invoke("demo").output
+        assert "already in the catalog" in invoke("demo").output
+
+        assert "6.75h" in invoke("stats").output
+        with closing(SQLiteStorage(db)) as storage:
+            assert storage.count_resources() == 3
+            progress = list(storage.iter_progress())
+        assert [len(p.sessions) for p in progress] == [3, 2, 1]
+        assert all(s.end_time is not None for p in progress for s in p.sessions)
+
+
+@pytest.mark.usefixtures("demo")
+class TestAddResource:
+    """Test cases for sdl add-resource."""
+
+    def test_adds_resource(self, invoke: Invoke, db: Path) -> None:
+        """Test that a new resource is stored alongside the demo data."""
+        result = invoke(
+            "add-resource", "-t", "Rust Book", "-u", "https://doc.rust-lang.org/book/", "-c", "web3"
+        )
+
+        assert result.exit_code == 0, result.output
+        with closing(SQLiteStorage(db)) as storage:
+            assert ResourceManager(storage).get_by_url("https://doc.rust-lang.org/book") is not None
+
+    def test_rejects_canonical_duplicate(self, invoke: Invoke, db: Path) -> None:
+        """Test that a spelling of an existing URL is rejected and the catalog still loads."""
+        result = invoke(
+            "add-resource", "-t", "Dup", "-u", "https://pytorch.org/tutorials", "-c", "ai_ml"
+        )
+
+        assert result.exit_code == 1
+        assert "already exists" in result.output
+        with closing(SQLiteStorage(db)) as storage:
+            assert storage.count_resources() == 3
+            assert ResourceManager(storage).count() == 3
+
+
+@pytest.mark.usefixtures("demo")
+class TestImportExport:
+    """Test cases for sdl import and sdl export."""
+
+    def test_round_trip(self, invoke: Invoke, dump: Path, tmp_path: Path) -> None:
+        """Test that imported resources are exported again, compressed by suffix."""
+        exported = tmp_path / "out.jsonl.gz"
+
+        assert invoke("import", str(dump)).exit_code == 0
+        result = invoke("export", str(exported))
+
+        assert result.exit_code == 0, result.output
+        assert "Exported 4 resources" in result.output
+        with gzip.open(exported, "rt", encoding="utf-8") as f:
+            urls = [json.loads(line)["url"] for line in f]
+        assert urls[-1] == "https://example.com/react-patterns"
+
+    def test_import_rejects_duplicate(self, invoke: Invoke, dump: Path, db: Path) -> None:
+        """Test that a plain import fails as a whole on a duplicate."""
+        assert invoke("import", str(dump)).exit_code == 0
+
+        result = invoke("import", str(dump))
+
+        assert result.exit_code == 1
+        assert "already exists" in result.output
+        with closing(SQLiteStorage(db)) as storage:
+            assert storage.count_resources() == 4
+
+    def test_parallel_import_reports_bad_lines(self, invoke: Invoke, dump: Path) -> None:
+        """Test that --workers skips and reports bad lines but keeps the rest."""
+        with dump.open("a", encoding="utf-8") as f:
+            f.write("{not json\n")
+
+        result = invoke("import", str(dump), "--workers", "0")
+
+        assert result.exit_code == 1
+        assert "Imported 1 resources" in result.stdout
+        assert f"{dump}:2: error: invalid JSON" in result.stderr
+
+
+@pytest.mark.usefixtures("demo")
+class TestListResources:
+    """Test cases for sdl list-resources."""
+
+    def test_cursor_pages(self, invoke: Invoke) -> None:
+        """Test that a full page prints a cursor that continues after it."""
+        first = invoke("list-resources", "-n", "2", "--format", "plain")
+
+        assert first.exit_code == 0, first.output
+        assert len(first.stdout.splitlines()) == 2
+        cursor = first.stderr.split("--cursor ")[1].strip()
+        rest = invoke("list-resources", "-n", "2", "--format", "plain", "--cursor", cursor)
+        assert rest.stdout.splitlines() == [
+            "Kubernetes Tutorial [cloud_devops, advanced] https://kubernetes.io/docs/tutorials/"
+        ]
+        assert rest.stderr == ""
+
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [
+            (["--format", "ndjson", "-c", "web_dev"], ['{"title":"Next.js Documentation"']),
+            (["--format", "tsv", "--offset", "2"], ["title\tcategory", "Kubernetes Tutorial\t"]),
+        ],
+    )
+    def test_formats(self, invoke: Invoke, args: list[str], expected: list[str]) -> None:
+        """Test that each line of a streamed format starts as expected."""
+        result = invoke("list-resources", *args)
+
+        assert result.exit_code == 0, result.output
+        lines = result.stdout.splitlines()
+        assert len(lines) == len(expected)
+        for line, start in zip(lines, expected, strict=True):
+            assert line.startswith(start)
+
+    @pytest.mark.parametrize(
+        ("args", "message"),
+        [(["--format", "xml"], "Unknown format"), (["--cursor", "x1"], "Invalid cursor")],
+    )
+    def test_rejects_bad_options(self, invoke: Invoke, args: list[str], message: str) -> None:
+        """Test that unknown formats and malformed cursors are errors."""
+        result = invoke("list-resources", *args)
+
+        assert result.exit_code == 1
+        assert message in result.output
+
+
+@pytest.mark.usefixtures("demo")
+class TestSearchAndTags:
+    """Test cases for sdl search and sdl tags."""
+
+    def test_search_matches_prefix(self, invoke: Invoke) -> None:
+        """Test that a word prefix finds the resource."""
+        result = invoke("search", "orchestr")
+
+        assert result.exit_code == 0, result.output
+        assert "Kubernetes Tutorial" in result.output
+        assert "PyTorch" not in result.output
+
+    def test_search_without_results(self, invoke: Invoke) -> None:
+        """Test that a search matching nothing says so."""
+        assert "No resources found" in invoke("search", "haskell").output
+        result = invoke("search", "kubernetes", "-n", "-1")
+        assert result.exit_code == 1
+        assert "Limit cannot be negative" in result.output
+
+    def test_tags_complete_prefix(self, invoke: Invoke, dump: Path) -> None:
+        """Test that tags are suggested most used first."""
+        invoke("import", str(dump))
+
+        result = invoke("tags", "RE")
+
+        assert result.exit_code == 0, result.output
+        assert result.stdout.splitlines() == ["react"]
+        assert "No tags found" in invoke("tags", "zzz").output
+        assert invoke("tags", "re", "-n", "-1").exit_code == 1
+
+
+@pytest.mark.usefixtures("demo")
+class TestStats:
+    """Test cases for sdl stats."""
+
+    def test_totals(self, invoke: Invoke) -> None:
+        """Test that the sample progress is summarized."""
+        result = invoke("stats")
+
+        assert result.exit_code == 0, result.output
+        assert "Total Resources" in result.output
+        assert "68.3%" in result.output
+
+    def test_by_day(self, invoke: Invoke) -> None:
+        """Test that learning time is bucketed, filtered by category and range."""
+        result = invoke("stats", "--by", "day", "-c", "ai_ml")
+
+        assert result.exit_code == 0, result.output
+        assert "Hours per day" in result.output
+        assert "No learning time" in invoke("stats", "--by", "week", "--since", "2999-01-01").output
+
+    @pytest.mark.parametrize(
+        ("args", "message"),
+        [
+            (["--by", "month"], "'month' is not a valid Granularity"),
+            (["--by", "day", "-c", "x"], "Error: 'X'"),
+        ],
+    )
+    def test_rejects_bad_options(self, invoke: Invoke, args: list[str], message: str) -> None:
+        """Test that an unknown granularity or category is an error."""
+        result = invoke("stats", *args)
+
+        assert result.exit_code == 1
+        assert message in result.output
+
+
+@pytest.mark.usefixtures("demo")
+class TestRecommend:
+    """Test cases for sdl recommend."""
+
+    def test_suggests_next_level(self, invoke: Invoke, dump: Path) -> None:
+        """Test that a completed resource leads to the next level on a shared tag."""
+        assert "No suggestions yet" in invoke("recommend").output
+        invoke("import", str(dump))
+
+        result = invoke("recommend")
+
+        assert result.exit_code == 0, result.output
+        assert "React Patterns" in result.output
+        assert invoke("recommend", "-n", "-1").exit_code == 1
+
+
+class TestBatch:
+    """Test cases for sdl batch."""
+
+    def test_applies_records_and_reports_failures(self, invoke: Invoke, db: Path) -> None:
+        """Test that good records are applied and bad ones are reported on stderr."""
+        records = [
+            {"op": "start-learning", "url": "https://example.com/new"},
+            {"op": "update-progress", "url": "https://example.com/new", "percentage": 100},
+            {"op": "remove-resource", "url": "https://example.com/missing"},
+        ]
+        lines = "\n".join(json.dumps(record) for record in records)
+
+        result = invoke("batch", "-e", stdin=lines)
+
+        assert result.exit_code == 1
+        assert result.stdout.splitlines()[-1].endswith("2 ok, 1 failed")
+        assert result.stderr.startswith("line 3: error:")
+        with closing(SQLiteStorage(db)) as storage:
+            progress = {p.resource_url: p for p in storage.iter_progress()}
+        assert progress["https://example.com/new"].status == ProgressStatus.COMPLETED
+
+    def test_missing_file(self, invoke: Invoke, tmp_path: Path) -> None:
+        """Test that an unreadable input file is an error."""
+        result = invoke("batch", str(tmp_path / "missing.ndjson"))
+
+        assert result.exit_code == 1
+        assert "Error" in result.output
+
+
+@pytest.mark.usefixtures("demo")
+class TestCheckLinks:
+    """Test cases for sdl check-links."""
+
+    def test_reports_broken_links(self, invoke: Invoke, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that broken links are listed and fail the command."""
+
+        def check_url(_self: LinkChecker, url: str) -> LinkCheckResult:
+            if "kubernetes" in url:
+                return LinkCheckResult(url=url, ok=False, status_code=404)
+            return LinkCheckResult(url=url, ok=True, status_code=200)
+
+        monkeypatch.setattr(LinkChecker, "check_url", check_url)
+
+        result = invoke("check-links", "--rate", "0")
+
+        assert result.exit_code == 1
+        assert "Broken Links" in result.output
+        assert "Checked 3 links: 2 ok, 1 broken" in result.output
+
+
+@pytest.mark.usefixtures("profiling")
+class TestProfile:
+    """Test cases for the --profile option."""
+
+    def test_prints_latency_table(self, db: Path) -> None:
+        """Test that the command and its core calls are timed on stderr."""
+        result = CliRunner().invoke(app, ["--db", str(db), "--profile", "search", "react"])
+
+        assert result.exit_code == 0, result.output
+        assert "Profile" in result.stderr
+        assert "cli.search" in result.stderr
+        assert "SQLiteStorage.search_resources" in result.stderr
+        assert "Profile" not in result.stdout
@@ -0,0 +1,26 @@
+"""Unit tests for the lazily imported package exports."""
+
+from types import ModuleType
+
+import pytest
+
+import software_development_lessons
+from software_development_lessons import core
+from software_development_lessons.core.learning_tracker import LearningTracker
+from software_development_lessons.core.resource_manager import ResourceManager
+
+
+class TestExports:
+    """Test cases for the PEP 562 package attributes."""
+
+    @pytest.mark.parametrize("package", [software_development_lessons, core])
+    def test_lazy_exports(self, package: ModuleType) -> None:
+        """Test that public classes resolve to the core implementations."""
+        assert package.ResourceManager is ResourceManager
+        assert package.LearningTracker is LearningTracker
+        assert {"LearningTracker", "ResourceManager"} <= set(dir(package))
+
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+            _ = software_development_lessons.Missing  # type: ignore[attr-defined]
@@ -0,0 +1,95 @@
+"""Unit tests for parallel ingest of resource dumps."""
+
+import json
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from software_development_lessons.core import ResourceManager
+from software_development_lessons.core.ingest import parse_chunk, parse_parallel
+from software_development_lessons.core.resource_manager import Resource
+from software_development_lessons.core.storage import SQLiteStorage
+
+
+def _write_dump(path: Path, resources: list[Resource], *extra: str) -> None:
+    """Write resources as JSON Lines followed by raw extra lines."""
+    lines = [json.dumps(resource.to_dict()) for resource in resources]
+    path.write_text("\n".join([*lines, *extra]) + "\n", encoding="utf-8")
+
+
+class TestIngest:
+    """Test cases for parallel ingest."""
+
+    def test_parse_chunk_reports_bad_lines(self, sample_resource: Resource) -> None:
+        """Test that a chunk keeps valid rows and reports the rest by line."""
+        lines = [
+            (1, json.dumps(sample_resource.to_dict())),
+            (2, "{not json"),
+            (3, json.dumps({**sample_resource.to_dict(), "category": "nope"})),
+        ]
+
+        chunk = parse_chunk(lines)
+
+        assert [(line_number, key) for line_number, key, _ in chunk.rows] == [
+            (1, sample_resource.url)
+        ]
+        assert [(e.line_number, e.message.split(":")[0]) for e in chunk.errors] == [
+            (2, "invalid JSON"),
+            (3, "invalid resource"),
+        ]
+
+    def test_parse_parallel_keeps_input_order(self, sample_resources: list[Resource]) -> None:
+        """Test that chunks parsed by several workers come back in order."""
+        lines = [
+            (i, json.dumps({**sample_resources[i % 3].to_dict(), "url": f"https://e.com/{i}"}))
+            for i in range(1, 51)
+        ]
+
+        chunks = list(parse_parallel(lines, workers=2, chunk_size=7))
+
+        assert [row[0] for chunk in chunks for row in chunk.rows] == list(range(1, 51))
+        with pytest.raises(ValueError, match="must be positive"):
+            list(parse_parallel(lines, chunk_size=0))
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_ingest_jsonl_skips_duplicates_and_bad_lines(
+        self, sample_resources: list[Resource], tmp_path: Path, workers: int
+    ) -> None:
+        """Test that duplicates and invalid lines are reported without stopping the load."""
+        manager = ResourceManager()
+        manager.add_resource(sample_resources[0])
+        dump = tmp_path / "dump.jsonl"
+        duplicate = json.dumps({**sample_resources[1].to_dict(), "url": "https://X.COM/a"})
+        _write_dump(
+            dump,
+            sample_resources,
+            json.dumps({**sample_resources[1].to_dict(), "url": "https://x.com/a"}),
+            "",
+            '{"title": ""}',
+            duplicate,
+        )
+
+        result = manager.ingest_jsonl(dump, workers=workers, chunk_size=2)
+
+        assert result.added == 3
+        assert [error.line_number for error in result.errors] == [1, 6, 7]
+        assert "already exists" in result.errors[0].message
+        assert "already exists" in result.errors[2].message
+        assert [r.url for r in manager.get_all()] == [
+            sample_resources[0].url,
+            sample_resources[1].url,
+            sample_resources[2].url,
+            "https://x.com/a",
+        ]
+        assert manager.search_by_tag("pytorch") == [sample_resources[0]]
+
+    def test_ingest_jsonl_persists(self, sample_resources: list[Resource], tmp_path: Path) -> None:
+        """Test that ingested resources are written to storage."""
+        dump = tmp_path / "dump.jsonl"
+        _write_dump(dump, sample_resources)
+
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as storage:
+            assert ResourceManager(storage).ingest_jsonl(dump, workers=0).added == 3
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as storage:
+            assert ResourceManager(storage).get_all() == sample_resources
@@ -0,0 +1,167 @@
+"""Unit tests for the event journal."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from software_development_lessons.core import LearningTracker
+from software_development_lessons.core.journal import EventJournal
+from software_development_lessons.core.learning_tracker import LearningProgress, ProgressStatus
+from software_development_lessons.core.storage import SQLiteStorage
+
+
+def _recover(directory: Path) -> LearningTracker:
+    """Reopen the journal in ``directory`` with a fresh tracker."""
+    return LearningTracker(journal=EventJournal(directory))
+
+
+def _snapshot(tracker: LearningTracker) -> list[tuple[object, ...]]:
+    """Comparable view of every progress record and session held by ``tracker``."""
+    return [
+        (
+            p.resource_url,
+            p.status,
+            p.completion_percentage,
+            p.started_at,
+            p.completed_at,
+            [(s.start_time, s.end_time, s.notes) for s in p.sessions],
+        )
+        for p in tracker.get_all_progress()
+    ]
+
+
+class TestEventJournal:
+    """Test cases for EventJournal."""
+
+    def test_recover_replays_every_change(self, tmp_path: Path) -> None:
+        """Test that progress, sessions and completions survive a restart."""
+        journal = EventJournal(tmp_path)
+        tracker = LearningTracker(journal=journal)
+        session = tracker.start_learning("https://example.com/1")
+        session.complete(notes="done")
+        tracker.start_learning("https://example.com/1")
+        tracker.start_learning("https://example.com/2")
+        tracker.update_progress("https://example.com/1", 100)
+        journal.close()
+
+        recovered = _recover(tmp_path)
+
+        assert _snapshot(recovered) == _snapshot(tracker)
+        progress = recovered.get_progress("https://example.com/1")
+        assert progress is not None
+        assert progress.status == ProgressStatus.COMPLETED
+        assert progress.sessions[0].notes == "done"
+        assert progress.sessions[1].end_time is None
+        assert recovered.get_statistics() == pytest.approx(tracker.get_statistics(), abs=1e-3)
+
+    def test_snapshot_then_tail(self, tmp_path: Path) -> None:
+        """Test that recovery loads the snapshot and replays only newer records."""
+        journal = EventJournal(tmp_path, snapshot_every=3)
+        tracker = LearningTracker(journal=journal)
+        tracker.start_learning("https://example.com/1")
+        tracker.update_progress("https://example.com/1", 40)
+        tracker.start_learning("https://example.com/2")
+        journal.close()
+
+        assert (tmp_path / "snapshot.bin").exists()
+        assert [p.name for p in tmp_path.glob("events-*.log")] == ["events-00000001.log"]
+
+        recovered = _recover(tmp_path)
+
+        assert _snapshot(recovered) == _snapshot(tracker)
+
+    def test_recovered_tracker_keeps_journaling(self, tmp_path: Path) -> None:
+        """Test that changes made after recovery are appended and recovered too."""
+        journal = EventJournal(tmp_path)
+        LearningTracker(journal=journal).start_learning("https://example.com/1")
+        journal.close()
+
+        journal = EventJournal(tmp_path)
+        tracker = LearningTracker(journal=journal)
+        progress = tracker.get_progress("https://example.com/1")
+        assert progress is not None
+        progress.sessions[0].complete()
+        tracker.checkpoint()
+        tracker.update_progress("https://example.com/1", 60)
+        journal.close()
+
+        assert _snapshot(_recover(tmp_path)) == _snapshot(tracker)
+
+    def test_torn_tail_is_truncated(self, tmp_path: Path) -> None:
+        """Test that a partially written final record is dropped on recovery."""
+        journal = EventJournal(tmp_path)
+        tracker = LearningTracker(journal=journal)
+        tracker.start_learning("https://example.com/1")
+        journal.close()
+        expected = _snapshot(tracker)
+        segment = tmp_path / "events-00000000.log"
+        intact_size = segment.stat().st_size
+        with segment.open("ab") as f:
+            f.write(b"\x40\x00\x00\x00\x00\x00")
+
+        recovered = _recover(tmp_path)
+
+        assert _snapshot(recovered) == expected
+        assert segment.stat().st_size == intact_size
+
+    def test_corrupt_snapshot(self, tmp_path: Path) -> None:
+        """Test that a damaged snapshot raises ValueError instead of losing data."""
+        journal = EventJournal(tmp_path)
+        journal.write_snapshot([LearningProgress(resource_url="https://example.com/1")])
+        journal.close()
+        snapshot = tmp_path / "snapshot.bin"
+        snapshot.write_bytes(b"x" + snapshot.read_bytes()[1:])
+
+        with pytest.raises(ValueError, match="corrupt"):
+            EventJournal(tmp_path).recover()
+
+    def test_group_commit(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that records are fsynced in groups rather than one by one."""
+        synced: list[int] = []
+        monkeypatch.setattr("os.fsync", synced.append)
+        journal = EventJournal(tmp_path, sync_every=4, sync_interval=3600)
+        tracker = LearningTracker(journal=journal)
+        for i in range(5):
+            tracker.start_learning(f"https://example.com/{i}")
+
+        # Each new resource appends a progress record and a session record.
+        assert len(synced) == 2
+        journal.close()
+        assert len(synced) == 3
+
+    def test_tracker_rejects_storage_and_journal(self, tmp_path: Path) -> None:
+        """Test that a tracker cannot use a storage backend and a journal at once."""
+        storage = SQLiteStorage(":memory:")
+
+        with pytest.raises(ValueError, match="not both"):
+            LearningTracker(storage, journal=EventJournal(tmp_path))
+
+        storage.close()
+
+    def test_records_reach_the_os_on_append(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that appends are flushed at once and fsynced by the timer."""
+        synced = threading.Event()
+        monkeypatch.setattr("os.fsync", lambda _: synced.set())
+        journal = EventJournal(tmp_path, sync_every=100, sync_interval=0.01)
+        LearningTracker(journal=journal).start_learning("https://example.com/1")
+
+        assert (tmp_path / "events-00000000.log").stat().st_size > 0
+        assert synced.wait(timeout=5)
+        journal.close()
+
+    def test_completion_writes_due_snapshot(self, tmp_path: Path) -> None:
+        """Test that a session completion checkpoints once a snapshot is due."""
+        journal = EventJournal(tmp_path, snapshot_every=3)
+        tracker = LearningTracker(journal=journal)
+        session = tracker.start_learning("https://example.com/1")
+        assert not (tmp_path / "snapshot.bin").exists()
+
+        session.complete()
+
+        assert not journal.snapshot_due
+        assert [p.name for p in tmp_path.glob("events-*.log")] == []
+        journal.close()
+        assert _snapshot(_recover(tmp_path)) == _snapshot(tracker)
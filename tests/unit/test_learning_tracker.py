@@ -1,14 +1,19 @@
 """Unit tests for LearningTracker."""
 
-from datetime import timedelta
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 import pytest
 
 from software_development_lessons.core import LearningTracker
 from software_development_lessons.core.learning_tracker import (
     LearningProgress,
+    LearningSession,
     ProgressStatus,
+    SessionStore,
 )
+from software_development_lessons.core.storage import SQLiteStorage
 
 
 class TestLearningProgress:
@@ -70,6 +75,36 @@ class TestLearningProgress:
         assert isinstance(total_time, timedelta)
         assert total_time.total_seconds() >= 0
 
+    def test_total_time_spent_tracks_session_changes(self) -> None:
+        """Test that the cached total follows completions and direct appends."""
+        progress = LearningProgress(resource_url="https://example.com")
+        start = datetime.now() - timedelta(hours=3)
+
+        first = progress.start_session()
+        first.start_time = start
+        first.end_time = start + timedelta(hours=1)
+        progress.sessions.append(
+            LearningSession(
+                resource_url="https://example.com",
+                start_time=start,
+                end_time=start + timedelta(minutes=30),
+            )
+        )
+        assert progress.total_time_spent == timedelta(hours=1, minutes=30)
+
+        second = progress.start_session()
+        second.start_time = datetime.now() - timedelta(minutes=10)
+        second.complete()
+        assert progress.total_time_spent == pytest.approx(
+            timedelta(hours=1, minutes=40), abs=timedelta(seconds=1)
+        )
+
+        third = progress.start_session()
+        third.start_time = datetime.now() - timedelta(minutes=5)
+        assert progress.total_time_spent == pytest.approx(
+            timedelta(hours=1, minutes=45), abs=timedelta(seconds=1)
+        )
+
     def test_to_dict(self) -> None:
         """Test converting progress to dictionary."""
         progress = LearningProgress(resource_url="https://example.com")
@@ -85,6 +120,88 @@ class TestLearningProgress:
         assert "total_time_hours" in result
 
 
+class TestSessionStore:
+    """Test cases for SessionStore."""
+
+    def test_sessions_have_no_instance_dict(self) -> None:
+        """Test that LearningSession uses slots instead of a __dict__."""
+        assert not hasattr(LearningSession(resource_url="https://example.com"), "__dict__")
+
+    def test_progress_uses_session_store(self) -> None:
+        """Test that LearningProgress keeps its sessions in a SessionStore."""
+        progress = LearningProgress(resource_url="https://example.com")
+
+        assert isinstance(progress.sessions, SessionStore)
+        assert progress.sessions == []
+
+    def test_packed_sessions_round_trip(self) -> None:
+        """Test that completed sessions read back with equal values."""
+        start = datetime.now().replace(microsecond=678901) - timedelta(days=10)
+        sessions = [
+            LearningSession(
+                resource_url="https://example.com",
+                start_time=start + timedelta(days=i),
+                end_time=start + timedelta(days=i, minutes=30),
+                notes="same notes" if i % 2 else "",
+            )
+            for i in range(4)
+        ]
+
+        store = SessionStore(sessions, resource_url="https://example.com")
+
+        assert len(store) == 4
+        assert list(store) == sessions
+        assert store[-1] == sessions[-1]
+        assert store[1:3] == sessions[1:3]
+        assert store.closed_time() == timedelta(hours=2)
+
+    def test_open_sessions_stay_live_until_packed(self) -> None:
+        """Test that open sessions keep their identity until completed and packed."""
+        store = SessionStore(resource_url="https://example.com")
+        session = LearningSession(resource_url="https://example.com")
+        store.append(session)
+
+        assert store[0] is session
+        assert store.open_sessions() == [(0, session)]
+
+        session.complete(notes="done")
+        store.append(LearningSession(resource_url="https://example.com"))
+
+        assert store[0] is not session
+        assert store[0] == session
+        assert [index for index, _ in store.open_sessions()] == [1]
+
+    def test_insert_and_delete_shift_live_sessions(self) -> None:
+        """Test that structural changes keep open sessions at the right index."""
+        start = datetime.now()
+        closed = LearningSession(
+            resource_url="https://example.com", start_time=start, end_time=start
+        )
+        live = LearningSession(resource_url="https://example.com")
+        store = SessionStore([closed, live], resource_url="https://example.com")
+
+        store.insert(0, closed)
+        assert store[2] is live
+
+        del store[0]
+        assert store[1] is live
+        assert len(store) == 2
+
+    def test_completing_packed_copy_writes_back(self) -> None:
+        """Test that completing a materialized packed session updates the store."""
+        progress = LearningProgress(resource_url="https://example.com")
+        first = progress.start_session()
+        first.complete()
+        progress.start_session()
+
+        copy = progress.sessions[0]
+        assert copy is not first
+        copy.complete(notes="revisited")
+
+        assert progress.sessions[0].notes == "revisited"
+        assert progress.sessions[0].end_time == copy.end_time
+
+
 class TestLearningTracker:
     """Test cases for LearningTracker."""
 
@@ -196,3 +313,140 @@ class TestLearningTracker:
         assert stats["in_progress"] == 2
         assert 0 <= stats["average_completion"] <= 100
         assert stats["total_hours_spent"] >= 0
+
+    def test_statistics_match_full_recomputation(self, learning_tracker: LearningTracker) -> None:
+        """Test that incrementally maintained statistics agree with a full scan."""
+        urls = [f"https://example.com/{i}" for i in range(4)]
+        sessions = [learning_tracker.start_learning(url) for url in urls]
+        learning_tracker.update_progress(urls[0], 100)
+        learning_tracker.update_progress(urls[1], 40)
+        learning_tracker.update_progress(urls[1], 0)
+        learning_tracker.update_progress(urls[2], 100)
+        learning_tracker.update_progress(urls[2], 60)
+        sessions[0].complete()
+        sessions[0].complete(notes="completed twice")
+
+        progress = learning_tracker.get_progress(urls[3])
+        assert progress is not None
+        progress.start_session().complete()
+
+        all_progress = learning_tracker.get_all_progress()
+        stats = learning_tracker.get_statistics()
+
+        assert stats["completed"] == len(learning_tracker.get_completed_resources()) == 1
+        assert stats["in_progress"] == len(learning_tracker.get_in_progress_resources()) == 3
+        assert stats["average_completion"] == pytest.approx(
+            sum(p.completion_percentage for p in all_progress) / len(all_progress)
+        )
+        expected_time = sum((p.total_time_spent for p in all_progress), timedelta())
+        assert learning_tracker.get_total_time_spent() == pytest.approx(
+            expected_time, abs=timedelta(seconds=1)
+        )
+
+    def test_direct_assignments_reach_statistics(self, learning_tracker: LearningTracker) -> None:
+        """Test that assigning record and session fields updates the statistics."""
+        session = learning_tracker.start_learning("https://example.com/1")
+        progress = learning_tracker.get_progress("https://example.com/1")
+        assert progress is not None
+
+        progress.completion_percentage = 40
+        progress.status = ProgressStatus.COMPLETED
+        session.end_time = session.start_time + timedelta(hours=2)
+
+        stats = learning_tracker.get_statistics()
+        assert stats["completed"] == 1
+        assert stats["in_progress"] == 0
+        assert stats["average_completion"] == 40
+        assert stats["total_hours_spent"] == pytest.approx(2)
+        assert progress.total_time_spent == timedelta(hours=2)
+        with pytest.raises(ValueError, match="cannot be reopened"):
+            session.end_time = None
+        with pytest.raises(AttributeError, match="Cannot replace the sessions"):
+            progress.sessions = []
+
+    def test_time_series(self, learning_tracker: LearningTracker) -> None:
+        """Test that time series agree with session totals, including open sessions."""
+        urls = ["https://example.com/1", "https://example.com/2"]
+        done = learning_tracker.start_learning(urls[0])
+        done.start_time -= timedelta(hours=3)
+        done.complete()
+        learning_tracker.start_learning(urls[1]).start_time -= timedelta(hours=1)
+
+        daily = learning_tracker.time_series("day")
+        hourly = learning_tracker.time_series("hour", resource_urls=[urls[0]])
+
+        assert sum((spent for _, spent in daily), timedelta()) == pytest.approx(
+            learning_tracker.get_total_time_spent(), abs=timedelta(seconds=1)
+        )
+        assert sum((spent for _, spent in hourly), timedelta()) == pytest.approx(
+            timedelta(hours=3), abs=timedelta(seconds=1)
+        )
+        assert learning_tracker.time_series("week", end=datetime(2000, 1, 1)) == []
+
+    def test_time_series_includes_recovered_sessions(self) -> None:
+        """Test that sessions loaded from storage are folded into the rollups."""
+        storage = SQLiteStorage(":memory:")
+        session = LearningTracker(storage).start_learning("https://example.com/1")
+        session.start_time -= timedelta(hours=2)
+        session.complete()
+
+        series = LearningTracker(storage).time_series("week")
+
+        assert sum((spent for _, spent in series), timedelta()) == pytest.approx(
+            timedelta(hours=2), abs=timedelta(seconds=1)
+        )
+
+    def test_get_statistics_empty(self, learning_tracker: LearningTracker) -> None:
+        """Test statistics for a tracker with no progress."""
+        assert learning_tracker.get_statistics() == {
+            "total_resources": 0,
+            "completed": 0,
+            "in_progress": 0,
+            "average_completion": 0,
+            "total_hours_spent": 0,
+        }
+
+    def test_concurrent_updates(self, learning_tracker: LearningTracker) -> None:
+        """Test that concurrent updates from many threads lose no changes."""
+        urls = [f"https://example.com/{i}" for i in range(4)]
+
+        def work(worker: int) -> None:
+            for i in range(50):
+                url = urls[(worker + i) % len(urls)]
+                learning_tracker.start_learning(url).complete()
+                learning_tracker.update_progress(url, (worker * 50 + i) % 100)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(8)))
+
+        progress = learning_tracker.get_all_progress()
+        assert len(progress) == len(urls)
+        assert sum(len(p.sessions) for p in progress) == 8 * 50
+        stats = learning_tracker.get_statistics()
+        assert stats["average_completion"] == sum(p.completion_percentage for p in progress) / len(
+            urls
+        )
+        assert stats["total_hours_spent"] == pytest.approx(
+            sum(p.total_time_spent.total_seconds() for p in progress) / 3600
+        )
+
+    def test_completion_races_with_new_sessions(self, learning_tracker: LearningTracker) -> None:
+        """Test that a session packed by a concurrent start is still counted as closed."""
+        url = "https://example.com/race"
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+
+            def work(_: int) -> None:
+                for _ in range(200):
+                    learning_tracker.start_learning(url).complete()
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(work, range(8)))
+        finally:
+            sys.setswitchinterval(interval)
+
+        progress = learning_tracker.get_progress(url)
+        assert progress is not None
+        assert progress.open_sessions == []
+        assert learning_tracker.get_total_time_spent() == progress.total_time_spent
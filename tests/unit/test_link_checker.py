@@ -0,0 +1,141 @@
+"""Unit tests for the link checker, run against a local HTTP server."""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import closing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from software_development_lessons.core.link_checker import LinkChecker, LinkCheckResult
+
+ETAG = '"v1"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Stand-in catalog site with a few well-known paths."""
+
+    requests_seen: list[tuple[str, str]]
+
+    def do_HEAD(self) -> None:
+        self.requests_seen.append(("HEAD", self.path))
+        if self.path == "/no-head":
+            self._reply(405)
+        else:
+            self._route()
+
+    def do_GET(self) -> None:
+        self.requests_seen.append(("GET", self.path))
+        self._route(body=b"hello")
+
+    def _route(self, body: bytes = b"") -> None:
+        path = self.path.partition("?")[0]
+        if path == "/etag" and self.headers.get("If-None-Match") == ETAG:
+            self._reply(304)
+        elif path in {"/ok", "/no-head", "/etag"}:
+            self._reply(200, body, {"ETag": ETAG} if path == "/etag" else {})
+        elif path == "/moved":
+            self._reply(301, headers={"Location": "/ok"})
+        else:
+            self._reply(404)
+
+    def _reply(self, status: int, body: bytes = b"", headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command == "GET":
+            self.wfile.write(body)
+
+    def log_message(self, fmt: str, *args: object) -> None:
+        """Keep test output quiet."""
+
+
+@pytest.fixture
+def server() -> Iterator[tuple[str, list[tuple[str, str]]]]:
+    """Serve the stand-in site on a free local port."""
+    seen: list[tuple[str, str]] = []
+    handler = type("Handler", (_Handler,), {"requests_seen": seen})
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", seen
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _check(checker: LinkChecker, *urls: str) -> dict[str, LinkCheckResult]:
+    """Check URLs and index the results by URL."""
+    return {result.url: result for result in checker.check(urls)}
+
+
+class TestLinkChecker:
+    """Test cases for LinkChecker."""
+
+    def test_reports_healthy_and_broken_links(
+        self, server: tuple[str, list[tuple[str, str]]]
+    ) -> None:
+        """Test status reporting for ok, redirected, missing and unreachable URLs."""
+        base, _ = server
+        with closing(LinkChecker(per_host_rate=0, timeout=2)) as checker:
+            results = _check(
+                checker, f"{base}/ok", f"{base}/moved", f"{base}/missing", "http://127.0.0.1:9/"
+            )
+
+        assert results[f"{base}/ok"].ok
+        assert results[f"{base}/moved"].status_code == 200
+        assert not results[f"{base}/missing"].ok
+        assert results[f"{base}/missing"].status_code == 404
+        unreachable = results["http://127.0.0.1:9/"]
+        assert not unreachable.ok
+        assert unreachable.status_code is None
+        assert unreachable.error
+
+    def test_falls_back_to_get(self, server: tuple[str, list[tuple[str, str]]]) -> None:
+        """Test that a GET is sent when the server rejects HEAD."""
+        base, seen = server
+        with closing(LinkChecker(per_host_rate=0)) as checker:
+            result = checker.check_url(f"{base}/no-head")
+
+        assert result.ok
+        assert seen == [("HEAD", "/no-head"), ("GET", "/no-head")]
+
+    def test_conditional_requests_cached_between_runs(
+        self, server: tuple[str, list[tuple[str, str]]], tmp_path: Path
+    ) -> None:
+        """Test that validators are saved and a 304 reuses the cached status."""
+        base, _ = server
+        cache_path = tmp_path / "link-cache.json"
+        with closing(LinkChecker(per_host_rate=0, cache_path=cache_path)) as checker:
+            first = checker.check_url(f"{base}/etag")
+
+        with closing(LinkChecker(per_host_rate=0, cache_path=cache_path)) as checker:
+            second = checker.check_url(f"{base}/etag")
+
+        assert not first.not_modified
+        assert second.not_modified
+        assert second.ok
+        assert second.status_code == 200
+
+    def test_per_host_rate_limit(self, server: tuple[str, list[tuple[str, str]]]) -> None:
+        """Test that requests to one host are spaced out by the rate limit."""
+        base, seen = server
+        urls = [f"{base}/ok?page={i}" for i in range(5)]
+
+        start = time.monotonic()
+        with closing(LinkChecker(max_workers=5, per_host_rate=20)) as checker:
+            results = list(checker.check(urls))
+        elapsed = time.monotonic() - start
+
+        assert len(results) == 5
+        assert all(result.ok for result in results)
+        assert len(seen) == 5
+        assert elapsed >= 4 / 20
+
+    def test_invalid_worker_count(self) -> None:
+        """Test that a non-positive worker count raises ValueError."""
+        with pytest.raises(ValueError, match="max_workers must be positive"):
+            LinkChecker(max_workers=0)
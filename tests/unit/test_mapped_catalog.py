@@ -0,0 +1,109 @@
+"""Unit tests for memory-mapped catalog snapshots."""
+
+from collections.abc import Iterator
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from software_development_lessons.core import ResourceManager
+from software_development_lessons.core.mapped_catalog import MappedCatalog, write_mapped_catalog
+from software_development_lessons.core.resource_manager import (
+    DifficultyLevel,
+    Resource,
+    ResourceCategory,
+)
+
+
+@pytest.fixture
+def resources(sample_resources: list[Resource]) -> list[Resource]:
+    """Sample resources plus edge cases: no tags, paid, non-ASCII text."""
+    return [
+        *sample_resources,
+        Resource(
+            title="Écoute — Déjà vu",
+            url="https://Example.com/ecoute/",
+            category=ResourceCategory.AI_ML,
+            difficulty=DifficultyLevel.EXPERT,
+            description="",
+            tags=None,
+            is_free=False,
+        ),
+        Resource(
+            title="Empty Tags",
+            url="https://example.com/empty",
+            category=ResourceCategory.MOBILE,
+            difficulty=DifficultyLevel.BEGINNER,
+            description="No tags at all",
+            tags=[],
+        ),
+    ]
+
+
+@pytest.fixture
+def catalog(resources: list[Resource], tmp_path: Path) -> Iterator[MappedCatalog]:
+    """Map a snapshot of the resources."""
+    manager = ResourceManager()
+    for resource in resources:
+        manager.add_resource(resource)
+    path = tmp_path / "catalog.sdlcat"
+    manager.export_snapshot(path)
+    with closing(MappedCatalog(path)) as mapped:
+        yield mapped
+
+
+class TestMappedCatalog:
+    """Test cases for MappedCatalog and write_mapped_catalog."""
+
+    def test_round_trip(self, catalog: MappedCatalog, resources: list[Resource]) -> None:
+        """Test that every resource comes back unchanged and in order."""
+        assert catalog.count() == len(resources)
+        assert catalog.get_all() == resources
+        assert catalog[3].tags is None
+        assert catalog[4].tags == ()
+
+        with pytest.raises(IndexError):
+            catalog[len(resources)]
+
+    def test_lookups_match_resource_manager(
+        self, catalog: MappedCatalog, resources: list[Resource]
+    ) -> None:
+        """Test that the prebuilt indexes answer like ResourceManager."""
+        manager = ResourceManager()
+        for resource in resources:
+            manager.add_resource(resource)
+
+        for category in ResourceCategory:
+            assert catalog.get_by_category(category) == manager.get_by_category(category)
+        for difficulty in DifficultyLevel:
+            assert catalog.get_by_difficulty(difficulty) == manager.get_by_difficulty(difficulty)
+        for tag in ("pytorch", "react", "devops", "missing", ""):
+            assert catalog.search_by_tag(tag) == manager.search_by_tag(tag)
+        assert catalog.get_free_resources() == manager.get_free_resources()
+
+    def test_get_by_url_uses_canonical_urls(
+        self, catalog: MappedCatalog, resources: list[Resource]
+    ) -> None:
+        """Test URL lookups, including other spellings of the same URL."""
+        assert catalog.get_by_url("https://kubernetes.io/docs") == resources[2]
+        assert catalog.get_by_url("https://example.com/ecoute") == resources[3]
+        assert catalog.contains("https://nextjs.org/learn")
+        assert not catalog.contains("https://example.com/missing")
+        assert catalog.get_by_url("not a url") is None
+
+    def test_duplicate_urls_rejected(self, sample_resource: Resource, tmp_path: Path) -> None:
+        """Test that two resources with one canonical URL cannot be written."""
+        other = Resource.from_dict(
+            {**sample_resource.to_dict(), "url": "https://EXAMPLE.com/test/"}
+        )
+
+        with pytest.raises(ValueError, match="already exists"):
+            write_mapped_catalog(tmp_path / "catalog.sdlcat", [sample_resource, other])
+
+    def test_invalid_file(self, tmp_path: Path) -> None:
+        """Test that files that are not snapshots raise ValueError."""
+        path = tmp_path / "catalog.sdlcat"
+        path.write_bytes(b"not a snapshot" * 100)
+
+        with pytest.raises(ValueError, match="not a catalog snapshot"):
+            MappedCatalog(path)
@@ -0,0 +1,89 @@
+"""Unit tests for the opt-in profiling layer."""
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from software_development_lessons.core import LearningTracker, ResourceManager, metrics
+from software_development_lessons.core.metrics import _Histogram, metrics_snapshot
+from software_development_lessons.core.resource_manager import Resource
+
+
+@pytest.fixture
+def profiling() -> Iterator[None]:
+    """Enable profiling for one test, then restore the original methods."""
+    metrics.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+class TestMetrics:
+    """Test cases for instrumentation, snapshots and histograms."""
+
+    def test_disabled_methods_are_unwrapped(self) -> None:
+        """Test that profiling off leaves the original functions in place."""
+        assert not metrics.is_enabled()
+        assert not hasattr(ResourceManager.add_resource, "__wrapped__")
+        assert not hasattr(LearningTracker.get_statistics, "__wrapped__")
+
+    @pytest.mark.usefixtures("profiling")
+    def test_records_calls_and_errors(self, sample_resource: Resource) -> None:
+        """Test that public calls, constructors and failures are counted."""
+        manager = ResourceManager()
+        manager.add_resource(sample_resource)
+        with pytest.raises(ValueError, match="already exists"):
+            manager.add_resource(sample_resource)
+        tracker = LearningTracker()
+        for _ in range(3):
+            tracker.get_statistics()
+
+        snapshot = metrics_snapshot()
+
+        assert snapshot["ResourceManager.__init__"]["count"] == 1
+        assert snapshot["ResourceManager.add_resource"]["count"] == 2
+        assert snapshot["ResourceManager.add_resource"]["errors"] == 1
+        assert snapshot["LearningTracker.get_statistics"]["count"] == 3
+        stats = snapshot["LearningTracker.get_statistics"]
+        assert 0 < stats["p50_s"] <= stats["p95_s"] <= stats["p99_s"] <= stats["max_s"]
+
+    def test_disable_restores_methods(self) -> None:
+        """Test that disabling swaps the original functions back."""
+        original = ResourceManager.get_by_url
+
+        metrics.enable()
+        wrapped = ResourceManager.get_by_url
+        metrics.disable()
+
+        assert wrapped is not original
+        assert ResourceManager.get_by_url is original
+
+    def test_histogram_percentiles(self) -> None:
+        """Test that percentiles stay within a bucket of the exact values."""
+        histogram = _Histogram()
+        for latency in range(1, 10_001):
+            histogram.add(latency * 1000, failed=False)
+
+        for fraction in metrics.PERCENTILES:
+            exact = fraction * 10_000 * 1000
+            assert histogram.percentile(fraction) == pytest.approx(exact, rel=0.13)
+        assert histogram.percentile(1.0) <= histogram.max_ns == 10_000_000
+
+    @pytest.mark.usefixtures("profiling")
+    def test_concurrent_timers_count_every_call(self) -> None:
+        """Test that threads timing shared and separate timers lose no calls."""
+
+        def work(worker: int) -> None:
+            for _ in range(1000):
+                with metrics.timer("shared"), metrics.timer(f"worker{worker}"):
+                    pass
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(work, range(4)))
+
+        snapshot = metrics_snapshot()
+        assert snapshot["shared"]["count"] == 4000
+        assert isinstance(snapshot["shared"]["count"], int)
+        assert [snapshot[f"worker{worker}"]["count"] for worker in range(4)] == [1000] * 4
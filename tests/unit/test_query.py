@@ -0,0 +1,159 @@
+"""Unit tests for ResourceQuery."""
+
+from collections.abc import Callable
+
+import pytest
+
+from software_development_lessons.core import ResourceManager
+from software_development_lessons.core.resource_manager import (
+    DifficultyLevel,
+    Resource,
+    ResourceCategory,
+)
+
+
+@pytest.fixture
+def populated_manager(sample_resources: list[Resource]) -> ResourceManager:
+    """Create a ResourceManager holding the sample resources plus a few extras."""
+    manager = ResourceManager()
+    for resource in sample_resources:
+        manager.add_resource(resource)
+    manager.add_resource(
+        Resource(
+            title="Paid PyTorch Course",
+            url="https://example.com/paid-pytorch",
+            category=ResourceCategory.AI_ML,
+            difficulty=DifficultyLevel.INTERMEDIATE,
+            description="Premium PyTorch course",
+            tags=["pytorch"],
+            is_free=False,
+        )
+    )
+    manager.add_resource(
+        Resource(
+            title="Beginner PyTorch",
+            url="https://example.com/beginner-pytorch",
+            category=ResourceCategory.AI_ML,
+            difficulty=DifficultyLevel.BEGINNER,
+            description="PyTorch for beginners",
+            tags=["pytorch", "deep-learning"],
+        )
+    )
+    return manager
+
+
+class TestResourceQuery:
+    """Test cases for ResourceQuery."""
+
+    def test_empty_query_returns_everything(self, populated_manager: ResourceManager) -> None:
+        """Test that a query without filters returns all resources in order."""
+        assert populated_manager.query().all() == populated_manager.get_all()
+        assert populated_manager.query().count() == populated_manager.count()
+
+    def test_compound_filter(self, populated_manager: ResourceManager) -> None:
+        """Test combining category, difficulty, tag and free filters."""
+        results = (
+            populated_manager.query()
+            .category(ResourceCategory.AI_ML)
+            .difficulty(DifficultyLevel.INTERMEDIATE)
+            .tag("pytorch")
+            .free()
+            .all()
+        )
+
+        assert [r.url for r in results] == ["https://pytorch.org/tutorials/"]
+
+    def test_multiple_tags_must_all_match(self, populated_manager: ResourceManager) -> None:
+        """Test that tag filters are combined with AND."""
+        results = populated_manager.query().tag("pytorch", "deep-learning").all()
+
+        assert [r.url for r in results] == [
+            "https://pytorch.org/tutorials/",
+            "https://example.com/beginner-pytorch",
+        ]
+
+    def test_unknown_filter_value_matches_nothing(self, populated_manager: ResourceManager) -> None:
+        """Test that filtering on an unused value yields no results."""
+        query = populated_manager.query().category(ResourceCategory.AI_ML).tag("missing")
+
+        assert query.all() == []
+        assert query.first() is None
+        assert query.count() == 0
+
+    def test_offset_and_limit(self, populated_manager: ResourceManager) -> None:
+        """Test slicing matches with offset and limit."""
+        all_pytorch = populated_manager.query().tag("pytorch").all()
+
+        sliced = populated_manager.query().tag("pytorch").offset(1).limit(1).all()
+
+        assert sliced == all_pytorch[1:2]
+
+    def test_invalid_offset_and_limit(self, populated_manager: ResourceManager) -> None:
+        """Test that negative offset or limit raises ValueError."""
+        with pytest.raises(ValueError, match="Offset cannot be negative"):
+            populated_manager.query().offset(-1)
+
+        with pytest.raises(ValueError, match="Limit cannot be negative"):
+            populated_manager.query().limit(-1)
+
+    def test_pages(self, populated_manager: ResourceManager) -> None:
+        """Test evaluating a query page by page."""
+        pages = list(populated_manager.query().category(ResourceCategory.AI_ML).pages(2))
+
+        assert [len(page) for page in pages] == [2, 1]
+        assert [r for page in pages for r in page] == populated_manager.get_by_category(
+            ResourceCategory.AI_ML
+        )
+
+        with pytest.raises(ValueError, match="Page size must be positive"):
+            populated_manager.query().pages(0)
+
+    def test_pages_respect_offset_and_limit(self, populated_manager: ResourceManager) -> None:
+        """Test that pages cover exactly the offset and limit window."""
+        pages = list(populated_manager.query().offset(1).limit(3).pages(2))
+
+        assert pages == [populated_manager.get_all()[1:3], populated_manager.get_all()[3:4]]
+
+    def test_iteration_releases_lock_between_pages(
+        self, populated_manager: ResourceManager
+    ) -> None:
+        """Test that the manager can be changed while a query is being iterated."""
+        seen = []
+        for page in populated_manager.query().tag("pytorch").pages(1):
+            seen.extend(page)
+            if len(seen) == 1:
+                populated_manager.add_resource(
+                    Resource(
+                        title="Late PyTorch",
+                        url="https://example.com/late-pytorch",
+                        category=ResourceCategory.AI_ML,
+                        difficulty=DifficultyLevel.BEGINNER,
+                        description="Added mid-iteration",
+                        tags=["pytorch"],
+                    )
+                )
+
+        assert [r.url for r in seen] == [
+            "https://pytorch.org/tutorials/",
+            "https://example.com/paid-pytorch",
+            "https://example.com/beginner-pytorch",
+            "https://example.com/late-pytorch",
+        ]
+
+    def test_buckets_are_looked_up_when_evaluated(
+        self, populated_manager: ResourceManager, make_resource: Callable[..., Resource]
+    ) -> None:
+        """Test that a query built earlier sees buckets created or recreated since."""
+        query = populated_manager.query().category(ResourceCategory.WEB3).tag("solidity")
+        web_dev = populated_manager.query().category(ResourceCategory.WEB_DEV)
+        populated_manager.remove_resource("https://nextjs.org/learn")
+
+        populated_manager.add_resource(
+            make_resource("Solidity", "solidity", category=ResourceCategory.WEB3)
+        )
+        populated_manager.add_resource(make_resource("Remix"))
+
+        assert [r.title for r in query] == ["Solidity"]
+        assert query.count() == 1
+        assert [r.title for r in web_dev.all()] == ["Remix"]
+        assert web_dev.first() == populated_manager.get_by_url("https://example.com/remix")
@@ -0,0 +1,118 @@
+"""Unit tests for next-resource recommendations."""
+
+from collections.abc import Callable
+
+import pytest
+
+from software_development_lessons.core import LearningTracker, ResourceManager
+from software_development_lessons.core.recommend import Recommender, recommend_next
+from software_development_lessons.core.resource_manager import (
+    DifficultyLevel,
+    Resource,
+    ResourceCategory,
+)
+
+MakeResource = Callable[..., Resource]
+
+
+@pytest.fixture
+def catalog(make_resource: MakeResource) -> ResourceManager:
+    """Create a ResourceManager with resources along a React learning path."""
+    manager = ResourceManager()
+    manager.add_resources(
+        [
+            make_resource("React-Basics", "react", "javascript"),
+            make_resource(
+                "Nextjs", "Next.js", "React", "ssr", difficulty=DifficultyLevel.INTERMEDIATE
+            ),
+            make_resource(
+                "React-Patterns", "react", "patterns", difficulty=DifficultyLevel.ADVANCED
+            ),
+            make_resource("Remix", "ssr", "remix", difficulty=DifficultyLevel.INTERMEDIATE),
+            make_resource("Javascript-Intro", "javascript"),
+            make_resource("Rust", "rust", category=ResourceCategory.CLOUD_DEVOPS),
+        ]
+    )
+    return manager
+
+
+def _titles(manager: ResourceManager, *completed: str) -> list[str]:
+    """Titles suggested after completing the named resources."""
+    urls = [f"https://example.com/{name}" for name in completed]
+    return [suggestion.resource.title for suggestion in manager.recommend(urls, limit=10)]
+
+
+class TestRecommender:
+    """Test cases for Recommender and ResourceManager.recommend."""
+
+    def test_prefers_next_level_and_shared_tags(self, catalog: ResourceManager) -> None:
+        """Test that the next level ranks first and jumps or unrelated tags are left out."""
+        suggestions = catalog.recommend(["https://example.com/react-basics"])
+
+        assert [s.resource.title for s in suggestions] == ["Nextjs", "Javascript-Intro", "Remix"]
+        assert suggestions[0].tags[0] == "react"
+        assert suggestions[0].score > suggestions[1].score > suggestions[2].score
+
+    def test_co_occurring_tags_widen_the_profile(self, catalog: ResourceManager) -> None:
+        """Test that a tag only reached through co-occurrence still yields candidates."""
+        suggestions = catalog.recommend(["https://example.com/react-basics"])
+
+        # "ssr" occurs together with "react" on the Next.js resource.
+        assert suggestions[-1].resource.title == "Remix"
+        assert suggestions[-1].tags == ("ssr",)
+
+    def test_progression_follows_the_level_reached(self, catalog: ResourceManager) -> None:
+        """Test that completing an intermediate resource unlocks advanced ones."""
+        titles = _titles(catalog, "react-basics", "nextjs")
+
+        assert titles[0] == "React-Patterns"
+        assert "Javascript-Intro" not in titles
+
+    def test_index_follows_adds_and_removes(
+        self, catalog: ResourceManager, make_resource: MakeResource
+    ) -> None:
+        """Test that the index is maintained incrementally once built."""
+        assert _titles(catalog, "rust") == []
+
+        catalog.add_resource(
+            make_resource(
+                "Tokio",
+                "rust",
+                difficulty=DifficultyLevel.INTERMEDIATE,
+                category=ResourceCategory.CLOUD_DEVOPS,
+            )
+        )
+        catalog.remove_resources(["https://example.com/nextjs"])
+
+        assert _titles(catalog, "rust") == ["Tokio"]
+        assert "Nextjs" not in _titles(catalog, "react-basics")
+
+    def test_remove_restores_empty_index(self, make_resource: MakeResource) -> None:
+        """Test that removing every resource leaves no postings behind."""
+        recommender = Recommender()
+        resources = [
+            make_resource("A", "react", "ssr"),
+            make_resource("B", "React", "react"),
+        ]
+        for resource in resources:
+            recommender.add(resource.url, resource)
+        for resource in resources:
+            recommender.remove(resource.url, resource)
+
+        assert len(recommender) == 0
+        assert recommender.recommend(resources) == []
+        assert recommender.tag_counts(["react", "ssr"]) == {}
+        assert recommender.related_tags("react") == {}
+
+    def test_recommend_next_uses_tracker(self, catalog: ResourceManager) -> None:
+        """Test that completed resources shape suggestions and started ones are skipped."""
+        tracker = LearningTracker()
+        tracker.start_learning("https://example.com/react-basics")
+        tracker.update_progress("https://example.com/react-basics", 100)
+        tracker.start_learning("https://example.com/nextjs")
+
+        titles = [s.resource.title for s in recommend_next(catalog, tracker)]
+
+        assert titles == ["Javascript-Intro", "Remix"]
+        with pytest.raises(ValueError, match="cannot be negative"):
+            catalog.recommend([], limit=-1)
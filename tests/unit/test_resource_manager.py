@@ -1,14 +1,19 @@
 """Unit tests for ResourceManager."""
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 
 from software_development_lessons.core import ResourceManager
 from software_development_lessons.core.resource_manager import (
+    BulkSummary,
     DifficultyLevel,
+    OnConflict,
     Resource,
     ResourceCategory,
+    canonical_key,
 )
 
 
@@ -45,6 +50,14 @@ class TestResource:
                 description="Test",
             )
 
+    def test_resource_validation_string_tags(self, sample_resource: Resource) -> None:
+        """Test that a single string is rejected instead of split into characters."""
+        with pytest.raises(ValueError, match="not a string"):
+            replace(sample_resource, tags="pytorch")
+
+        with pytest.raises(ValueError, match="not a string"):
+            Resource.from_dict({**sample_resource.to_dict(), "tags": "pytorch"})
+
     def test_resource_to_dict(self, sample_resource: Resource) -> None:
         """Test converting resource to dictionary."""
         result = sample_resource.to_dict()
@@ -56,6 +69,46 @@ class TestResource:
         assert result["is_free"] is True
         assert "test" in result["tags"]
 
+    def test_resource_is_frozen_and_hashable(self, sample_resource: Resource) -> None:
+        """Test that resources are immutable, hashable and have no __dict__."""
+        copy = Resource.from_dict(sample_resource.to_dict())
+
+        assert copy == sample_resource
+        assert hash(copy) == hash(sample_resource)
+        assert not hasattr(copy, "__dict__")
+        with pytest.raises(AttributeError):
+            copy.title = "Changed"  # type: ignore[misc]
+
+    def test_tags_are_interned_tuples(self, sample_resource: Resource) -> None:
+        """Test that equal tags share one string and to_dict still returns a list."""
+        copy = Resource.from_dict({**sample_resource.to_dict(), "tags": ["".join("test")]})
+
+        assert copy.tags == ("test",)
+        assert copy.tags is not None
+        assert sample_resource.tags is not None
+        assert copy.tags[0] is sample_resource.tags[0]
+        assert copy.to_dict()["tags"] == ["test"]
+
+    def test_from_row_matches_constructor(self, sample_resource: Resource) -> None:
+        """Test that a resource rebuilt from its field values equals the original."""
+        row = (
+            sample_resource.title,
+            sample_resource.url,
+            "ai_ml",
+            "beginner",
+            sample_resource.description,
+            ("".join("test"), "example"),
+            True,
+        )
+
+        copy = Resource.from_row(row)
+
+        assert copy == sample_resource
+        assert copy.tags is not None
+        assert sample_resource.tags is not None
+        assert copy.tags[0] is sample_resource.tags[0]
+        assert canonical_key("HTTPS://Example.com/test/") == canonical_key(copy.url)
+
 
 class TestResourceManager:
     """Test cases for ResourceManager."""
@@ -99,6 +152,60 @@ class TestResourceManager:
 
         assert result is False
 
+    def test_get_all_preserves_insertion_order(
+        self, resource_manager: ResourceManager, sample_resources: list[Resource]
+    ) -> None:
+        """Test that get_all returns resources in insertion order after removals."""
+        for resource in sample_resources:
+            resource_manager.add_resource(resource)
+        resource_manager.remove_resource(sample_resources[1].url)
+        resource_manager.add_resource(sample_resources[1])
+
+        urls = [r.url for r in resource_manager.get_all()]
+
+        assert urls == [
+            sample_resources[0].url,
+            sample_resources[2].url,
+            sample_resources[1].url,
+        ]
+
+    def test_equivalent_urls_are_duplicates(
+        self, resource_manager: ResourceManager, sample_resource: Resource
+    ) -> None:
+        """Test that URLs differing only in spelling are treated as one resource."""
+        resource_manager.add_resource(sample_resource)
+        variant = Resource(
+            title="Same page",
+            url="https://EXAMPLE.com/test/#top",
+            category=sample_resource.category,
+            difficulty=sample_resource.difficulty,
+            description="Same page, different spelling",
+        )
+
+        with pytest.raises(ValueError, match="already exists"):
+            resource_manager.add_resource(variant)
+
+        assert resource_manager.get_by_url("HTTPS://Example.COM/test") == sample_resource
+        assert resource_manager.remove_resource("https://example.com:443/test/")
+        assert resource_manager.count() == 0
+
+    def test_get_by_url(self, resource_manager: ResourceManager, sample_resource: Resource) -> None:
+        """Test looking up a resource by URL."""
+        resource_manager.add_resource(sample_resource)
+
+        assert resource_manager.get_by_url(sample_resource.url) is sample_resource
+        assert resource_manager.get_by_url("https://nonexistent.com") is None
+
+    def test_contains(self, resource_manager: ResourceManager, sample_resource: Resource) -> None:
+        """Test checking resource membership by URL."""
+        assert resource_manager.contains(sample_resource.url) is False
+
+        resource_manager.add_resource(sample_resource)
+        assert resource_manager.contains(sample_resource.url) is True
+
+        resource_manager.remove_resource(sample_resource.url)
+        assert resource_manager.contains(sample_resource.url) is False
+
     def test_get_by_category(
         self, resource_manager: ResourceManager, sample_resources: list[Resource]
     ) -> None:
@@ -165,6 +272,41 @@ class TestResourceManager:
         assert len(free_resources) == 3
         assert all(r.is_free for r in free_resources)
 
+    def test_filters_reflect_removals(
+        self, resource_manager: ResourceManager, sample_resources: list[Resource]
+    ) -> None:
+        """Test that category, difficulty, tag and free filters drop removed resources."""
+        for resource in sample_resources:
+            resource_manager.add_resource(resource)
+
+        resource_manager.remove_resource("https://pytorch.org/tutorials/")
+
+        assert resource_manager.get_by_category(ResourceCategory.AI_ML) == []
+        assert resource_manager.get_by_difficulty(DifficultyLevel.INTERMEDIATE) == []
+        assert resource_manager.search_by_tag("pytorch") == []
+        assert [r.url for r in resource_manager.get_free_resources()] == [
+            "https://nextjs.org/learn",
+            "https://kubernetes.io/docs/",
+        ]
+
+    def test_filters_preserve_insertion_order(self, resource_manager: ResourceManager) -> None:
+        """Test that filtered results follow the order resources were added in."""
+        urls = [f"https://example.com/{i}" for i in range(5)]
+        for url in urls:
+            resource_manager.add_resource(
+                Resource(
+                    title=url,
+                    url=url,
+                    category=ResourceCategory.WEB_DEV,
+                    difficulty=DifficultyLevel.BEGINNER,
+                    description="",
+                    tags=["web"],
+                )
+            )
+
+        assert [r.url for r in resource_manager.search_by_tag("web")] == urls
+        assert [r.url for r in resource_manager.get_by_category(ResourceCategory.WEB_DEV)] == urls
+
     def test_export_to_json(
         self, resource_manager: ResourceManager, sample_resource: Resource, tmp_path: Path
     ) -> None:
@@ -183,3 +325,144 @@ class TestResourceManager:
 
         assert len(data) == 1
         assert data[0]["title"] == "Test Resource"
+
+    @pytest.mark.parametrize("file_name", ["resources.jsonl", "resources.jsonl.gz"])
+    def test_jsonl_round_trip(
+        self,
+        resource_manager: ResourceManager,
+        sample_resources: list[Resource],
+        tmp_path: Path,
+        file_name: str,
+    ) -> None:
+        """Test exporting to and importing from JSON Lines, plain and gzipped."""
+        for resource in sample_resources:
+            resource_manager.add_resource(resource)
+
+        jsonl_file = tmp_path / file_name
+        assert resource_manager.export_jsonl(jsonl_file) == 3
+
+        imported = ResourceManager()
+        assert imported.import_jsonl(jsonl_file) == 3
+        assert imported.get_all() == sample_resources
+
+    def test_export_jsonl_writes_one_resource_per_line(
+        self, resource_manager: ResourceManager, sample_resources: list[Resource], tmp_path: Path
+    ) -> None:
+        """Test that JSON Lines export writes one compact object per line."""
+        for resource in sample_resources:
+            resource_manager.add_resource(resource)
+
+        jsonl_file = tmp_path / "resources.jsonl"
+        resource_manager.export_jsonl(jsonl_file)
+
+        lines = jsonl_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 3
+        assert lines[0].startswith('{"title":"PyTorch Tutorial"')
+
+    def test_import_jsonl_reports_bad_line(
+        self, resource_manager: ResourceManager, tmp_path: Path
+    ) -> None:
+        """Test that a malformed record is reported with its line number."""
+        jsonl_file = tmp_path / "resources.jsonl"
+        jsonl_file.write_text(
+            '{"title": "Ok", "url": "https://example.com", "category": "web_dev",'
+            ' "difficulty": "beginner"}\n'
+            "\n"
+            '{"title": "Bad", "url": "https://example.com/bad", "category": "nope",'
+            ' "difficulty": "beginner"}\n',
+            encoding="utf-8",
+        )
+
+        with pytest.raises(ValueError, match=r"resources.jsonl:3: invalid resource"):
+            resource_manager.import_jsonl(jsonl_file)
+
+        assert resource_manager.count() == 1
+
+    def test_add_resources(
+        self, resource_manager: ResourceManager, sample_resources: list[Resource]
+    ) -> None:
+        """Test that a batch is added whole or, on a duplicate, not at all."""
+        assert resource_manager.add_resources(sample_resources[:2]).added == 2
+
+        with pytest.raises(ValueError, match="already exists"):
+            resource_manager.add_resources([sample_resources[2], sample_resources[0]])
+        with pytest.raises(ValueError, match="already exists"):
+            resource_manager.add_resources([sample_resources[2], sample_resources[2]])
+
+        assert resource_manager.get_all() == sample_resources[:2]
+        assert resource_manager.search_by_tag("pytorch") == [sample_resources[0]]
+
+    def test_add_resources_on_conflict(
+        self, resource_manager: ResourceManager, sample_resources: list[Resource]
+    ) -> None:
+        """Test that skip keeps the existing resource and replace moves the new one last."""
+        first, second, third = sample_resources
+        resource_manager.add_resources([first, second])
+        renamed = replace(
+            first, title="PyTorch Tutorial v2", url=first.url.replace("pytorch", "PyTorch", 1)
+        )
+
+        skipped = resource_manager.add_resources([first, third, third], on_conflict="skip")
+        replaced = resource_manager.add_resources(
+            [renamed, replace(second, tags=["react"])], on_conflict=OnConflict.REPLACE
+        )
+
+        assert skipped == BulkSummary(added=1, skipped=2)
+        assert replaced == BulkSummary(replaced=2)
+        assert [r.title for r in resource_manager.get_all()] == [
+            third.title,
+            "PyTorch Tutorial v2",
+            second.title,
+        ]
+        assert resource_manager.search_by_tag("pytorch") == [renamed]
+        assert resource_manager.search("v2") == [renamed]
+        with pytest.raises(ValueError, match="not a valid"):
+            resource_manager.add_resources([], on_conflict="merge")
+
+    def test_remove_resources(
+        self, resource_manager: ResourceManager, sample_resources: list[Resource]
+    ) -> None:
+        """Test that bulk removal drops found URLs once and skips the rest."""
+        resource_manager.add_resources(sample_resources)
+        first, second, third = sample_resources
+
+        summary = resource_manager.remove_resources(
+            [
+                first.url,
+                first.url.replace("pytorch", "PyTorch", 1),
+                third.url,
+                "https://example.com/missing",
+            ]
+        )
+
+        assert summary == BulkSummary(removed=2, skipped=2)
+        assert resource_manager.get_all() == [second]
+        assert resource_manager.search_by_tag("pytorch") == []
+        assert resource_manager.search(first.title) == []
+        assert resource_manager.search(second.title) == [second]
+
+    def test_concurrent_adds(self, resource_manager: ResourceManager) -> None:
+        """Test that racing adds keep every resource and reject duplicates."""
+
+        def add(i: int) -> bool:
+            resource = Resource(
+                title=f"Resource {i % 50}",
+                url=f"https://example.com/{i % 50}",
+                category=ResourceCategory.WEB_DEV,
+                difficulty=DifficultyLevel.BEGINNER,
+                description="Shared resource",
+                tags=["shared"],
+            )
+            try:
+                resource_manager.add_resource(resource)
+            except ValueError:
+                return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            added = list(pool.map(add, range(200)))
+
+        assert sum(added) == 50
+        assert resource_manager.count() == 50
+        assert len(resource_manager.search_by_tag("shared")) == 50
+        assert resource_manager.query().tag("shared").count() == 50
@@ -0,0 +1,88 @@
+"""Unit tests for learning time rollups."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from software_development_lessons.core.rollups import Granularity, TimeRollups
+
+URL = "https://example.com/course"
+OTHER = "https://example.com/other"
+
+
+class TestGranularity:
+    """Test cases for Granularity."""
+
+    @pytest.mark.parametrize(
+        ("granularity", "expected"),
+        [
+            (Granularity.HOUR, datetime(2024, 5, 19, 23, 0)),
+            (Granularity.DAY, datetime(2024, 5, 19)),
+            (Granularity.WEEK, datetime(2024, 5, 13)),
+        ],
+    )
+    def test_floor(self, granularity: Granularity, expected: datetime) -> None:
+        """Test that buckets start on the hour, at midnight and on Monday."""
+        assert granularity.floor(datetime(2024, 5, 19, 23, 59, 59)) == expected
+
+
+class TestTimeRollups:
+    """Test cases for TimeRollups."""
+
+    def test_splits_at_bucket_boundaries(self) -> None:
+        """Test that time is split across every bucket it overlaps."""
+        rollups = TimeRollups()
+        rollups.add(URL, datetime(2024, 5, 19, 22, 30), datetime(2024, 5, 20, 1, 0))
+
+        assert rollups.time_series(Granularity.HOUR) == [
+            (datetime(2024, 5, 19, 22), timedelta(minutes=30)),
+            (datetime(2024, 5, 19, 23), timedelta(hours=1)),
+            (datetime(2024, 5, 20, 0), timedelta(hours=1)),
+        ]
+        assert rollups.time_series("week") == [
+            (datetime(2024, 5, 13), timedelta(minutes=90)),
+            (datetime(2024, 5, 20), timedelta(hours=1)),
+        ]
+
+    def test_range_and_resource_filters(self) -> None:
+        """Test selecting buckets by time range and by resource."""
+        rollups = TimeRollups()
+        for day in range(1, 6):
+            start = datetime(2024, 5, day, 9)
+            rollups.add_many(URL, [(start, start + timedelta(hours=1))])
+            rollups.add(OTHER, start, start + timedelta(hours=2))
+
+        series = rollups.time_series("day", datetime(2024, 5, 2, 12), datetime(2024, 5, 4))
+        only_url = rollups.time_series("day", resource_urls=[URL])
+
+        assert series == [
+            (datetime(2024, 5, 2), timedelta(hours=3)),
+            (datetime(2024, 5, 3), timedelta(hours=3)),
+        ]
+        assert [spent for _, spent in only_url] == [timedelta(hours=1)] * 5
+        assert rollups.time_series("day", resource_urls=["https://example.com/none"]) == []
+
+    def test_reversed_interval_subtracts(self) -> None:
+        """Test that moving an end time back removes the difference."""
+        rollups = TimeRollups()
+        start = datetime(2024, 5, 1, 9)
+        rollups.add(URL, start, start + timedelta(hours=2))
+        rollups.add(URL, start + timedelta(hours=2), start + timedelta(hours=1))
+
+        assert rollups.time_series("hour") == [(start, timedelta(hours=1))]
+
+    def test_ongoing_stretches_are_not_stored(self) -> None:
+        """Test that ongoing stretches count in the result only."""
+        rollups = TimeRollups()
+        start = datetime(2024, 5, 1, 9)
+        ongoing = [(URL, start, start + timedelta(minutes=10))]
+
+        assert rollups.time_series("day", ongoing=ongoing) == [
+            (datetime(2024, 5, 1), timedelta(minutes=10))
+        ]
+        assert rollups.time_series("day") == []
+
+    def test_unknown_granularity(self) -> None:
+        """Test that an unknown granularity raises ValueError."""
+        with pytest.raises(ValueError, match="month"):
+            TimeRollups().time_series("month")
@@ -0,0 +1,182 @@
+"""Unit tests for full-text search."""
+
+from collections.abc import Callable
+
+import pytest
+
+from software_development_lessons.core import ResourceManager
+from software_development_lessons.core.resource_manager import Resource
+from software_development_lessons.core.search import SearchIndex, tokenize
+
+MakeResource = Callable[..., Resource]
+
+
+@pytest.fixture
+def catalog(make_resource: MakeResource) -> ResourceManager:
+    """Create a ResourceManager with a small searchable catalog."""
+    manager = ResourceManager()
+    for resource in (
+        make_resource(
+            "Kubernetes Tutorial", "kubernetes", description="Learn Kubernetes step by step"
+        ),
+        make_resource("Docker Tutorial", "docker", description="Containers for beginners"),
+        make_resource(
+            "Kubernetes Networking", description="Services, ingress and a tutorial appendix"
+        ),
+        make_resource(
+            "Cloud Native Patterns", "cloud", description="Operating kubernetes clusters"
+        ),
+    ):
+        manager.add_resource(resource)
+    return manager
+
+
+class TestSearch:
+    """Test cases for ResourceManager.search and SearchIndex."""
+
+    def test_tokenize(self) -> None:
+        """Test that tokens are lowercased words split on punctuation."""
+        assert tokenize("Deep-Learning, PyTorch & CUDA_12") == [
+            "deep",
+            "learning",
+            "pytorch",
+            "cuda_12",
+        ]
+
+    def test_all_words_must_match(self, catalog: ResourceManager) -> None:
+        """Test that results contain every query word, best match first."""
+        results = catalog.search("kubernetes tutorial")
+
+        assert [r.title for r in results] == ["Kubernetes Tutorial", "Kubernetes Networking"]
+
+    def test_prefix_matching(self, catalog: ResourceManager) -> None:
+        """Test that a query word also matches longer words it starts."""
+        titles = {r.title for r in catalog.search("kube")}
+
+        assert titles == {"Kubernetes Tutorial", "Kubernetes Networking", "Cloud Native Patterns"}
+
+    def test_tags_and_description_are_searchable(self, catalog: ResourceManager) -> None:
+        """Test matching on tags and description text."""
+        assert [r.title for r in catalog.search("containers docker")] == ["Docker Tutorial"]
+
+    def test_no_match(self, catalog: ResourceManager) -> None:
+        """Test that unknown words and empty queries return nothing."""
+        assert catalog.search("terraform") == []
+        assert catalog.search("kubernetes terraform") == []
+        assert catalog.search("  ") == []
+
+    def test_limit(self, catalog: ResourceManager) -> None:
+        """Test limiting the number of results."""
+        assert len(catalog.search("tutorial", limit=1)) == 1
+        assert catalog.search("tutorial", limit=0) == []
+
+        with pytest.raises(ValueError, match="Limit cannot be negative"):
+            catalog.search("tutorial", limit=-1)
+
+    def test_index_follows_add_and_remove(
+        self, catalog: ResourceManager, make_resource: MakeResource
+    ) -> None:
+        """Test that the index is updated incrementally."""
+        catalog.remove_resource("https://example.com/docker-tutorial")
+        catalog.add_resource(make_resource("Helm Charts", description="Package kubernetes apps"))
+
+        assert catalog.search("docker") == []
+        assert [r.title for r in catalog.search("helm")] == ["Helm Charts"]
+
+    def test_removed_terms_leave_vocabulary(self, make_resource: MakeResource) -> None:
+        """Test that terms no document uses anymore stop matching prefixes."""
+        index = SearchIndex()
+        resource = make_resource("Terraform Basics")
+        index.add("a", resource)
+        index.remove("a", resource)
+        index.add("b", make_resource("Terra Incognita"))
+
+        assert index.search("terr") == ["b"]
+        assert len(index) == 1
+
+        with pytest.raises(ValueError, match="already indexed"):
+            index.add("b", make_resource("Terra Incognita"))
+
+    def test_add_many_matches_single_adds(self, make_resource: MakeResource) -> None:
+        """Test that bulk indexing keeps the vocabulary sorted for prefix matching."""
+        resources = [
+            make_resource("Zig Basics"),
+            make_resource("Ansible Intro"),
+            make_resource("Zig Build"),
+        ]
+        single, bulk = SearchIndex(), SearchIndex()
+        single.add("a", make_resource("Terraform Basics"))
+        bulk.add("a", make_resource("Terraform Basics"))
+        for i, resource in enumerate(resources):
+            single.add(str(i), resource)
+
+        bulk.add_many((str(i), resource) for i, resource in enumerate(resources))
+
+        for prefix in ("zig", "b", "ans", "terra", "int"):
+            assert sorted(bulk.search(prefix)) == sorted(single.search(prefix)), prefix
+        assert sorted(bulk.search("b")) == ["0", "2", "a"]
+
+    def test_remove_many(self, make_resource: MakeResource) -> None:
+        """Test that bulk removal drops postings and unused terms in one pass."""
+        resources = [
+            make_resource("Zig Basics"),
+            make_resource("Zig Build"),
+            make_resource("Ansible Intro"),
+        ]
+        index = SearchIndex()
+        index.add_many((str(i), resource) for i, resource in enumerate(resources))
+
+        index.remove_many([("0", resources[0]), ("2", resources[2]), ("9", resources[2])])
+
+        assert index.search("zig") == ["1"]
+        assert index.search("basics") == []
+        assert index.search("ans") == []
+        assert len(index) == 1
+
+    def test_ids_of_removed_documents_are_reclaimed(self, make_resource: MakeResource) -> None:
+        """Test that ranking and ties survive renumbering after mass removal."""
+        resources = [
+            make_resource(f"Guide {i}", description="helm chart" if i % 7 else "helm")
+            for i in range(3000)
+        ]
+        index = SearchIndex()
+        index.add_many((str(i), resource) for i, resource in enumerate(resources))
+        kept = [i for i in range(3000) if i % 5 == 0]
+
+        index.remove_many((str(i), r) for i, r in enumerate(resources) if i % 5)
+        index.add("new", make_resource("Kustomize Notes"))
+
+        assert len(index) == len(kept) + 1
+        assert index.search("helm", limit=3) == ["0", "35", "70"]
+        assert index.search("chart", limit=3) == ["5", "10", "15"]
+        assert index.search("guid 2995") == ["2995"]
+        assert index.search("kust") == ["new"]
+        index.remove("0", resources[0])
+        assert index.search("helm", limit=2) == ["35", "70"]
+
+    def test_cached_ranking_follows_average_length(self, make_resource: MakeResource) -> None:
+        """Test that a cached single-term ranking is reordered as other documents change."""
+        index = SearchIndex()
+        index.add("short", make_resource("Rust", description="intro"))
+        index.add("long", make_resource("Rust Rust", description=" ".join(["guide"] * 18)))
+        assert index.search("rust") == ["short", "long"]
+
+        # Long documents raise the average length, which softens the length
+        # penalty of the document repeating the term.
+        for i in range(5):
+            index.add(f"book-{i}", make_resource(f"Book {i}", description="page " * 200))
+
+        assert index.search("rust") == ["long", "short"]
+
+    def test_prefix_expansions_prefer_common_terms(self, make_resource: MakeResource) -> None:
+        """Test that an overly broad prefix keeps its most frequent extensions."""
+        index = SearchIndex()
+        index.add_many(
+            (f"rare{i}", make_resource(f"Rare {i}", description=f"kube{i:03d}")) for i in range(100)
+        )
+        index.add_many(
+            (f"common{i}", make_resource(f"Common {i}", description="kubezzz")) for i in range(3)
+        )
+
+        assert sorted(index.search("kube", limit=200))[:3] == ["common0", "common1", "common2"]
+        assert len(index.search("kube", limit=200)) == 3 + 63
@@ -0,0 +1,440 @@
+"""Unit tests for the SQLite storage backend."""
+
+import sqlite3
+from collections.abc import Callable, Iterator
+from contextlib import closing
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from software_development_lessons.core import LearningTracker, ResourceManager
+from software_development_lessons.core.learning_tracker import (
+    LearningProgress,
+    LearningSession,
+    ProgressStatus,
+)
+from software_development_lessons.core.recommend import recommend_next
+from software_development_lessons.core.resource_manager import (
+    DifficultyLevel,
+    Resource,
+    ResourceCategory,
+)
+from software_development_lessons.core.rollups import Granularity
+from software_development_lessons.core.storage import SQLiteStorage
+
+MakeResource = Callable[..., Resource]
+INTERMEDIATE = DifficultyLevel.INTERMEDIATE
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> Iterator[SQLiteStorage]:
+    """Create a SQLiteStorage backed by a temporary database file."""
+    with closing(SQLiteStorage(tmp_path / "sdl.db")) as storage:
+        yield storage
+
+
+class TestSQLiteStorage:
+    """Test cases for SQLiteStorage."""
+
+    def test_uses_wal_mode(self, storage: SQLiteStorage, tmp_path: Path) -> None:
+        """Test that file databases are opened in WAL mode."""
+        storage.close()
+
+        with closing(sqlite3.connect(tmp_path / "sdl.db")) as conn:
+            (mode,) = conn.execute("PRAGMA journal_mode").fetchone()
+
+        assert mode == "wal"
+
+    def test_resources_persist_across_managers(
+        self, storage: SQLiteStorage, sample_resources: list[Resource], tmp_path: Path
+    ) -> None:
+        """Test that resources added through a manager are reloaded from disk."""
+        manager = ResourceManager(storage)
+        for resource in sample_resources:
+            manager.add_resource(resource)
+        manager.remove_resource(sample_resources[1].url)
+        storage.close()
+
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as reloaded_storage:
+            reloaded = ResourceManager(reloaded_storage)
+
+        assert reloaded.get_all() == [sample_resources[0], sample_resources[2]]
+        assert reloaded.search_by_tag("pytorch") == [sample_resources[0]]
+
+    def test_bulk_changes_persist(
+        self, storage: SQLiteStorage, sample_resources: list[Resource], tmp_path: Path
+    ) -> None:
+        """Test that bulk adds, replacements and removals are written to disk."""
+        manager = ResourceManager(storage)
+        manager.add_resources(sample_resources)
+        renamed = replace(sample_resources[0], title="PyTorch Tutorial v2")
+        manager.add_resources([renamed], on_conflict="replace")
+        manager.remove_resources([sample_resources[1].url])
+        storage.close()
+
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as reloaded_storage:
+            reloaded = ResourceManager(reloaded_storage)
+
+        assert reloaded.get_all() == [sample_resources[2], renamed]
+
+    def test_failed_replace_leaves_manager_unchanged(
+        self,
+        storage: SQLiteStorage,
+        sample_resources: list[Resource],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a storage error during a replacing add changes neither side."""
+        manager = ResourceManager(storage)
+        manager.add_resources(sample_resources[:2])
+        renamed = replace(sample_resources[0], title="PyTorch Tutorial v2")
+        save_resource = storage.save_resource
+
+        def failing_save(resource: Resource) -> None:
+            if resource.url == sample_resources[2].url:
+                msg = "disk I/O error"
+                raise sqlite3.OperationalError(msg)
+            save_resource(resource)
+
+        monkeypatch.setattr(storage, "save_resource", failing_save)
+
+        with pytest.raises(sqlite3.OperationalError):
+            manager.add_resources([renamed, sample_resources[2]], on_conflict="replace")
+
+        assert manager.get_all() == sample_resources[:2]
+        assert manager.search("pytorch tutorial") == [sample_resources[0]]
+        assert list(storage.iter_resources()) == sample_resources[:2]
+
+    def test_canonical_duplicates_in_storage_load(
+        self, storage: SQLiteStorage, sample_resource: Resource
+    ) -> None:
+        """Test that rows sharing a canonical URL load as the first of them."""
+        storage.save_resource(sample_resource)
+        storage.save_resource(replace(sample_resource, url="https://EXAMPLE.com/test/"))
+
+        manager = ResourceManager(storage)
+
+        assert manager.get_all() == [sample_resource]
+        assert manager.search("test resource") == [sample_resource]
+
+    def test_save_duplicate_resource(
+        self, storage: SQLiteStorage, sample_resource: Resource
+    ) -> None:
+        """Test that storing a duplicate URL raises ValueError."""
+        storage.save_resource(sample_resource)
+
+        with pytest.raises(ValueError, match="already exists"):
+            storage.save_resource(sample_resource)
+
+        assert storage.count_resources() == 1
+
+    def test_iter_resources_by_category(
+        self, storage: SQLiteStorage, sample_resources: list[Resource]
+    ) -> None:
+        """Test filtering stored resources by category."""
+        for resource in sample_resources:
+            storage.save_resource(resource)
+
+        web = list(storage.iter_resources(ResourceCategory.WEB_DEV))
+
+        assert web == [sample_resources[1]]
+
+    def test_page_resources(self, storage: SQLiteStorage, sample_resources: list[Resource]) -> None:
+        """Test that keyset pages, offsets and limits tile the insertion order."""
+        for resource in sample_resources:
+            storage.save_resource(resource)
+
+        first = list(storage.page_resources(limit=2))
+        last_id, _resource = first[-1]
+        rest = list(storage.page_resources(after=last_id))
+
+        assert [r for _, r in first + rest] == sample_resources
+        assert [r for _, r in storage.page_resources(offset=1, limit=1)] == [sample_resources[1]]
+        assert list(storage.page_resources(ResourceCategory.WEB_DEV, after=last_id)) == []
+        with pytest.raises(ValueError, match="cannot be negative"):
+            list(storage.page_resources(limit=-1))
+
+    def test_transaction_rolls_back_on_error(
+        self, storage: SQLiteStorage, sample_resources: list[Resource]
+    ) -> None:
+        """Test that a failing transaction leaves no partial writes behind."""
+
+        def save_twice() -> None:
+            with storage.transaction():
+                storage.save_resource(sample_resources[0])
+                storage.save_resource(sample_resources[0])
+
+        with pytest.raises(ValueError, match="already exists"):
+            save_twice()
+
+        assert storage.count_resources() == 0
+
+    def test_search_matches_manager(
+        self, storage: SQLiteStorage, sample_resources: list[Resource]
+    ) -> None:
+        """Test that the full-text index finds what the manager finds, and forgets deletions."""
+        manager = ResourceManager(storage)
+        manager.add_resources(sample_resources)
+        manager.remove_resource("https://nextjs.org/learn")
+
+        for text in ("kube", "official tutorials", "DEEP-learn", "learn", "rust"):
+            expected = {resource.url for resource in manager.search(text)}
+            assert {resource.url for resource in storage.search_resources(text)} == expected
+        assert storage.search_resources("pytorch", limit=1) == [sample_resources[0]]
+        assert storage.search_resources("...") == []
+        with pytest.raises(ValueError, match="negative"):
+            storage.search_resources("pytorch", limit=-1)
+
+    def test_search_index_backfilled_for_older_databases(
+        self, tmp_path: Path, sample_resources: list[Resource]
+    ) -> None:
+        """Test that a database created before the full-text index gets it on open."""
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as storage:
+            ResourceManager(storage).add_resources(sample_resources)
+        with closing(sqlite3.connect(tmp_path / "sdl.db")) as conn:
+            conn.executescript(
+                "DROP TRIGGER resources_fts_insert; DROP TRIGGER resources_fts_delete; "
+                "DROP TABLE resources_fts;"
+            )
+
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as storage:
+            assert storage.search_resources("nextjs") == [sample_resources[1]]
+
+    def test_suggest_tags_matches_manager(
+        self, storage: SQLiteStorage, make_resource: MakeResource
+    ) -> None:
+        """Test that stored tag counts complete tags like the manager, and follow deletions."""
+        manager = ResourceManager(storage)
+        manager.add_resources(
+            [
+                make_resource("One", "Deep Learning", "devops"),
+                make_resource("Two", "deep-learning", "deepmind", "deepmind"),
+                make_resource("Three", "deep-learning", "Docker"),
+                make_resource("Four", "deep_learning", "C++"),
+            ]
+        )
+        manager.remove_resource("https://example.com/four")
+
+        assert storage.suggest_tags("c") == []
+        for prefix in ("", "DE", "deep ", "deep-l", "zzz"):
+            assert storage.suggest_tags(prefix) == manager.suggest_tags(prefix), prefix
+        assert storage.suggest_tags("d", limit=1) == ["deep-learning"]
+        with pytest.raises(ValueError, match="negative"):
+            storage.suggest_tags("d", limit=-1)
+
+    def test_tag_counts_backfilled_for_older_databases(
+        self, tmp_path: Path, sample_resources: list[Resource]
+    ) -> None:
+        """Test that a database created before tag counts existed gets them on open."""
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as storage:
+            ResourceManager(storage).add_resources(sample_resources)
+            expected = storage.suggest_tags("")
+        with closing(sqlite3.connect(tmp_path / "sdl.db")) as conn:
+            conn.execute("DROP TABLE tag_spellings")
+            conn.commit()
+
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as storage:
+            assert storage.suggest_tags("") == expected
+        assert len(expected) == 6
+
+    def test_recommend_next_matches_manager(
+        self, storage: SQLiteStorage, make_resource: MakeResource
+    ) -> None:
+        """Test that stored tag statistics suggest what the in-memory recommender does."""
+        manager = ResourceManager(storage)
+        manager.add_resources(
+            [
+                make_resource("Basics", "react", "JavaScript"),
+                make_resource("Nextjs", "Next.js", "React", "ssr", difficulty=INTERMEDIATE),
+                make_resource("Remix", "ssr", "remix", difficulty=INTERMEDIATE),
+                make_resource("Vue", "vue", "javascript", difficulty=INTERMEDIATE),
+                make_resource("Intro", "javascript"),
+                make_resource("Gone", "react", difficulty=INTERMEDIATE),
+            ]
+        )
+        manager.remove_resource("https://example.com/gone")
+        tracker = LearningTracker(storage)
+        tracker.start_learning("https://example.com/basics")
+        tracker.update_progress("https://example.com/basics", 100)
+        tracker.start_learning("https://example.com/vue")
+
+        expected = recommend_next(manager, tracker, limit=10)
+        assert storage.recommend_next(limit=10) == expected
+        assert [s.resource.title for s in expected] == ["Nextjs", "Intro", "Remix"]
+        with pytest.raises(ValueError, match="negative"):
+            storage.recommend_next(limit=-1)
+
+    def test_tag_statistics_backfilled_for_older_databases(
+        self, tmp_path: Path, make_resource: MakeResource
+    ) -> None:
+        """Test that a database created before the tag statistics gets them on open."""
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as storage:
+            ResourceManager(storage).add_resources(
+                [
+                    make_resource("Basics", "react"),
+                    make_resource("Nextjs", "react", "ssr", difficulty=INTERMEDIATE),
+                    make_resource("Remix", "ssr", difficulty=INTERMEDIATE),
+                ]
+            )
+            LearningTracker(storage).start_learning("https://example.com/basics")
+            LearningTracker(storage).update_progress("https://example.com/basics", 100)
+            expected = storage.recommend_next()
+        with closing(sqlite3.connect(tmp_path / "sdl.db")) as conn:
+            conn.executescript("DROP TABLE tag_pairs; DROP TABLE tag_counts;")
+
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as storage:
+            assert storage.recommend_next() == expected
+        assert [s.resource.title for s in expected] == ["Nextjs", "Remix"]
+
+    def test_progress_persists_across_trackers(
+        self, storage: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        """Test that progress, sessions and session completion are persisted."""
+        tracker = LearningTracker(storage)
+        session = tracker.start_learning("https://example.com/1")
+        session.complete(notes="done")
+        tracker.start_learning("https://example.com/1")
+        tracker.update_progress("https://example.com/1", 100)
+        storage.close()
+
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as reloaded_storage:
+            progress = LearningTracker(reloaded_storage).get_progress("https://example.com/1")
+
+        assert progress is not None
+        assert progress.status == ProgressStatus.COMPLETED
+        assert progress.completed_at is not None
+        assert len(progress.sessions) == 2
+        assert progress.sessions[0].notes == "done"
+        assert progress.sessions[0].end_time is not None
+        assert progress.sessions[1].end_time is None
+
+    def test_reloaded_open_session_completion_is_persisted(
+        self, storage: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        """Test that completing a session loaded from storage is written back."""
+        LearningTracker(storage).start_learning("https://example.com/1")
+        storage.close()
+
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as reloaded_storage:
+            progress = LearningTracker(reloaded_storage).get_progress("https://example.com/1")
+            assert progress is not None
+            progress.sessions[0].complete()
+
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as final_storage:
+            progress = LearningTracker(final_storage).get_progress("https://example.com/1")
+        assert progress is not None
+        assert progress.sessions[0].end_time is not None
+
+    def test_time_series_matches_tracker(
+        self, storage: SQLiteStorage, sample_resources: list[Resource]
+    ) -> None:
+        """Test that the stored rollups agree with the tracker's in-memory ones."""
+        ResourceManager(storage).add_resources(sample_resources)
+        for resource in sample_resources:
+            storage.save_progress(LearningProgress(resource.url, ProgressStatus.IN_PROGRESS))
+        day = datetime(2024, 5, 1)
+        for i, resource in enumerate(sample_resources * 2):
+            start = day + timedelta(hours=20 * i)
+            session = LearningSession(resource.url, start, start + timedelta(hours=5))
+            storage.save_session(i // len(sample_resources), session)
+        tracker = LearningTracker(storage)
+        since, until = day + timedelta(days=1), day + timedelta(days=4)
+        ai_ml = {r.url for r in sample_resources if r.category == ResourceCategory.AI_ML}
+
+        for granularity in Granularity:
+            assert storage.time_series(granularity, since, until) == tracker.time_series(
+                granularity, since, until
+            )
+            assert storage.time_series(
+                granularity, category=ResourceCategory.AI_ML
+            ) == tracker.time_series(granularity, resource_urls=ai_ml)
+
+    def test_rollups_follow_sessions_and_catalog(
+        self, storage: SQLiteStorage, sample_resource: Resource
+    ) -> None:
+        """Test that rollups track completions and resources entering or leaving a category."""
+        start = datetime(2024, 5, 1, 9)
+        session = LearningSession(sample_resource.url, start)
+        storage.save_session(0, session)
+        # Still open, so it runs until now.
+        assert storage.time_series("day", end=datetime(2024, 5, 2)) == [
+            (datetime(2024, 5, 1), timedelta(hours=15))
+        ]
+
+        session.end_time = start + timedelta(hours=2)
+        storage.save_session(0, session)
+        storage.save_session(0, session)
+        by_day = [(datetime(2024, 5, 1), timedelta(hours=2))]
+        assert storage.time_series("day") == by_day
+        assert storage.time_series("day", category=ResourceCategory.AI_ML) == []
+
+        storage.save_resource(sample_resource)
+        assert storage.time_series("day", category=ResourceCategory.AI_ML) == by_day
+
+        session.end_time = start + timedelta(hours=1)
+        storage.save_session(0, session)
+        assert storage.time_series("hour", category=ResourceCategory.AI_ML) == [
+            (start, timedelta(hours=1))
+        ]
+
+        storage.delete_resource(sample_resource.url)
+        assert storage.time_series("week", category=ResourceCategory.AI_ML) == []
+        assert storage.time_series("week") == [(datetime(2024, 4, 29), timedelta(hours=1))]
+
+    def test_time_series_counts_open_sessions(self, storage: SQLiteStorage) -> None:
+        """Test that open sessions count up to now without being rolled up."""
+        session = LearningTracker(storage).start_learning("https://example.com/1")
+        session.start_time -= timedelta(minutes=30)
+        storage.save_session(0, session)
+
+        ((bucket, spent),) = storage.time_series("week")
+
+        assert bucket == Granularity.WEEK.floor(datetime.now())
+        assert timedelta(minutes=30) <= spent < timedelta(minutes=31)
+
+    def test_rollups_backfilled_for_older_databases(
+        self, tmp_path: Path, sample_resources: list[Resource]
+    ) -> None:
+        """Test that a database created before rollups existed gets them on open."""
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as storage:
+            ResourceManager(storage).add_resources(sample_resources)
+            for i, resource in enumerate(sample_resources):
+                start = datetime(2024, 5, 1 + i, 10)
+                storage.save_session(
+                    0, LearningSession(resource.url, start, start.replace(hour=12))
+                )
+            expected = storage.time_series("day", category=ResourceCategory.WEB_DEV)
+        with closing(sqlite3.connect(tmp_path / "sdl.db")) as conn:
+            conn.execute("DROP TABLE session_rollups")
+            conn.commit()
+
+        with closing(SQLiteStorage(tmp_path / "sdl.db")) as storage:
+            assert storage.time_series("day", category=ResourceCategory.WEB_DEV) == expected
+        assert expected == [(datetime(2024, 5, 2), timedelta(hours=2))]
+
+    def test_progress_statistics_match_tracker(self, storage: SQLiteStorage) -> None:
+        """Test that SQL statistics agree with the in-memory tracker."""
+        tracker = LearningTracker(storage)
+        tracker.start_learning("https://example.com/1")
+        tracker.update_progress("https://example.com/1", 100)
+        tracker.start_learning("https://example.com/2")
+        tracker.update_progress("https://example.com/2", 50)
+        tracker.start_learning("https://example.com/3")
+
+        expected = tracker.get_statistics()
+        actual = storage.progress_statistics()
+
+        for key in ("total_resources", "completed", "in_progress", "average_completion"):
+            assert actual[key] == expected[key]
+        assert actual["total_hours_spent"] == pytest.approx(expected["total_hours_spent"], abs=1e-3)
+
+    def test_empty_statistics(self, storage: SQLiteStorage) -> None:
+        """Test statistics for an empty database."""
+        assert storage.progress_statistics() == {
+            "total_resources": 0,
+            "completed": 0,
+            "in_progress": 0,
+            "average_completion": 0,
+            "total_hours_spent": 0,
+        }
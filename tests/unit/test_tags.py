@@ -0,0 +1,83 @@
+"""Unit tests for the tag dictionary and fuzzy tag lookup."""
+
+from collections.abc import Callable
+
+import pytest
+
+from software_development_lessons.core import ResourceManager
+from software_development_lessons.core.resource_manager import Resource
+from software_development_lessons.core.tags import TagDictionary, normalize_tag
+
+MakeResource = Callable[..., Resource]
+
+
+@pytest.fixture
+def tagged(make_resource: MakeResource) -> ResourceManager:
+    """Create a ResourceManager whose resources spell tags inconsistently."""
+    manager = ResourceManager()
+    for resource in (
+        make_resource("K8S", "kubernetes", "devops"),
+        make_resource("Dl", "deep-learning", "pytorch"),
+        make_resource("Dl-Book", "Deep Learning"),
+        make_resource("Deepmind", "deepmind", "deep-learning"),
+    ):
+        manager.add_resource(resource)
+    return manager
+
+
+class TestTags:
+    """Test cases for TagDictionary, suggest_tags and fuzzy search_by_tag."""
+
+    def test_normalize_tag(self) -> None:
+        """Test that case and separator runs are folded."""
+        assert normalize_tag(" Deep__Learning ") == "deep-learning"
+        assert normalize_tag("C++") == "c"
+        assert normalize_tag("--") == ""
+
+    def test_suggest_tags(self, tagged: ResourceManager) -> None:
+        """Test completions, most used first, in their most used spelling."""
+        assert tagged.suggest_tags("de") == ["deep-learning", "deepmind", "devops"]
+        assert tagged.suggest_tags("Deep ") == ["deep-learning"]
+        assert tagged.suggest_tags("de", limit=1) == ["deep-learning"]
+        assert tagged.suggest_tags("rust") == []
+
+        with pytest.raises(ValueError, match="Limit cannot be negative"):
+            tagged.suggest_tags("de", limit=-1)
+
+    def test_fuzzy_search_by_tag(self, tagged: ResourceManager) -> None:
+        """Test that typos and other spellings match only when fuzzy."""
+        assert tagged.search_by_tag("kubernets") == []
+        assert [r.title for r in tagged.search_by_tag("kubernets", fuzzy=True)] == ["K8S"]
+        assert [r.title for r in tagged.search_by_tag("pytroch", fuzzy=True)] == ["Dl"]
+
+        titles = [r.title for r in tagged.search_by_tag("deep learning", fuzzy=True)]
+        assert titles == ["Dl", "Deepmind", "Dl-Book"]
+
+    def test_short_tags_need_exact_match(self) -> None:
+        """Test that very short tags do not tolerate typos."""
+        tags = TagDictionary()
+        tags.add("ai")
+        tags.add("go")
+
+        assert tags.lookup("AI") == ["ai"]
+        assert tags.lookup("ag") == []
+
+    def test_maintained_incrementally(self, tagged: ResourceManager) -> None:
+        """Test that tags disappear once no resource uses them."""
+        tagged.remove_resource("https://example.com/k8s")
+        tagged.remove_resource("https://example.com/dl")
+
+        assert tagged.suggest_tags("") == ["deep-learning", "deepmind"]
+        assert tagged.search_by_tag("kubernetes", fuzzy=True) == []
+        assert [r.title for r in tagged.search_by_tag("deep-learning", fuzzy=True)] == [
+            "Deepmind",
+            "Dl-Book",
+        ]
+
+    def test_duplicate_tag_on_one_resource(self, make_resource: MakeResource) -> None:
+        """Test that a tag repeated on a resource is counted once."""
+        manager = ResourceManager()
+        manager.add_resource(make_resource("Twice", "rust", "rust"))
+        manager.remove_resource("https://example.com/twice")
+
+        assert manager.suggest_tags("r") == []
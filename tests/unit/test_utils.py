@@ -1,10 +1,26 @@
 """Unit tests for utility functions."""
 
 from datetime import timedelta
+from urllib.parse import urlparse
 
 import pytest
 
-from software_development_lessons.utils import format_duration, validate_url
+from software_development_lessons.utils import (
+    canonicalize_url,
+    canonicalize_urls,
+    format_duration,
+    validate_url,
+    validate_urls,
+)
+
+
+def _baseline_validate_url(url: str) -> bool:
+    """The original urlparse-based URL check."""
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return False
+    return bool(parsed.scheme in ("http", "https") and parsed.netloc)
 
 
 class TestValidateUrl:
@@ -21,12 +37,75 @@ class TestValidateUrl:
             ("ftp://example.com", False),
             ("", False),
             ("javascript:alert(1)", False),
+            ("https://ex.com/a b", True),
+            ("  https://ex.com", True),
+            ("https://[::1]:8080/", True),
+            ("https://[::1/", False),
         ],
     )
     def test_validate_url(self, url: str, expected: bool) -> None:
         """Test URL validation with various inputs."""
         assert validate_url(url) == expected
 
+    def test_validate_urls_matches_validate_url(self) -> None:
+        """Test that batch validation agrees with single-URL validation."""
+        urls = ["https://example.com", "not-a-url", "HTTP://EXAMPLE.COM", "https://", None, 42]
+
+        assert list(validate_urls(urls)) == [validate_url(url) for url in urls]
+
+    def test_accepts_what_the_baseline_accepted(self) -> None:
+        """Test that validation agrees with the urlparse-based check it replaced."""
+        urls = [
+            "https://ex.com/a b",
+            "https://ex com/",
+            "https://ex.com/a?q=1 2#frag ment",
+            "\thttps://ex.com/\npath",
+            "https://@/",
+            "https://user:pw@ex.com:99999",
+            "https://exa\uff0fmple.com/",
+            "https:///path",
+            "https:ex.com",
+            "http//ex.com",
+        ]
+
+        for url in urls:
+            assert validate_url(url) == _baseline_validate_url(url), url
+
+
+class TestCanonicalizeUrl:
+    """Test cases for URL canonicalization."""
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://Example.com/x/", "https://example.com/x"),
+            ("https://example.com", "https://example.com/"),
+            ("HTTP://example.com:80/a", "http://example.com/a"),
+            ("https://example.com:8443/a", "https://example.com:8443/a"),
+            ("https://example.com/a?b=C#section", "https://example.com/a?b=C"),
+            ("https://User@Example.COM/Path/", "https://User@example.com/Path"),
+            (" https://Example.com/a b/", "https://example.com/a b"),
+        ],
+    )
+    def test_canonicalize_url(self, url: str, expected: str) -> None:
+        """Test that equivalent spellings map to one canonical form."""
+        assert canonicalize_url(url) == expected
+
+    def test_canonicalize_invalid_url(self) -> None:
+        """Test that invalid URLs raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid URL"):
+            canonicalize_url("not-a-url")
+
+    def test_canonicalize_urls(self) -> None:
+        """Test that batch canonicalization yields None for invalid URLs."""
+        urls = ["https://Example.com/x/", "ftp://example.com", "https://example.com/x"]
+
+        assert list(canonicalize_urls(urls)) == [
+            "https://example.com/x",
+            None,
+            "https://example.com/x",
+        ]
+
 
 class TestFormatDuration:
     """Test cases for format_duration function."""